@@ -1,3 +1,4 @@
+import logging
 import os
 from flask import Flask
 from flask_login import LoginManager
@@ -28,6 +29,9 @@ def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
 
+    # Configure root logging once per process (no-op if already configured)
+    logging.basicConfig(level=logging.INFO)
+
     # Trust proxy headers (Fly.io / reverse proxy) so url_for generates https:// URLs
     from werkzeug.middleware.proxy_fix import ProxyFix
     app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
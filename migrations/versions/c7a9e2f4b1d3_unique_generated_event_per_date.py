@@ -0,0 +1,46 @@
+"""Unique AI-generated historical event per date
+
+Revision ID: c7a9e2f4b1d3
+Revises: b3f1c6d2a8e4
+Create Date: 2026-10-16 11:02:47.918355
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c7a9e2f4b1d3"
+down_revision = "b3f1c6d2a8e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep the oldest AI-generated event per date before enforcing uniqueness
+    op.execute(
+        """
+        DELETE FROM historical_events
+        WHERE is_generated
+          AND id NOT IN (
+              SELECT MIN(id) FROM historical_events
+              WHERE is_generated
+              GROUP BY event_month, event_day
+          )
+        """
+    )
+
+    with op.batch_alter_table("historical_events", schema=None) as batch_op:
+        batch_op.create_index(
+            "uq_historical_events_generated_date",
+            ["event_month", "event_day"],
+            unique=True,
+            sqlite_where=sa.text("is_generated"),
+            postgresql_where=sa.text("is_generated"),
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("historical_events", schema=None) as batch_op:
+        batch_op.drop_index("uq_historical_events_generated_date")
@@ -376,6 +376,15 @@ class HistoricalEvent(db.Model):
     __table_args__ = (
         db.UniqueConstraint("event_month", "event_day", "year", name="unique_event_per_date"),
         db.Index("idx_historical_events_month_day", "event_month", "event_day"),
+        # At most one AI-generated event per date; curated events are unrestricted
+        db.Index(
+            "uq_historical_events_generated_date",
+            "event_month",
+            "event_day",
+            unique=True,
+            sqlite_where=db.text("is_generated"),
+            postgresql_where=db.text("is_generated"),
+        ),
         db.Index("idx_historical_events_year", "year"),
         db.Index("idx_historical_events_category", "category"),
     )
@@ -470,6 +479,22 @@ class HistoricalEvent(db.Model):
             .first()
         )
 
+    @staticmethod
+    def get_events_by_date():
+        """Get one event per (month, day) in a single query, preferring curated over AI-generated"""
+        events = {}
+        for event in HistoricalEvent.query.order_by(HistoricalEvent.is_generated.asc()):
+            events.setdefault((event.event_month, event.event_day), event)
+        return events
+
+    @staticmethod
+    def get_event_dates():
+        """Get the set of (month, day) pairs that have at least one event"""
+        rows = db.session.execute(
+            db.select(HistoricalEvent.event_month, HistoricalEvent.event_day).distinct()
+        ).all()
+        return {(row.event_month, row.event_day) for row in rows}
+
     @staticmethod
     def get_all_events_for_date(month, day):
         """Get all historical events for specific month/day"""
@@ -540,6 +565,56 @@ class HistoricalEvent(db.Model):
         }
 
 
+class GenerationJob(db.Model):
+    """Asynchronous LLM batch job for bulk historical event generation"""
+
+    __tablename__ = "generation_jobs"
+    __table_args__ = (db.Index("idx_generation_jobs_status", "status"),)
+
+    # Primary key
+    id = db.Column(db.Integer, primary_key=True)
+
+    # Provider batch tracking
+    provider = db.Column(db.String(50), nullable=False)  # ProviderManager key, e.g. "anthropic"
+    batch_id = db.Column(db.String(100), nullable=False, unique=True)
+
+    # Dates still waiting for results, as "MM-DD" strings
+    pending_dates = db.Column(db.JSON, nullable=False, default=list)
+
+    # Job state: pending -> completed / failed
+    status = db.Column(db.String(20), default="pending", nullable=False)
+    events_created = db.Column(db.Integer, default=0)
+
+    # Timestamps
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    completed_at = db.Column(db.DateTime)
+
+    def __repr__(self):
+        return f"<GenerationJob {self.batch_id}: {self.status}>"
+
+    @staticmethod
+    def get_pending_jobs():
+        """Get jobs still waiting for provider results, oldest first"""
+        return (
+            GenerationJob.query.filter_by(status="pending")
+            .order_by(GenerationJob.created_at.asc())
+            .all()
+        )
+
+    def to_dict(self):
+        """Convert job to dictionary for JSON serialization"""
+        return {
+            "id": self.id,
+            "provider": self.provider,
+            "batch_id": self.batch_id,
+            "pending_dates": self.pending_dates,
+            "status": self.status,
+            "events_created": self.events_created,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        }
+
+
 class NewsCategory(Enum):
     """News item category enumeration"""
 
@@ -785,3 +860,49 @@ class DailyNews(db.Model):
             "fetch_source": self.fetch_source,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
+
+
+class FeedCache(db.Model):
+    """Last parsed result and HTTP validators per RSS feed or scraped page, shared across workers"""
+
+    __tablename__ = "feed_cache"
+
+    # Primary key
+    id = db.Column(db.Integer, primary_key=True)
+
+    # Feed or page URL (one row per URL)
+    url = db.Column(db.String(500), nullable=False, unique=True)
+
+    # Parsed articles from the last successful fetch (JSON array)
+    articles = db.Column(db.JSON, nullable=False, default=list)
+
+    # HTTP validators for conditional requests (ETag / Last-Modified headers)
+    etag = db.Column(db.String(255))
+    modified = db.Column(db.String(64))
+
+    # When the feed was last fetched or revalidated
+    fetched_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<FeedCache {self.url}: {len(self.articles or [])} articles>"
+
+    @staticmethod
+    def get_for_url(url):
+        """Get the cached feed for a URL, returns None if not found"""
+        return FeedCache.query.filter_by(url=url).first()
+
+    @staticmethod
+    def store(url, articles, etag=None, modified=None):
+        """Save a feed's articles and validators, marking it fetched now"""
+        feed_cache = FeedCache.get_for_url(url)
+        if not feed_cache:
+            feed_cache = FeedCache(url=url)
+            db.session.add(feed_cache)
+
+        feed_cache.articles = articles
+        feed_cache.etag = etag
+        feed_cache.modified = modified
+        feed_cache.fetched_at = datetime.utcnow()
+
+        db.session.commit()
+        return feed_cache
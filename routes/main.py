@@ -1,7 +1,9 @@
+import json
 import threading
 
 from flask import (
     Blueprint,
+    Response,
     render_template,
     current_app,
     request,
@@ -9,6 +11,7 @@ from flask import (
     redirect,
     url_for,
     jsonify,
+    stream_with_context,
 )
 from flask_login import current_user, login_required
 
@@ -521,6 +524,50 @@ def regenerate_today_event():
         )
 
 
+@bp.route("/admin/regenerate-today-event/stream", methods=["POST"])
+@login_required
+def regenerate_today_event_stream():
+    """Regenerate today's historical event, streaming LLM output as SSE - admin only"""
+    if not current_user.is_admin():
+        return jsonify({"error": "Dostop zavrnjen. Potrebne so administratorske pravice."}), 403
+
+    from models.content import HistoricalEvent
+    from utils.content_generation import HistoricalEventService
+    from datetime import datetime
+
+    now = datetime.now()
+    existing_event = HistoricalEvent.get_event_for_date(now.month, now.day)
+    admin_email = current_user.email
+
+    def generate():
+        try:
+            service = HistoricalEventService()
+            if existing_event:
+                messages = service.regenerate_event_stream(existing_event.id)
+            else:
+                # Nothing to stream into yet - generate the new event in one go
+                new_event = service.generate_daily_event()
+                messages = [{"type": "done", "updated": True, "event": new_event.to_dict()}]
+
+            for message in messages:
+                if message["type"] == "done":
+                    current_app.logger.info(
+                        f"Admin {admin_email} regenerated event: {message['event']['title']}"
+                    )
+                yield f"event: {message['type']}\ndata: {json.dumps(message, ensure_ascii=False)}\n\n"
+
+        except Exception as e:
+            current_app.logger.error(f"Error streaming historical event regeneration: {e}")
+            error = {"type": "error", "error": "Napaka pri regeneraciji dogodka. Poskusite ponovno."}
+            yield f"event: error\ndata: {json.dumps(error, ensure_ascii=False)}\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @bp.route("/admin/refresh-news", methods=["POST"])
 @login_required
 def refresh_news():
@@ -541,7 +588,7 @@ def refresh_news():
             existing_news.articles_count = 0
 
         # Fetch fresh news using improved RSS parser
-        fresh_articles = fetch_and_cache_news()
+        fresh_articles = fetch_and_cache_news(force=True)
 
         current_app.logger.info(
             f"Admin {current_user.email} refreshed news: {len(fresh_articles)} articles"
@@ -578,7 +625,7 @@ def test_email():
             flash("Email ni konfiguriran. Preverite MAIL_SERVER, MAIL_USERNAME in MAIL_PASSWORD v nastavitvah.", "warning")
             return redirect(url_for("main.admin"))
 
-        thread = send_email(
+        future = send_email(
             subject="PD Triglav - Testno sporočilo",
             recipient=current_user.email,
             template_html="emails/test_email.html",
@@ -586,7 +633,7 @@ def test_email():
             user=current_user,
         )
 
-        if thread:
+        if future:
             flash(f"Testno sporočilo poslano na {current_user.email}. Preverite nabiralnik.", "success")
         else:
             flash("Email ni bil poslan. Preverite konfiguracijo.", "warning")
@@ -376,6 +376,44 @@ def mock_invalid_file():
     return create_invalid_file()
 
 
+@pytest.fixture(autouse=True)
+def reset_process_caches():
+    """Drop process-level caches so each test builds (or mocks) its own"""
+    from utils.daily_news import (
+        clear_feed_cache,
+        clear_homepage_news_cache,
+        clear_newsapi_cache,
+        reset_source_failures,
+    )
+    from utils.hero_utils import _hero_listing_cache, _select_hero_image
+    from utils.llm_service import get_llm_service
+
+    get_llm_service.cache_clear()
+    clear_feed_cache()
+    clear_homepage_news_cache()
+    clear_newsapi_cache()
+    reset_source_failures()
+    _hero_listing_cache.clear()
+    _select_hero_image.cache_clear()
+    yield
+    get_llm_service.cache_clear()
+    clear_feed_cache()
+    clear_homepage_news_cache()
+    reset_source_failures()
+    _hero_listing_cache.clear()
+    _select_hero_image.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_news_fetch_lock(monkeypatch, tmp_path):
+    """Give each test its own news refresh lock file
+
+    Background news fetches run in daemon threads, so a lock left behind by
+    an interrupted run would otherwise block fetches in later runs.
+    """
+    monkeypatch.setattr("utils.daily_news.NEWS_FETCH_LOCK_PATH", str(tmp_path / "news_fetch.lock"))
+
+
 @pytest.fixture(autouse=True)
 def auto_mock_external_services(monkeypatch, request):
     """Automatically mock external services for fast tests"""
@@ -135,7 +135,7 @@ class MockLLMService:
         self.provider_manager = MockProviderManager()
         self._generated_events = []
 
-    def generate_historical_event(self, date: str = None, target_date: Optional[datetime] = None) -> Dict:
+    def generate_historical_event(self, date: str = None, fast: bool = False, target_date: Optional[datetime] = None) -> Dict:
         """Generate mock historical event"""
         event_data = {
             "year": 1953 + len(self._generated_events),
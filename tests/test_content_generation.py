@@ -12,7 +12,7 @@ from utils.content_generation import (
     run_daily_content_generation,
     get_content_stats,
 )
-from models.content import HistoricalEvent, EventCategory
+from models.content import HistoricalEvent, EventCategory, GenerationJob
 from models.user import db
 from utils.llm_service import LLMError
 
@@ -81,8 +81,10 @@ class TestHistoricalEventService:
 
             with patch.object(
                 event_service.llm_service, "generate_historical_event"
-            ) as mock_generate:
-                # Both primary and retry return low confidence
+            ) as mock_generate, patch.object(
+                event_service.llm_service, "has_fast_model", return_value=True
+            ):
+                # Fast model, full model and fallback providers all return low confidence
                 mock_generate.return_value = low_confidence_response
 
                 with patch("utils.content_generation.datetime") as mock_datetime:
@@ -96,8 +98,31 @@ class TestHistoricalEventService:
             assert result.event_month == 3
             assert result.event_day == 15
 
-            # Retry should have been attempted (called twice: first + skip_first)
-            assert mock_generate.call_count == 2
+            # Fast model, then the full model, then the next providers
+            assert [c.kwargs for c in mock_generate.call_args_list] == [
+                {"fast": True}, {}, {"skip_first": True}
+            ]
+
+    def test_generate_daily_event_low_confidence_without_fast_tier_skips_provider(
+        self, app, event_service, mock_llm_response
+    ):
+        """Test the retry goes to the next provider when the first has no fast model"""
+        with app.app_context():
+            with patch.object(
+                event_service.llm_service, "generate_historical_event"
+            ) as mock_generate, patch.object(
+                event_service.llm_service, "has_fast_model", return_value=False
+            ):
+                mock_generate.side_effect = [dict(mock_llm_response, confidence="low"), mock_llm_response]
+
+                with patch("utils.content_generation.datetime") as mock_datetime:
+                    mock_datetime.now.return_value = datetime(2024, 3, 16)
+
+                    event = event_service.generate_daily_event()
+
+            assert [c.kwargs for c in mock_generate.call_args_list] == [{"fast": True}, {"skip_first": True}]
+            assert event.is_generated is True
+            assert event.title == mock_llm_response["title"]
 
     def test_generate_daily_event_medium_confidence_saved(self, app, event_service, mock_llm_response):
         """Test that medium-confidence events ARE saved"""
@@ -244,6 +269,88 @@ class TestHistoricalEventService:
             # Should return unchanged event
             assert result.title == "Original Title"
 
+    def test_regenerate_event_stream_success(self, app, event_service, mock_llm_response):
+        """Test streaming regeneration yields tokens then commits the event"""
+        import json
+
+        with app.app_context():
+            existing_event = HistoricalEvent(
+                event_month=7, event_day=27, year=1953,
+                title="Old Event",
+                description="Old description",
+                category=EventCategory.ACHIEVEMENT,
+            )
+            db.session.add(existing_event)
+            db.session.commit()
+            event_id = existing_event.id
+
+            payload = json.dumps(mock_llm_response)
+            chunks = [payload[:20], payload[20:]]
+
+            with patch.object(
+                event_service.llm_service, "generate_historical_event_stream"
+            ) as mock_stream:
+                mock_stream.return_value = iter(chunks)
+
+                messages = list(event_service.regenerate_event_stream(event_id))
+
+            assert [m["text"] for m in messages if m["type"] == "token"] == chunks
+            assert messages[-1]["type"] == "done"
+            assert messages[-1]["event"]["title"] == "Test Mountain First Ascent"
+
+            saved = db.session.get(HistoricalEvent, event_id)
+            assert saved.title == "Test Mountain First Ascent"
+            assert saved.is_generated is True
+
+    def test_regenerate_event_stream_invalid_json_unchanged(self, app, event_service):
+        """Test that a broken stream leaves the event untouched"""
+        with app.app_context():
+            existing_event = HistoricalEvent(
+                event_month=7, event_day=27, year=1953,
+                title="Original Title",
+                description="Original description",
+                category=EventCategory.ACHIEVEMENT,
+            )
+            db.session.add(existing_event)
+            db.session.commit()
+            event_id = existing_event.id
+
+            with patch.object(
+                event_service.llm_service, "generate_historical_event_stream"
+            ) as mock_stream:
+                mock_stream.return_value = iter(['{"year": 19'])
+
+                messages = list(event_service.regenerate_event_stream(event_id))
+
+            assert messages[-1]["type"] == "error"
+            assert db.session.get(HistoricalEvent, event_id).title == "Original Title"
+
+    def test_regenerate_event_stream_incomplete_event_unchanged(self, app, event_service):
+        """Test that a stream missing required fields does not store fallback content"""
+        with app.app_context():
+            existing_event = HistoricalEvent(
+                event_month=7, event_day=28, year=1953,
+                title="Original Title",
+                description="Original description",
+                category=EventCategory.ACHIEVEMENT,
+            )
+            db.session.add(existing_event)
+            db.session.commit()
+            event_id = existing_event.id
+
+            with patch.object(
+                event_service.llm_service, "generate_historical_event_stream"
+            ) as mock_stream:
+                mock_stream.return_value = iter(['{"year": 1965, ', '"title": "Half an event"}'])
+
+                messages = list(event_service.regenerate_event_stream(event_id))
+
+            assert messages[-1]["type"] == "error"
+            assert "Missing required field" in messages[-1]["error"]
+            saved = db.session.get(HistoricalEvent, event_id)
+            assert saved.title == "Original Title"
+            assert saved.year == 1953
+
     def test_regenerate_event_not_found(self, app, event_service):
         """Test regeneration of non-existent event"""
         with app.app_context():
@@ -271,6 +378,32 @@ class TestHistoricalEventService:
 
             assert result.id == existing_event.id
 
+    def test_get_or_create_todays_event_uses_id_cache(self, app, event_service):
+        """Test repeated lookups resolve through the event id cache"""
+        from utils import content_generation
+
+        with app.app_context():
+            existing_event = HistoricalEvent(
+                event_month=7, event_day=27, year=1953,
+                title="Cached Event",
+                description="Already exists",
+                category=EventCategory.ACHIEVEMENT,
+            )
+            db.session.add(existing_event)
+            db.session.commit()
+            content_generation.invalidate_event_cache(7, 27)
+
+            with patch("utils.content_generation.datetime") as mock_datetime:
+                mock_datetime.now.return_value = datetime(2024, 7, 27)
+
+                first = event_service.get_or_create_todays_event()
+                with patch.object(HistoricalEvent, "get_event_for_date") as mock_lookup:
+                    second = event_service.get_or_create_todays_event()
+
+            assert first.id == second.id == existing_event.id
+            mock_lookup.assert_not_called()
+            content_generation.invalidate_event_cache(7, 27)
+
     def test_get_or_create_todays_event_create_new(self, app, event_service, mock_llm_response):
         """Test creating new today's event when none exists"""
         with app.app_context():
@@ -282,20 +415,242 @@ class TestHistoricalEventService:
 
             assert result == mock_event
 
-    def test_bulk_generate_events(self, app, event_service):
+    def test_bulk_generate_events(self, app, event_service, mock_llm_response, tmp_path):
         """Test bulk event generation for date range"""
         with app.app_context():
             start_date = date(2024, 7, 25)
             end_date = date(2024, 7, 27)
 
-            with patch.object(event_service, "generate_daily_event") as mock_generate:
-                mock_events = [Mock(), Mock(), Mock()]
-                mock_generate.side_effect = mock_events
+            with patch.object(
+                event_service.llm_service, "generate_historical_event"
+            ) as mock_generate:
+                mock_generate.return_value = mock_llm_response
 
-                results = event_service.bulk_generate_events(start_date, end_date)
+                results = event_service.bulk_generate_events(
+                    start_date, end_date, checkpoint_path=str(tmp_path / "backfill.jsonl")
+                )
 
             assert len(results) == 3
             assert mock_generate.call_count == 3
+            assert [(e.event_month, e.event_day) for e in results] == [(7, 25), (7, 26), (7, 27)]
+            requested = sorted(c.kwargs["target_date"] for c in mock_generate.call_args_list)
+            assert requested == [date(2024, 7, 25), date(2024, 7, 26), date(2024, 7, 27)]
+            assert HistoricalEvent.query.count() == 3
+
+    def test_bulk_generate_events_skips_failures(self, app, event_service, mock_llm_response, tmp_path):
+        """Test that failed and low-confidence dates are skipped, not faked"""
+        with app.app_context():
+            def generate(fast=False, target_date=None):
+                if target_date.day == 25:
+                    raise LLMError("Provider down")
+                if target_date.day == 26:
+                    return dict(mock_llm_response, confidence="low")
+                return dict(mock_llm_response)
+
+            with patch.object(
+                event_service.llm_service, "generate_historical_event", side_effect=generate
+            ):
+                results = event_service.bulk_generate_events(
+                    date(2024, 7, 25), date(2024, 7, 27),
+                    checkpoint_path=str(tmp_path / "backfill.jsonl"),
+                )
+
+            assert [(e.event_month, e.event_day) for e in results] == [(7, 27)]
+            assert HistoricalEvent.query.count() == 1
+
+    def test_bulk_generate_events_skips_provider_fallback_content(
+        self, app, event_service, mock_llm_response, tmp_path
+    ):
+        """Test that fallback content from failed providers is neither saved nor checkpointed"""
+        from utils.llm_providers import LLMError as ProviderError, ProviderManager
+
+        checkpoint_path = tmp_path / "backfill.jsonl"
+        with app.app_context():
+            with patch("utils.llm_providers.AnthropicProvider") as mock_anthropic, \
+                 patch("utils.llm_providers.MoonshotProvider") as mock_moonshot, \
+                 patch("utils.llm_providers.DeepSeekProvider") as mock_deepseek:
+                # Every provider fails, so the manager returns provider fallback content
+                for mock_provider in [mock_anthropic, mock_moonshot, mock_deepseek]:
+                    instance = Mock(is_configured=True)
+                    instance.chat_completion.side_effect = ProviderError("Provider down")
+                    instance.get_fallback_content.return_value = dict(
+                        mock_llm_response, title="First Ascent of Mount Everest", confidence="high"
+                    )
+                    mock_provider.return_value = instance
+                event_service.llm_service.provider_manager = ProviderManager()
+
+            # Keep the checkpoint file to inspect it
+            with patch("utils.content_generation.os.remove"):
+                results = event_service.bulk_generate_events(
+                    date(2024, 7, 25), date(2024, 7, 26), checkpoint_path=str(checkpoint_path)
+                )
+
+            assert results == []
+            assert HistoricalEvent.query.count() == 0
+            assert checkpoint_path.read_text() == ""
+
+    def test_bulk_generate_events_resumes_from_checkpoint(
+        self, app, event_service, mock_llm_response, tmp_path
+    ):
+        """Test that checkpointed dates are not sent to the LLM again"""
+        import json
+
+        checkpoint_path = tmp_path / "backfill.jsonl"
+        checkpointed = dict(mock_llm_response, title="Checkpointed Event")
+        checkpoint_path.write_text(
+            json.dumps({"month": 7, "day": 25, "event": checkpointed, "ts": "2024-07-01T00:00:00"})
+            + "\n" + '{"month": 7, "da'  # truncated line from a crash
+        )
+
+        with app.app_context():
+            with patch.object(
+                event_service.llm_service, "generate_historical_event"
+            ) as mock_generate:
+                mock_generate.return_value = mock_llm_response
+
+                results = event_service.bulk_generate_events(
+                    date(2024, 7, 25), date(2024, 7, 26), checkpoint_path=str(checkpoint_path)
+                )
+
+            assert mock_generate.call_count == 1
+            assert mock_generate.call_args.kwargs["target_date"] == date(2024, 7, 26)
+            assert results[0].title == "Checkpointed Event"
+            assert not checkpoint_path.exists()
+
+
+class TestBatchGeneration:
+    """Test batch API bulk generation"""
+
+    @pytest.fixture
+    def event_service(self, app):
+        with app.app_context():
+            return HistoricalEventService()
+
+    def test_submit_bulk_generation_skips_existing_dates(self, app, event_service):
+        with app.app_context():
+            db.session.add(
+                HistoricalEvent(
+                    event_month=7, event_day=26, year=1953,
+                    title="Existing", description="Exists",
+                    category=EventCategory.ACHIEVEMENT,
+                )
+            )
+            db.session.commit()
+
+            with patch.object(
+                event_service.llm_service, "submit_historical_batch"
+            ) as mock_submit:
+                mock_submit.return_value = ("anthropic", "msgbatch_123")
+                job = event_service.submit_bulk_generation(date(2024, 7, 25), date(2024, 7, 27))
+
+            submitted_dates = mock_submit.call_args.args[0]
+            assert submitted_dates == [date(2024, 7, 25), date(2024, 7, 27)]
+            assert job.batch_id == "msgbatch_123"
+            assert job.pending_dates == ["07-25", "07-27"]
+            assert job.status == "pending"
+
+    def test_process_generation_job_stores_results(self, app, event_service):
+        with app.app_context():
+            job = GenerationJob(
+                provider="anthropic", batch_id="msgbatch_456",
+                pending_dates=["07-25", "07-27"], status="pending",
+            )
+            db.session.add(job)
+            db.session.commit()
+
+            result = {
+                "year": 1953, "title": "Batch Event", "description": "From batch",
+                "location": "Alps", "people": ["Climber"], "category": "first_ascent",
+                "confidence": "high",
+            }
+            with patch.object(
+                event_service.llm_service, "get_historical_batch_results"
+            ) as mock_results:
+                mock_results.return_value = {"07-25": result, "07-27": dict(result, confidence="low")}
+                created = event_service.process_pending_generation_jobs()
+
+            assert created == 1
+            assert job.status == "completed"
+            assert job.events_created == 1
+            assert HistoricalEvent.get_event_for_date(7, 25).title == "Batch Event"
+            assert HistoricalEvent.get_event_for_date(7, 27) is None
+
+    def test_process_generation_job_skips_dates_filled_meanwhile(self, app, event_service):
+        with app.app_context():
+            job = GenerationJob(
+                provider="anthropic", batch_id="msgbatch_321",
+                pending_dates=["07-25", "07-26"], status="pending",
+            )
+            db.session.add(job)
+            # Curated event added while the batch was running
+            db.session.add(
+                HistoricalEvent(
+                    event_month=7, event_day=25, year=1953,
+                    title="Curated", description="Curated by an admin",
+                    category=EventCategory.ACHIEVEMENT, is_generated=False,
+                )
+            )
+            db.session.commit()
+
+            result = {
+                "year": 1953, "title": "Batch Event", "description": "From batch",
+                "location": "Alps", "people": ["Climber"], "category": "first_ascent",
+                "confidence": "high",
+            }
+            with patch.object(
+                event_service.llm_service, "get_historical_batch_results"
+            ) as mock_results:
+                mock_results.return_value = {"07-25": dict(result), "07-26": dict(result)}
+                created = event_service.process_generation_job(job)
+
+            assert created == 1
+            assert job.status == "completed"
+            assert [e.title for e in HistoricalEvent.get_all_events_for_date(7, 25)] == ["Curated"]
+            assert HistoricalEvent.get_event_for_date(7, 26).title == "Batch Event"
+
+    def test_process_generation_job_marked_failed_on_insert_error(self, app, event_service):
+        with app.app_context():
+            job = GenerationJob(
+                provider="anthropic", batch_id="msgbatch_654",
+                pending_dates=["07-25"], status="pending",
+            )
+            db.session.add(job)
+            db.session.commit()
+
+            result = {
+                "year": 1953, "title": "Batch Event", "description": "From batch",
+                "location": "Alps", "people": ["Climber"], "category": "first_ascent",
+                "confidence": "high",
+            }
+            with patch.object(
+                event_service.llm_service, "get_historical_batch_results"
+            ) as mock_results, patch.object(
+                event_service, "_insert_events", side_effect=RuntimeError("constraint")
+            ):
+                mock_results.return_value = {"07-25": result}
+                created = event_service.process_generation_job(job)
+
+            assert created == 0
+            assert job.status == "failed"
+            assert GenerationJob.get_pending_jobs() == []
+
+    def test_process_generation_job_still_running(self, app, event_service):
+        with app.app_context():
+            job = GenerationJob(
+                provider="anthropic", batch_id="msgbatch_789",
+                pending_dates=["07-25"], status="pending",
+            )
+            db.session.add(job)
+            db.session.commit()
+
+            with patch.object(
+                event_service.llm_service, "get_historical_batch_results"
+            ) as mock_results:
+                mock_results.return_value = None
+                created = event_service.process_generation_job(job)
+
+            assert created == 0
+            assert job.status == "pending"
 
 
 class TestNewsService:
@@ -448,3 +803,47 @@ class TestProviderPriority:
 
                 # Moonshot should be called first for news
                 manager.providers["moonshot"].chat_completion.assert_called_once()
+
+    def test_retry_skips_configured_providers(self, app):
+        """Test skip_providers counts configured providers and fast tiers are detected"""
+        with app.app_context():
+            from utils.llm_providers import ProviderManager
+            with patch("utils.llm_providers.AnthropicProvider") as mock_anthropic, \
+                 patch("utils.llm_providers.MoonshotProvider") as mock_moonshot, \
+                 patch("utils.llm_providers.DeepSeekProvider") as mock_deepseek:
+
+                mock_anthropic.return_value = Mock(is_configured=False)
+                for mock_provider in [mock_moonshot, mock_deepseek]:
+                    mock_provider.return_value = Mock(is_configured=True, fast_model=None)
+
+                manager = ProviderManager()
+
+                assert manager._get_provider_order("historical", skip_providers=1) == ["deepseek"]
+                assert manager.primary_has_fast_model("historical") is False
+
+    def test_fast_model_selection(self, app):
+        """Test that fast=True picks the cheaper model only where one exists"""
+        with app.app_context():
+            from utils.llm_providers import AnthropicProvider, DeepSeekProvider
+
+            anthropic_provider = AnthropicProvider()
+            assert anthropic_provider._select_model(fast=True) == "claude-haiku-4-5"
+            assert anthropic_provider._select_model() == "claude-sonnet-4-6"
+
+            deepseek = DeepSeekProvider()
+            assert deepseek._select_model(fast=True) == "deepseek-chat"
+
+    def test_provider_clients_reused_across_calls(self, app):
+        """Test each provider builds its HTTP client once and reuses its connection pool"""
+        with app.app_context():
+            from utils.llm_providers import AnthropicProvider, DeepSeekProvider, MoonshotProvider
+
+            anthropic_provider = AnthropicProvider()
+            anthropic_provider.api_key = "test-key"
+            moonshot = MoonshotProvider()
+            moonshot.api_key = "test-key"
+            deepseek = DeepSeekProvider()
+
+            assert anthropic_provider._get_client() is anthropic_provider._get_client()
+            assert moonshot._get_client() is moonshot._get_client()
+            assert deepseek._get_session() is deepseek._get_session()
@@ -148,6 +148,7 @@ class TestHistoricalEventModel:
                 title="First Event",
                 description="First event description.",
                 category=EventCategory.FIRST_ASCENT,
+                is_generated=False,
             )
             db.session.add(event1)
             db.session.commit()
@@ -158,6 +159,7 @@ class TestHistoricalEventModel:
                 title="Duplicate Event",
                 description="Duplicate event description.",
                 category=EventCategory.ACHIEVEMENT,
+                is_generated=False,
             )
             db.session.add(event2)
 
@@ -172,12 +174,47 @@ class TestHistoricalEventModel:
                 title="Different Year Event",
                 description="Different year description.",
                 category=EventCategory.EXPEDITION,
+                is_generated=False,
             )
             db.session.add(event3)
             db.session.commit()
 
             assert event3.id is not None
 
+    def test_unique_generated_event_per_date(self, app):
+        """Test only one AI-generated event may exist per month/day"""
+        with app.app_context():
+            db.session.add(HistoricalEvent(
+                event_month=3, event_day=14, year=1950,
+                title="Generated Event",
+                description="Generated by LLM.",
+                category=EventCategory.ACHIEVEMENT,
+            ))
+            db.session.commit()
+
+            db.session.add(HistoricalEvent(
+                event_month=3, event_day=14, year=1960,
+                title="Second Generated Event",
+                description="Generated by LLM.",
+                category=EventCategory.ACHIEVEMENT,
+            ))
+            with pytest.raises(Exception):
+                db.session.commit()
+            db.session.rollback()
+
+            # Curated events are not limited to one per date
+            curated = HistoricalEvent(
+                event_month=3, event_day=14, year=1960,
+                title="Curated Event",
+                description="Scraped from zsa.si.",
+                category=EventCategory.FIRST_ASCENT,
+                is_generated=False,
+            )
+            db.session.add(curated)
+            db.session.commit()
+
+            assert curated.id is not None
+
     def test_date_display_properties(self, app):
         """Test date display properties in English and Slovenian"""
         with app.app_context():
@@ -254,6 +291,7 @@ class TestHistoricalEventQueries:
                     people=["Edward Whymper"],
                     category=EventCategory.TRAGEDY,
                     is_featured=True,
+                    is_generated=False,
                 ),
                 HistoricalEvent(
                     event_month=7, event_day=26, year=1960,
@@ -325,6 +363,15 @@ class TestHistoricalEventQueries:
             assert result.title == "Curated Event"
             assert result.is_generated is False
 
+    def test_get_events_by_date(self, app, sample_events):
+        """Test loading one event per date in a single query"""
+        with app.app_context():
+            events = HistoricalEvent.get_events_by_date()
+
+            assert set(events) == {(7, 27), (7, 26), (7, 25)}
+            assert events[(7, 27)].title == "Matterhorn Tragedy"  # curated first
+            assert HistoricalEvent.get_event_dates() == {(7, 27), (7, 26), (7, 25)}
+
     def test_get_all_events_for_date(self, app, sample_events):
         """Test getting all events for a date"""
         with app.app_context():
@@ -1,14 +1,26 @@
 """Test RSS news integration for specialized climbing content"""
 
+import time
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from utils.daily_news import (
+    FEED_CACHE_TTL,
+    SOURCE_BACKOFF,
+    SOURCE_FAILURE_LIMIT,
     get_daily_mountaineering_news_for_homepage,
     RSSFeedParser,
     ClimbingNewsAggregator,
     WebScrapingParser,
+    fetch_and_cache_news,
+    search_newsapi,
+    clear_feed_cache,
+    _acquire_news_fetch_lock,
+    _release_news_fetch_lock,
+    _get_newsapi_client,
+    _http_session,
 )
-from models.content import DailyNews
+from models.content import DailyNews, FeedCache
 from models.user import db
 
 
@@ -115,6 +127,104 @@ class TestRSSFeedParser:
 
             assert articles == []
 
+    def test_parse_feed_cached_within_ttl(self, rss_parser, mock_rss_data):
+        """Test repeated parses within the TTL do not refetch the feed"""
+        with patch("feedparser.parse") as mock_parse:
+            mock_result = type("MockFeed", (), {})()
+            mock_result.entries = mock_rss_data["entries"]
+            mock_result.bozo = 0
+            mock_result.etag = '"abc"'
+            mock_parse.return_value = mock_result
+
+            first = rss_parser.parse_feed("https://planetmountain.com/rss.xml")
+            first[0]["source_type"] = "rss"  # callers mutate returned articles
+            second = rss_parser.parse_feed("https://planetmountain.com/rss.xml")
+
+            assert mock_parse.call_count == 1
+            assert len(second) == 3
+            assert "source_type" not in second[0]
+
+    def test_parse_feed_conditional_request_after_ttl(self, rss_parser, mock_rss_data):
+        """Test expired feeds are revalidated with ETag and reused on 304"""
+        with patch("feedparser.parse") as mock_parse:
+            mock_result = type("MockFeed", (), {})()
+            mock_result.entries = mock_rss_data["entries"]
+            mock_result.bozo = 0
+            mock_result.etag = '"abc"'
+            mock_result.modified = None
+            not_modified = type("MockFeed", (), {})()
+            not_modified.status = 304
+            not_modified.entries = []
+            mock_parse.side_effect = [mock_result, not_modified]
+
+            rss_parser.parse_feed("https://planetmountain.com/rss.xml")
+            with patch("utils.daily_news.time.time", return_value=time.time() + FEED_CACHE_TTL + 1):
+                articles = rss_parser.parse_feed("https://planetmountain.com/rss.xml")
+
+            assert len(articles) == 3
+            mock_parse.assert_called_with(
+                "https://planetmountain.com/rss.xml",
+                etag='"abc"',
+                modified=None,
+                sanitize_html=False,
+                resolve_relative_uris=False,
+            )
+
+    def test_parse_feed_skips_source_after_repeated_failures(self, rss_parser):
+        """Test a feed failing SOURCE_FAILURE_LIMIT times is skipped until the backoff ends"""
+        url = "https://planetmountain.com/rss.xml"
+        with patch("feedparser.parse", side_effect=OSError("connection refused")) as mock_parse:
+            for _ in range(SOURCE_FAILURE_LIMIT + 1):
+                assert rss_parser.parse_feed(url) == []
+
+            assert mock_parse.call_count == SOURCE_FAILURE_LIMIT
+
+            with patch("utils.daily_news.time.time", return_value=time.time() + SOURCE_BACKOFF + 1):
+                rss_parser.parse_feed(url)
+
+            assert mock_parse.call_count == SOURCE_FAILURE_LIMIT + 1
+
+    def test_parse_feed_cache_persisted_across_processes(self, rss_parser, mock_rss_data):
+        """Test a fresh process reuses the persisted feed and its validators"""
+        with patch("feedparser.parse") as mock_parse:
+            mock_result = type("MockFeed", (), {})()
+            mock_result.entries = mock_rss_data["entries"]
+            mock_result.bozo = 0
+            mock_result.etag = '"abc"'
+            mock_result.modified = "Wed, 29 Jan 2025 10:00:00 GMT"
+            mock_parse.return_value = mock_result
+
+            rss_parser.parse_feed("https://planetmountain.com/rss.xml")
+            clear_feed_cache()  # simulate another worker / restart
+            articles = rss_parser.parse_feed("https://planetmountain.com/rss.xml")
+
+            assert mock_parse.call_count == 1
+            assert len(articles) == 3
+
+            feed_cache = FeedCache.get_for_url("https://planetmountain.com/rss.xml")
+            assert feed_cache.etag == '"abc"'
+            assert feed_cache.modified == "Wed, 29 Jan 2025 10:00:00 GMT"
+
+    def test_fetch_all_feeds_merges_sources_in_order(self, app):
+        """Test concurrent fetch keeps configured source order and metadata"""
+        with app.app_context():
+            parser = RSSFeedParser()
+
+            def parse_feed(url, source_name=None):
+                return [{"title": f"{source_name} news", "url": url, "source": source_name}]
+
+            with patch.object(parser, "parse_feed", side_effect=parse_feed):
+                articles = parser.fetch_all_feeds()
+
+            assert [a["source"] for a in articles] == list(RSSFeedParser.RSS_SOURCES)
+            assert articles[0]["source_name"] == "Planinska zveza Slovenije"
+            assert articles[0]["language"] == "sl"
+
+    def test_parse_date_from_rfc822_string(self, rss_parser):
+        """Test entries without parsed dates fall back to their RFC 822 date string"""
+        entry = {"published": "Wed, 29 Jan 2025 10:00:00 GMT"}
+        assert rss_parser._parse_date(entry) == "2025-01-29T10:00:00+00:00"
+
     def test_extract_source_name_from_url(self, rss_parser):
         """Test extracting source name from RSS URL"""
         assert (
@@ -172,6 +282,29 @@ class TestRSSFeedParser:
         cleaned = rss_parser._clean_html_content(html_text)
         assert cleaned == "Text with multiple spaces."
 
+    def test_clean_html_content_plain_text_skips_parser(self, rss_parser):
+        """Test plain-text summaries are cleaned without an HTML parse"""
+        with patch("utils.daily_news.LexborHTMLParser") as mock_parser:
+            cleaned = rss_parser._clean_html_content(
+                "New route   on Triglav.\nThe post Route appeared first on Alpinist"
+            )
+
+        mock_parser.assert_not_called()
+        assert cleaned == "New route on Triglav."
+
+    def test_clean_html_content_simple_markup_skips_parser(self, rss_parser):
+        """Test inline markup is stripped without a parse and scripts still get one"""
+        with patch("utils.daily_news.LexborHTMLParser") as mock_parser:
+            cleaned = rss_parser._clean_html_content(
+                '<p>Route on <a href="/triglav?a=1&amp;b=2">Triglav</a> &amp; Špik</p>'
+            )
+
+        mock_parser.assert_not_called()
+        assert cleaned == "Route on Triglav & Špik"
+
+        cleaned = rss_parser._clean_html_content("<p>Route news<script>track()</script></p>")
+        assert cleaned == "Route news"
+
     def test_clean_html_content_length_truncation(self, rss_parser):
         """Test content truncation at sentence boundaries"""
         # Create content longer than 300 characters
@@ -339,6 +472,74 @@ class TestClimbingNewsAggregator:
         assert len(deduplicated) == 1
         assert deduplicated[0]["source"] == "planetmountain"
 
+    def test_select_top_articles_caps_slovenian_and_skips_duplicates(self, aggregator):
+        """Test homepage selection dedups, limits Slovenian articles and stops at the limit"""
+        articles = [
+            {"title": "Slovenia team wins world cup", "summary": "", "relevance_score": 9.0},
+            {"title": "Slovenia team wins world cup again", "summary": "", "relevance_score": 8.0},
+            {"title": "Ljubljana crag news", "summary": "slovenian crag", "relevance_score": 7.0},
+            {"title": "Slovenian alpinists return", "summary": "", "relevance_score": 6.0},
+            {"title": "Patagonia season report", "summary": "", "relevance_score": 5.0},
+            {"title": "Yosemite speed record", "summary": "", "relevance_score": 4.0},
+        ]
+
+        selected = aggregator.select_top_articles(articles)
+
+        assert [a["relevance_score"] for a in selected] == [9.0, 7.0, 5.0]
+
+    def test_scoring_flags_slovenian_content_for_selection(self, aggregator):
+        """Test scoring flags Slovenian content so selection needs no second scan"""
+        articles = aggregator.calculate_relevancy_scores(
+            [
+                {"title": "Janja Garnbret wins again", "summary": ""},
+                {"title": "Yosemite speed record", "summary": "Luka Lindič"},
+                {"title": "Patagonia season report", "summary": ""},
+            ]
+        )
+
+        assert [a["is_slovenian_content"] for a in articles] == [True, True, False]
+
+        selected = aggregator.select_top_articles(articles, max_articles=3, max_slovenian=1)
+        assert len(selected) == 2
+        assert sum(a["is_slovenian_content"] for a in selected) == 1
+
+    def test_deduplication_same_canonical_url(self, aggregator):
+        """Test links to the same article dedup regardless of tracking params or title"""
+        articles = [
+            {
+                "title": "Ondra sends Silence",
+                "url": "https://www.planetmountain.com/news/ondra-silence/?utm_source=rss",
+                "relevance_score": 3.0,
+            },
+            {
+                "title": "Adam Ondra repeats 9c",
+                "url": "http://planetmountain.com/news/ondra-silence?fbclid=abc",
+                "relevance_score": 2.0,
+            },
+            {
+                "title": "Another story",
+                "url": "https://planetmountain.com/news/ondra-silence?page=2",
+                "relevance_score": 1.0,
+            },
+        ]
+
+        deduplicated = aggregator.deduplicate_articles(articles)
+
+        assert [a["relevance_score"] for a in deduplicated] == [3.0, 1.0]
+
+    def test_deduplication_near_duplicate_titles(self, aggregator):
+        """Test titles above the similarity threshold collapse, others sharing words do not"""
+        articles = [
+            {"title": "Adam Ondra climbs new 9c route in Norway today", "relevance_score": 3.0},
+            {"title": "adam ondra climbs new 9c route in norway", "relevance_score": 2.0},
+            {"title": "Janja Garnbret climbs new route in Slovenia", "relevance_score": 1.0},
+            {"title": "", "relevance_score": 0.5},
+        ]
+
+        deduplicated = aggregator.deduplicate_articles(articles)
+
+        assert [a["relevance_score"] for a in deduplicated] == [3.0, 1.0, 0.5]
+
 
 class TestRSSNewsIntegration:
     """Test integration with existing news system"""
@@ -401,6 +602,125 @@ class TestRSSNewsIntegration:
                 assert news1 == news2
                 mock_rss.assert_not_called()  # Should not fetch again
 
+    def test_homepage_news_served_from_memory(self, app):
+        """Test homepage news skips the DB while cached and reloads after a refresh"""
+        with app.app_context():
+            DailyNews.cache_todays_news([{"title": "Cached Article"}])
+            assert get_daily_mountaineering_news_for_homepage() == [{"title": "Cached Article"}]
+
+            with patch.object(DailyNews, "get_todays_news") as mock_get:
+                news = get_daily_mountaineering_news_for_homepage()
+            mock_get.assert_not_called()
+            assert news == [{"title": "Cached Article"}]
+
+            with patch(
+                "utils.daily_news._fetch_and_cache_news",
+                side_effect=lambda: DailyNews.cache_todays_news([{"title": "Fresh"}]),
+            ):
+                fetch_and_cache_news(force=True)
+
+            assert get_daily_mountaineering_news_for_homepage() == [{"title": "Fresh"}]
+
+    def test_newsapi_search_single_or_query(self, app):
+        """Test NewsAPI terms are searched in one OR-joined request"""
+        with app.app_context():
+            with patch("newsapi.NewsApiClient.get_everything") as mock_newsapi:
+                mock_newsapi.return_value = {
+                    "articles": [
+                        {
+                            "title": "Alpine News",
+                            "url": "https://newsapi-source.com/alpine",
+                            "description": "Alpine climbing news",
+                            "publishedAt": "2025-01-29T10:00:00Z",
+                        }
+                    ]
+                }
+
+                articles = search_newsapi("test_key")
+
+            mock_newsapi.assert_called_once()
+            query = mock_newsapi.call_args.kwargs["q"]
+            assert query == '"rock climbing" OR "mountaineering" OR "alpine climbing"'
+            assert articles[0]["summary"] == "Alpine climbing news"
+            assert articles[0]["source"] == "newsapi"
+
+    def test_newsapi_search_cached_within_ttl(self, app):
+        """Test repeated NewsAPI searches within the TTL cost a single request"""
+        with app.app_context():
+            with patch("newsapi.NewsApiClient.get_everything") as mock_newsapi:
+                mock_newsapi.return_value = {"articles": [{"title": "Alpine News", "url": "https://x.com/a"}]}
+
+                first = search_newsapi("test_key")
+                first[0]["relevance_score"] = 1.0  # Callers annotate the returned dicts
+                second = search_newsapi("test_key")
+
+            mock_newsapi.assert_called_once()
+            assert second[0]["title"] == "Alpine News"
+            assert "relevance_score" not in second[0]
+
+    def test_newsapi_only_asked_when_other_sources_fall_short(self, app):
+        """Test NewsAPI is skipped when RSS and scraping return enough articles"""
+        with app.app_context():
+            aggregator = ClimbingNewsAggregator()
+            articles = [{"title": f"Article {i}", "url": f"https://x.com/{i}"} for i in range(3)]
+            with patch.object(aggregator.rss_parser, "fetch_all_feeds", return_value=articles), patch.object(
+                aggregator.web_scraper, "fetch_all_sites", return_value=[]
+            ), patch.object(aggregator, "_fetch_newsapi_fallback", return_value=[]) as mock_newsapi:
+                aggregator._fetch_sources()
+            mock_newsapi.assert_not_called()
+
+            with patch.object(aggregator.rss_parser, "fetch_all_feeds", return_value=articles[:1]), patch.object(
+                aggregator.web_scraper, "fetch_all_sites", return_value=[]
+            ), patch.object(aggregator, "_fetch_newsapi_fallback", return_value=[]) as mock_newsapi:
+                aggregator._fetch_sources()
+            mock_newsapi.assert_called_once()
+
+    def test_fetch_skipped_when_news_refreshed_recently(self, app):
+        """Test a refresh right after another one returns cached news unless forced"""
+        with app.app_context():
+            DailyNews.cache_todays_news([{"title": "Cached Article"}])
+
+            with patch("utils.daily_news.ClimbingNewsAggregator") as mock_aggregator:
+                articles = fetch_and_cache_news()
+            mock_aggregator.assert_not_called()
+            assert articles == [{"title": "Cached Article"}]
+
+            with patch(
+                "utils.daily_news._fetch_and_cache_news",
+                side_effect=lambda: DailyNews.cache_todays_news([{"title": "Fresh"}]).articles,
+            ):
+                articles = fetch_and_cache_news(force=True)
+            assert articles == [{"title": "Fresh"}]
+
+    def test_newsapi_client_shares_http_session(self):
+        """Test NewsAPI calls reuse one client and keep-alive session"""
+        client = _get_newsapi_client("test_key")
+
+        assert _get_newsapi_client("test_key") is client
+        assert client.request_method is _http_session
+        assert WebScrapingParser().session is _http_session
+
+    def test_fetch_skipped_while_another_fetch_holds_lock(self, app):
+        """Test concurrent refreshes return cached news instead of refetching"""
+        with app.app_context():
+            DailyNews.cache_todays_news([{"title": "Cached Article"}])
+            token = _acquire_news_fetch_lock()
+            assert token is not None
+
+            try:
+                with patch("utils.daily_news.ClimbingNewsAggregator") as mock_aggregator:
+                    articles = fetch_and_cache_news()
+
+                mock_aggregator.assert_not_called()
+                assert articles == [{"title": "Cached Article"}]
+            finally:
+                _release_news_fetch_lock(token)
+
+            # Lock is free again after release
+            token = _acquire_news_fetch_lock()
+            assert token is not None
+            _release_news_fetch_lock(token)
+
 
 # Mock classes that will be implemented
 class MockRSSFeedParser:
@@ -473,24 +793,88 @@ class TestWebScrapingParser:
         assert "<a href" not in cleaned
         assert "Test content with HTML tags" in cleaned
 
+    def test_fetch_all_sites_merges_sources_in_order(self, app, web_scraper):
+        """Test concurrent scraping keeps configured source order and metadata"""
+        with app.app_context():
+
+            def scrape_site(source_key, source_config):
+                return [{"title": f"{source_key} news", "source": source_key}]
+
+            with patch.object(web_scraper, "scrape_site", side_effect=scrape_site):
+                articles = web_scraper.fetch_all_sites()
+
+            assert [a["source"] for a in articles] == list(WebScrapingParser.SCRAPING_SOURCES)
+            assert articles[0]["source_name"] == "American Alpine Club"
+            assert articles[0]["source_credibility"] == 0.95
+
+    def test_scrape_site_conditional_request_reuses_articles(self, app, web_scraper):
+        """Test unchanged pages answer 304 and reuse the articles parsed last time"""
+        with app.app_context():
+            source_config = web_scraper.SCRAPING_SOURCES["aac"]
+            page = Mock(status_code=200, content=b"<html></html>", headers={"ETag": '"v1"'})
+            not_modified = Mock(status_code=304, headers={})
+            scraped = [{"title": "AAC News", "url": "https://americanalpineclub.org/news/1"}]
+
+            with patch.object(web_scraper, "_apply_rate_limit"), patch.object(
+                web_scraper.session, "get", side_effect=[page, not_modified]
+            ) as mock_get, patch.object(
+                web_scraper, "_extract_articles", return_value=scraped
+            ) as mock_extract:
+                first = web_scraper.scrape_site("aac", source_config)
+                second = web_scraper.scrape_site("aac", source_config)
+
+            assert first == second == scraped
+            assert mock_extract.call_count == 1
+            assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_extract_articles_from_page(self, app, web_scraper):
+        """Test configured selectors extract each article once with absolute URLs"""
+        from selectolax.lexbor import LexborHTMLParser
+
+        html = """
+        <article class="post">
+          <h2 class="entry-title"><a href="/news/first-ascent">First ascent on Triglav</a></h2>
+          <p class="excerpt">A new line on the north face of Triglav was climbed this week.</p>
+          <time datetime="2025-01-29T10:00:00Z">Jan 29</time>
+        </article>
+        <article class="post">
+          <h2 class="entry-title">No link here</h2>
+        </article>
+        """
+        with app.app_context():
+            source_config = web_scraper.SCRAPING_SOURCES["explorersweb"]
+            articles = web_scraper._extract_articles(
+                LexborHTMLParser(html), source_config, "explorersweb"
+            )
+
+        assert len(articles) == 1
+        assert articles[0]["title"] == "First ascent on Triglav"
+        assert articles[0]["url"] == "https://explorersweb.com/news/first-ascent"
+        assert articles[0]["summary"].startswith("A new line on the north face")
+        assert articles[0]["published_at"] == "2025-01-29T10:00:00Z"
+
     def test_date_parsing_various_formats(self, web_scraper):
         """Test date parsing from different formats"""
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         # Test datetime attribute
-        elem1 = BeautifulSoup(
-            '<time datetime="2025-01-29T10:00:00Z">Jan 29</time>', "html.parser"
-        ).find("time")
+        elem1 = LexborHTMLParser(
+            '<time datetime="2025-01-29T10:00:00Z">Jan 29</time>'
+        ).css_first("time")
         result1 = web_scraper._parse_date(elem1)
         assert "2025-01-29T10:00:00Z" in result1
 
         # Test text content
-        elem2 = BeautifulSoup('<span class="date">January 29, 2025</span>', "html.parser").find(
-            "span"
-        )
+        elem2 = LexborHTMLParser('<span class="date">January 29, 2025</span>').css_first("span")
         result2 = web_scraper._parse_date(elem2)
         assert "2025-01-29" in result2
 
+        # Test ISO datetime without timezone
+        elem3 = LexborHTMLParser('<time datetime="2025-01-29T10:00:00">Jan 29</time>').css_first(
+            "time"
+        )
+        assert web_scraper._parse_date(elem3) == "2025-01-29T10:00:00Z"
+
         # Test None input
         result3 = web_scraper._parse_date(None)
         assert result3.endswith("Z")
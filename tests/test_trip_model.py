@@ -479,3 +479,51 @@ def test_unlimited_capacity_trip(app, test_users):
         assert trip.confirmed_participants_count == 2
         assert trip.waitlist_count == 0
         assert not trip.is_full
+
+
+def test_discussion_notification_recipients(app, test_users):
+    """Test recipients are confirmed, opted-in participants other than the author"""
+    from models.user import NotificationType
+    from utils.email_service import get_discussion_notification_recipients
+
+    with app.app_context():
+        trip_leader = test_users["trip_leader"]
+        member = test_users["member"]
+        admin = test_users["admin"]
+        pending_user = test_users["pending"]
+        pending_user.approve()
+
+        trip = Trip(
+            title="Discussion trip",
+            destination="Test mountain",
+            trip_date=date.today() + timedelta(days=10),
+            difficulty=TripDifficulty.EASY,
+            max_participants=2,
+            leader_id=trip_leader.id,
+        )
+        db.session.add(trip)
+        db.session.commit()
+
+        for user in (member, admin, pending_user):  # Last one is waitlisted
+            trip.add_participant(user)
+            db.session.commit()
+
+        recipients = get_discussion_notification_recipients(trip, trip_leader.id)
+        assert {u.id for u in recipients} == {member.id, admin.id}
+
+        # Author is excluded
+        recipients = get_discussion_notification_recipients(trip, admin.id)
+        assert [u.id for u in recipients] == [member.id]
+
+        # Global opt-out removes the user
+        admin.set_notification_preference(NotificationType.DISCUSSIONS, False)
+        db.session.commit()
+        recipients = get_discussion_notification_recipients(trip, trip_leader.id)
+        assert [u.id for u in recipients] == [member.id]
+
+        # Per-trip opt-out removes the user
+        for participant in trip.participants:
+            if participant.user_id == member.id:
+                participant.notify_discussion = False
+        db.session.commit()
+        assert get_discussion_notification_recipients(trip, trip_leader.id) == []
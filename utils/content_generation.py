@@ -3,19 +3,80 @@ Content Generation Service
 Handles daily generation and management of AI-powered content
 """
 
+import json
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
 
 from models.user import db
-from models.content import HistoricalEvent, NewsItem, EventCategory
-from utils.llm_service import LLMService, LLMError
+from models.content import HistoricalEvent, NewsItem, EventCategory, GenerationJob
+from utils.llm_service import LLMError, get_llm_service
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Process-level cache of (month, day) -> (event id, expiry) for today's-event lookups
+EVENT_CACHE_TTL = 300  # seconds
+_event_id_cache: Dict[tuple, tuple] = {}
+
+# Maximum LLM requests in flight during bulk generation
+BULK_GENERATION_WORKERS = 10
+
+# One INSERT ... RETURNING per dialect for all new events; SQLAlchemy caches its
+# compiled form once and RETURNING hands back the ORM objects without a SELECT.
+# ON CONFLICT DO NOTHING on the generated-event-per-date index makes concurrent
+# writers for the same date a no-op instead of a SELECT-then-INSERT race.
+_insert_event_statements: Dict[str, object] = {}
+
+
+def _get_insert_event_statement():
+    """Get the cached event INSERT statement for the current database dialect"""
+    dialect = db.engine.dialect.name
+    stmt = _insert_event_statements.get(dialect)
+    if stmt is None:
+        if dialect in ("sqlite", "postgresql"):
+            dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            stmt = dialect_insert(HistoricalEvent).on_conflict_do_nothing(
+                index_elements=["event_month", "event_day"],
+                index_where=db.text("is_generated"),
+            )
+        else:
+            stmt = insert(HistoricalEvent)
+        stmt = stmt.returning(HistoricalEvent, sort_by_parameter_order=True)
+        _insert_event_statements[dialect] = stmt
+    return stmt
+
+# Bulk generation checkpoints live next to the development database
+CHECKPOINT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "databases")
+
+
+def _get_cached_event_for_date(month: int, day: int) -> Optional[HistoricalEvent]:
+    """Get event for date, resolving through the id cache before querying"""
+    cached = _event_id_cache.get((month, day))
+    if cached and cached[1] > time.monotonic():
+        event = db.session.get(HistoricalEvent, cached[0])
+        if event and event.event_month == month and event.event_day == day:
+            return event
+
+    event = HistoricalEvent.get_event_for_date(month, day)
+    if event:
+        _event_id_cache[(month, day)] = (event.id, time.monotonic() + EVENT_CACHE_TTL)
+    else:
+        _event_id_cache.pop((month, day), None)
+    return event
+
+
+def invalidate_event_cache(month: int, day: int) -> None:
+    """Drop cached event lookup for a date after it was created or regenerated"""
+    _event_id_cache.pop((month, day), None)
+
+
 class ContentGenerationError(Exception):
     """Custom exception for content generation errors"""
 
@@ -26,7 +87,7 @@ class HistoricalEventService:
     """Service for managing historical events"""
 
     def __init__(self):
-        self.llm_service = LLMService()
+        self.llm_service = get_llm_service()
 
     def generate_daily_event(self, target_date: Optional[datetime] = None) -> Optional[HistoricalEvent]:
         """
@@ -48,7 +109,7 @@ class HistoricalEventService:
         day = target_date.day
 
         # Check if event already exists for this date
-        existing_event = HistoricalEvent.get_event_for_date(month, day)
+        existing_event = _get_cached_event_for_date(month, day)
         if existing_event:
             logger.info(f"Historical event already exists for {day} {target_date.strftime('%B')}")
             return existing_event
@@ -56,51 +117,42 @@ class HistoricalEventService:
         try:
             logger.info(f"Generating new historical event for {day} {target_date.strftime('%B')}")
 
-            # Generate content using LLM, retry on low confidence
-            event_data = self.llm_service.generate_historical_event()
+            # Generate content with the fast model, escalate to the full model on low confidence
+            event_data = self.llm_service.generate_historical_event(fast=True)
             confidence = event_data.get("confidence", "medium")
 
             if confidence == "low":
                 logger.warning(f"Low-confidence event from primary provider: {event_data.get('title', 'unknown')}")
-                # Retry with fallback providers
-                retry_data = self.llm_service.generate_historical_event(skip_first=True)
+                retry_data = None
+                # Escalate to the full model when the fast request used a cheaper one
+                if self.llm_service.has_fast_model():
+                    retry_data = self.llm_service.generate_historical_event()
+                # Then retry with the fallback providers
+                if not retry_data or retry_data.get("confidence", "medium") == "low":
+                    retry_data = self.llm_service.generate_historical_event(skip_first=True)
                 if retry_data:
                     retry_confidence = retry_data.get("confidence", "medium")
                     if retry_confidence != "low":
-                        logger.info(f"Fallback provider returned acceptable event: {retry_data.get('title', 'unknown')}")
+                        logger.info(f"Retry returned acceptable event: {retry_data.get('title', 'unknown')}")
                         event_data = retry_data
                         confidence = retry_confidence
                     else:
-                        logger.warning(f"All providers returned low confidence, creating fallback event")
+                        logger.warning("All providers returned low confidence, creating fallback event")
                         return self._create_fallback_event(month, day)
                 else:
-                    logger.warning(f"Fallback providers failed, creating fallback event")
+                    logger.warning("Fallback providers failed, creating fallback event")
                     return self._create_fallback_event(month, day)
 
-            # Convert category string to enum
-            try:
-                category = EventCategory(event_data["category"])
-            except ValueError:
-                logger.warning(f"Invalid category '{event_data['category']}', using ACHIEVEMENT")
-                category = EventCategory.ACHIEVEMENT
-
             # Create database record with structured date
-            event = HistoricalEvent(
-                event_month=month,
-                event_day=day,
-                year=event_data["year"],
-                title=event_data["title"],
-                description=event_data["description"],
-                location=event_data["location"],
-                people=event_data["people"],
-                category=category,
-                methodology=event_data.get("methodology"),
-                is_generated=True,
-            )
-
-            # Save to database
-            db.session.add(event)
+            created = self._insert_events([self._event_row(month, day, event_data)])
             db.session.commit()
+            invalidate_event_cache(month, day)
+
+            if not created:
+                # Another worker stored this date while we were generating
+                logger.info(f"Historical event for {day}/{month} was created concurrently")
+                return HistoricalEvent.get_event_for_date(month, day)
+            event = created[0]
 
             logger.info(f"Successfully created historical event: {event.title}")
             return event
@@ -116,26 +168,47 @@ class HistoricalEventService:
             logger.error(error_msg)
             raise ContentGenerationError(error_msg)
 
+    def _event_row(self, month: int, day: int, event_data: Dict, is_generated: bool = True) -> Dict:
+        """Build HistoricalEvent insert parameters from validated LLM data"""
+        # Convert category string to enum
+        try:
+            category = EventCategory(event_data["category"])
+        except ValueError:
+            logger.warning(f"Invalid category '{event_data['category']}', using ACHIEVEMENT")
+            category = EventCategory.ACHIEVEMENT
+
+        return {
+            "event_month": month,
+            "event_day": day,
+            "year": event_data["year"],
+            "title": event_data["title"],
+            "description": event_data["description"],
+            "location": event_data["location"],
+            "people": event_data["people"],
+            "category": category,
+            "methodology": event_data.get("methodology"),
+            "is_generated": is_generated,
+        }
+
+    def _insert_events(self, rows: List[Dict]) -> List[HistoricalEvent]:
+        """Insert event rows in one statement, returning the events actually created
+
+        AI-generated rows for a date that already has an AI-generated event are skipped.
+        """
+        if not rows:
+            return []
+        return db.session.scalars(_get_insert_event_statement(), rows).all()
+
     def _create_fallback_event(self, month: int, day: int) -> HistoricalEvent:
         """Create fallback historical event when LLM fails"""
         try:
             fallback_data = self.llm_service.get_fallback_content("historical")
 
-            event = HistoricalEvent(
-                event_month=month,
-                event_day=day,
-                year=fallback_data["year"],
-                title=fallback_data["title"],
-                description=fallback_data["description"],
-                location=fallback_data["location"],
-                people=fallback_data["people"],
-                category=EventCategory(fallback_data["category"]),
-                methodology=fallback_data.get("methodology"),
-                is_generated=False,  # Mark as fallback content
-            )
-
-            db.session.add(event)
+            # Mark as fallback content
+            row = self._event_row(month, day, fallback_data, is_generated=False)
+            event = self._insert_events([row])[0]
             db.session.commit()
+            invalidate_event_cache(month, day)
 
             logger.info(f"Created fallback historical event for {day}/{month}")
             return event
@@ -208,6 +281,7 @@ class HistoricalEventService:
             event.updated_at = datetime.utcnow()
 
             db.session.commit()
+            invalidate_event_cache(event.event_month, event.event_day)
 
             logger.info(f"Successfully regenerated historical event: {event.title}")
             return event
@@ -232,6 +306,7 @@ class HistoricalEventService:
                 event.updated_at = datetime.utcnow()
 
                 db.session.commit()
+                invalidate_event_cache(event.event_month, event.event_day)
                 logger.info(f"Successfully regenerated with fallback: {event.title}")
                 return event
 
@@ -245,6 +320,76 @@ class HistoricalEventService:
             logger.error(error_msg)
             raise ContentGenerationError(error_msg)
 
+    def regenerate_event_stream(self, event_id: int) -> Iterator[Dict]:
+        """
+        Regenerate an existing historical event, streaming progress as it arrives
+
+        Yields {"type": "token", "text": ...} for every chunk received from the
+        LLM, followed by a single {"type": "done", ...} or {"type": "error", ...}.
+        The database is only touched once the stream has closed.
+
+        Args:
+            event_id: ID of event to regenerate
+
+        Yields:
+            Dict: Progress messages for the admin UI
+
+        Raises:
+            ContentGenerationError: If the event does not exist
+        """
+        event = HistoricalEvent.query.get(event_id)
+        if not event:
+            raise ContentGenerationError(f"Historical event {event_id} not found")
+
+        logger.info(f"Streaming regeneration of historical event {event_id} for {event.event_day}/{event.event_month}")
+
+        chunks = []
+        completed = False
+        try:
+            for chunk in self.llm_service.generate_historical_event_stream():
+                chunks.append(chunk)
+                yield {"type": "token", "text": chunk}
+
+            # Strict: a truncated or incomplete stream must not become fallback content
+            new_data = self.llm_service.parse_historical_event("".join(chunks), strict=True)
+
+            if new_data.get("confidence", "medium") == "low":
+                logger.warning(f"Skipping low-confidence regeneration: {new_data.get('title', 'unknown')}")
+                yield {"type": "done", "updated": False, "event": event.to_dict()}
+                return
+
+            event.year = new_data["year"]
+            event.title = new_data["title"]
+            event.description = new_data["description"]
+            event.location = new_data["location"]
+            event.people = new_data["people"]
+            event.methodology = new_data.get("methodology")
+
+            try:
+                event.category = EventCategory(new_data["category"])
+            except ValueError:
+                logger.warning(f"Invalid category '{new_data['category']}', keeping existing")
+
+            event.is_generated = True
+            event.updated_at = datetime.utcnow()
+            completed = True
+
+        except LLMError as e:
+            logger.error(f"LLM service failed during streaming regeneration: {e}")
+            yield {"type": "error", "error": str(e)}
+
+        finally:
+            # Commit only once the stream has closed cleanly
+            if completed:
+                db.session.commit()
+                invalidate_event_cache(event.event_month, event.event_day)
+                logger.info(f"Successfully regenerated historical event: {event.title}")
+            else:
+                db.session.rollback()
+
+        if completed:
+            yield {"type": "done", "updated": True, "event": event.to_dict()}
+
     def get_or_create_todays_event(self) -> Optional[HistoricalEvent]:
         """Get today's historical event, creating if it doesn't exist.
         
@@ -254,48 +399,276 @@ class HistoricalEventService:
         today = datetime.now()
 
         # get_event_for_date already prioritizes curated over AI (Change 2)
-        event = HistoricalEvent.get_event_for_date(today.month, today.day)
+        event = _get_cached_event_for_date(today.month, today.day)
         if event:
             return event
 
         # Generate new event
         return self.generate_daily_event(today)
 
-    def bulk_generate_events(self, start_date: date, end_date: date) -> List[HistoricalEvent]:
+    def _load_checkpoint(self, checkpoint_path: str) -> Dict[tuple, Dict]:
+        """Read generated event data from a bulk generation checkpoint ledger"""
+        done = {}
+        if not os.path.exists(checkpoint_path):
+            return done
+
+        valid_lines = []
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                done[(entry["month"], entry["day"])] = entry["event"]
+                valid_lines.append(line if line.endswith("\n") else line + "\n")
+            except (ValueError, KeyError):
+                # Partial line from a crash mid-write
+                continue
+
+        # Drop partial lines so new entries are appended on a clean line
+        if len(valid_lines) != len(lines) or (lines and not lines[-1].endswith("\n")):
+            with open(checkpoint_path, "w", encoding="utf-8") as f:
+                f.writelines(valid_lines)
+
+        logger.info(f"Resuming bulk generation with {len(done)} checkpointed dates from {checkpoint_path}")
+        return done
+
+    def bulk_generate_events(
+        self,
+        start_date: date,
+        end_date: date,
+        max_workers: int = BULK_GENERATION_WORKERS,
+        checkpoint_path: Optional[str] = None,
+    ) -> List[HistoricalEvent]:
         """
         Generate historical events for a date range
 
+        LLM requests run concurrently on a bounded thread pool; database writes
+        stay on the calling thread and are committed together at the end.
+        Dates whose generation fails (an LLMError or the providers' fallback
+        content) or returns low confidence are skipped so a later run can fill them.
+
+        Every accepted LLM result is appended to a JSONL checkpoint first, so a
+        run that dies before the commit resumes without repeating those calls.
+        The checkpoint is removed once the events are saved.
+
         Args:
             start_date: Start date for generation
             end_date: End date for generation
+            max_workers: Maximum LLM requests in flight
+            checkpoint_path: Checkpoint ledger file. Defaults to
+                backfill_<start>_<end>.jsonl in CHECKPOINT_DIR.
 
         Returns:
-            List[HistoricalEvent]: Generated events
+            List[HistoricalEvent]: Existing and generated events, in date order
         """
-        events = []
+        if checkpoint_path is None:
+            checkpoint_path = os.path.join(CHECKPOINT_DIR, f"backfill_{start_date}_{end_date}.jsonl")
+        checkpointed = self._load_checkpoint(checkpoint_path)
+
+        # One query for every stored date instead of a lookup per day
+        existing_events = HistoricalEvent.get_events_by_date()
+
+        events_by_date = {}
+        missing_dates = []
         current_date = start_date
 
         while current_date <= end_date:
+            existing_event = existing_events.get((current_date.month, current_date.day))
+            if existing_event:
+                events_by_date[current_date] = existing_event
+            else:
+                missing_dates.append(current_date)
+            current_date += timedelta(days=1)
+
+        new_rows = {}
+        pending_dates = []
+        for target_date in missing_dates:
+            event_data = checkpointed.get((target_date.month, target_date.day))
+            if event_data:
+                new_rows[target_date] = self._event_row(target_date.month, target_date.day, event_data)
+            else:
+                pending_dates.append(target_date)
+
+        with open(checkpoint_path, "a", encoding="utf-8") as checkpoint, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.llm_service.generate_historical_event, fast=True, target_date=target_date
+                ): target_date
+                for target_date in pending_dates
+            }
+
+            for future in as_completed(futures):
+                target_date = futures[future]
+                try:
+                    event_data = future.result()
+                except LLMError as e:
+                    logger.error(f"Failed to generate event for {target_date}: {e}")
+                    continue
+
+                if event_data.get("fallback"):
+                    # Every provider failed; the placeholder event is not stored or checkpointed
+                    logger.error(f"Failed to generate event for {target_date}: all providers failed")
+                    continue
+
+                if event_data.get("confidence", "medium") == "low":
+                    logger.warning(f"Skipping low-confidence event for {target_date}: {event_data.get('title', 'unknown')}")
+                    continue
+
+                checkpoint.write(json.dumps({
+                    "month": target_date.month,
+                    "day": target_date.day,
+                    "event": event_data,
+                    "ts": datetime.utcnow().isoformat(),
+                }, ensure_ascii=False) + "\n")
+                checkpoint.flush()
+
+                new_rows[target_date] = self._event_row(target_date.month, target_date.day, event_data)
+
+        new_events = []
+        if new_rows:
             try:
-                # Convert date to datetime for generation
-                target_datetime = datetime.combine(current_date, datetime.min.time())
-                event = self.generate_daily_event(target_datetime)
-                events.append(event)
+                new_events = self._insert_events(list(new_rows.values()))
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Failed to save bulk generated events: {e}")
+                return [events_by_date[d] for d in sorted(events_by_date)]
 
-            except ContentGenerationError as e:
-                logger.error(f"Failed to generate event for {current_date}: {e}")
-                # Continue with next date
+            dates_by_day = {(d.month, d.day): d for d in new_rows}
+            for event in new_events:
+                events_by_date[dates_by_day[(event.event_month, event.event_day)]] = event
+                invalidate_event_cache(event.event_month, event.event_day)
+
+        os.remove(checkpoint_path)
+        logger.info(f"Bulk generation created {len(new_events)} of {len(missing_dates)} missing events")
+        return [events_by_date[d] for d in sorted(events_by_date)]
+
+    def submit_bulk_generation(self, start_date: date, end_date: date) -> Optional[GenerationJob]:
+        """
+        Submit a date range for generation through the provider batch API
 
+        Batches are non-realtime (up to 24h) but half the price of regular calls,
+        which suits backfills. Results are stored by process_pending_generation_jobs.
+
+        Args:
+            start_date: Start date for generation
+            end_date: End date for generation
+
+        Returns:
+            GenerationJob: Tracking record, or None if every date already has an event
+
+        Raises:
+            ContentGenerationError: If the batch cannot be submitted
+        """
+        existing_dates = HistoricalEvent.get_event_dates()
+
+        dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            if (current_date.month, current_date.day) not in existing_dates:
+                dates.append(current_date)
             current_date += timedelta(days=1)
 
-        return events
+        if not dates:
+            logger.info(f"All dates between {start_date} and {end_date} already have events")
+            return None
+
+        try:
+            provider_name, batch_id = self.llm_service.submit_historical_batch(dates, fast=True)
+
+            job = GenerationJob(
+                provider=provider_name,
+                batch_id=batch_id,
+                pending_dates=[f"{d.month:02d}-{d.day:02d}" for d in dates],
+                status="pending",
+            )
+            db.session.add(job)
+            db.session.commit()
+
+            logger.info(f"Submitted generation job {batch_id} for {len(dates)} dates")
+            return job
+
+        except LLMError as e:
+            db.session.rollback()
+            error_msg = f"Failed to submit bulk generation: {e}"
+            logger.error(error_msg)
+            raise ContentGenerationError(error_msg)
+
+    def process_generation_job(self, job: GenerationJob) -> int:
+        """
+        Store results of a finished batch job in a single commit
+
+        Args:
+            job: Pending generation job
+
+        Returns:
+            int: Number of events created (0 while the batch is still processing)
+        """
+        try:
+            results = self.llm_service.get_historical_batch_results(job.provider, job.batch_id)
+        except LLMError as e:
+            logger.error(f"Failed to fetch results for generation job {job.batch_id}: {e}")
+            job.status = "failed"
+            job.completed_at = datetime.utcnow()
+            db.session.commit()
+            return 0
+
+        if results is None:
+            logger.info(f"Generation job {job.batch_id} still processing")
+            return 0
+
+        # Dates filled while the batch was running (curated, fallback or generated
+        # events) are skipped; ON CONFLICT only covers generated rows
+        existing_dates = HistoricalEvent.get_event_dates()
+
+        rows = []
+        for key in job.pending_dates:
+            event_data = results.get(key)
+            if not event_data:
+                logger.warning(f"No batch result for {key} in job {job.batch_id}")
+                continue
+            if event_data.get("confidence", "medium") == "low":
+                logger.warning(f"Skipping low-confidence batch result for {key}: {event_data.get('title')}")
+                continue
+
+            month, day = (int(part) for part in key.split("-"))
+            if (month, day) in existing_dates:
+                logger.info(f"Skipping batch result for {key}: date already has an event")
+                continue
+            rows.append(self._event_row(month, day, event_data))
+
+        try:
+            events = self._insert_events(rows)
+            job.status = "completed"
+            job.events_created = len(events)
+            job.completed_at = datetime.utcnow()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to store results for generation job {job.batch_id}: {e}")
+            # Mark the job failed so the poller does not retry the same insert forever
+            job.status = "failed"
+            job.completed_at = datetime.utcnow()
+            db.session.commit()
+            return 0
+
+        for event in events:
+            invalidate_event_cache(event.event_month, event.event_day)
+
+        logger.info(f"Generation job {job.batch_id} completed: {len(events)} events created")
+        return len(events)
+
+    def process_pending_generation_jobs(self) -> int:
+        """Poll all pending batch jobs and store finished results"""
+        return sum(self.process_generation_job(job) for job in GenerationJob.get_pending_jobs())
 
 
 class NewsService:
     """Service for managing news items (Future Phase 3B)"""
 
     def __init__(self):
-        self.llm_service = LLMService()
+        self.llm_service = get_llm_service()
 
     def generate_daily_news(self, target_date: Optional[date] = None) -> List[NewsItem]:
         """
@@ -1,18 +1,182 @@
 import datetime
+import functools
+import html
+import os
 import re
+import secrets
+import tempfile
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from newsapi import NewsApiClient
 from flask import current_app
 import feedparser
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
+import ahocorasick
+import ciso8601
+from selectolax.lexbor import LexborHTMLParser
+
+
+# Process-level cache of feed URL -> parsed articles, expiry and HTTP validators.
+# Upstream feeds change at most hourly, so repeated refreshes within the TTL skip
+# the network entirely; after expiry an ETag/Last-Modified request lets unchanged
+# feeds answer 304 without a body. Entries are persisted in FeedCache so other
+# workers and restarted machines start warm.
+FEED_CACHE_TTL = 1800  # seconds
+_feed_cache = {}
+
+
+def clear_feed_cache():
+    """Drop all cached RSS feeds"""
+    _feed_cache.clear()
+
+
+# Process-level cache of today's homepage news as (date, articles, expiry), so
+# homepage hits skip the DB round trip. A refresh in this process drops it at
+# once; other workers pick up refreshed news within the TTL.
+HOMEPAGE_NEWS_CACHE_TTL = 300  # seconds
+_homepage_news_cache = {}
+
+
+def clear_homepage_news_cache():
+    """Drop the cached homepage news"""
+    _homepage_news_cache.clear()
+
+
+# Cross-worker lock so a news refresh hits the sources once, however many
+# gunicorn workers, scheduler jobs or admin refreshes ask for it. The lock file
+# holds the owner's token; a lock older than the TTL is treated as abandoned.
+NEWS_FETCH_LOCK_PATH = os.path.join(tempfile.gettempdir(), "pd_triglav_news_fetch.lock")
+NEWS_FETCH_LOCK_TTL = 300  # seconds
+
+# News refreshed more recently than this is served as is. Every gunicorn worker
+# runs its own scheduler, so the lock alone only stops overlapping refreshes;
+# this keeps workers that drift out of phase from refetching right after each
+# other (scheduler ticks are every 30 minutes).
+NEWS_REFRESH_MIN_AGE = 25 * 60  # seconds
+
+# Process-level cache of NewsAPI search results as (expiry, articles). NewsAPI
+# is only asked when RSS and scraping come up short, and at most once per TTL,
+# to stay well within the 100 requests/day developer quota.
+NEWSAPI_CACHE_TTL = 6 * 3600  # seconds
+NEWSAPI_MIN_ARTICLES = 3  # RSS + scraping articles below which NewsAPI is asked
+_newsapi_cache = {}
+
+
+def clear_newsapi_cache():
+    """Drop the cached NewsAPI results"""
+    _newsapi_cache.clear()
+
+
+# Per-source circuit breaker: after SOURCE_FAILURE_LIMIT consecutive failed
+# fetches a feed or site is skipped for SOURCE_BACKOFF, so a dead source does
+# not cost its full timeout on every refresh. Keyed by feed or page URL.
+SOURCE_FAILURE_LIMIT = 3
+SOURCE_BACKOFF = 6 * 3600  # seconds
+_source_failures = {}  # source -> (consecutive failures, skipped until)
+
+
+def reset_source_failures():
+    """Forget recorded source failures, re-enabling every source"""
+    _source_failures.clear()
+
+
+def _source_available(source):
+    """Check whether a source may be fetched, i.e. its breaker is not open"""
+    return _source_failures.get(source, (0, 0.0))[1] <= time.time()
+
+
+def _record_source_result(source, succeeded):
+    """Reset a source's failure count on success, or count a failure and maybe open its breaker"""
+    if succeeded:
+        _source_failures.pop(source, None)
+        return
+
+    failures = _source_failures.get(source, (0, 0.0))[0] + 1
+    skip_until = time.time() + SOURCE_BACKOFF if failures >= SOURCE_FAILURE_LIMIT else 0.0
+    _source_failures[source] = (failures, skip_until)
+
+
+# One keep-alive connection pool shared by the NewsAPI client and the web
+# scraper, so repeated requests to a host reuse a single TCP+TLS connection.
+# Transient upstream errors are retried with backoff before a source is skipped.
+# With brotli installed, requests also offers (and decodes) br-compressed bodies.
+_http_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]),
+)
+_http_session = requests.Session()
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+# Set a respectful user agent
+_http_session.headers.update(
+    {"User-Agent": "PD Triglav News Aggregator (contact: admin@pd-triglav.si)"}
+)
+
+# NewsAPI search terms for the fallback source
+NEWSAPI_SEARCH_TERMS = ["rock climbing", "mountaineering", "alpine climbing"]
+
+
+# Common RSS footer patterns, combined so summaries are scanned once. Every
+# alternative runs to the end of the text, so the earliest match truncates it.
+FOOTER_RE = re.compile(
+    "|".join([
+        r"The post .+ appeared first on .+",
+        r"Continue reading .+",
+        r"Read more about .+",
+        r"View this post on .+",
+        r"Originally published on .+",
+        r"Source: .+",
+        r"\[.+\]$",  # Remove content in square brackets at end
+    ]),
+    re.IGNORECASE | re.DOTALL,
+)
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Slovenian content check for homepage selection - one scan for any of the terms
+SLOVENIAN_CONTENT_TERMS = frozenset({"slovenia", "slovenian", "janja garnbret", "luka lindič"})
+SLOVENIAN_CONTENT_RE = re.compile("|".join(re.escape(term) for term in SLOVENIAN_CONTENT_TERMS))
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Inline and simple block tags that a full parse would drop without side
+# effects. Summaries using only these are stripped by regex, skipping the
+# fixed cost of building a lexbor document for a few hundred characters.
+SIMPLE_TAG_RE = re.compile(
+    r"</?(?:a|b|i|u|s|p|br|hr|em|strong|span|div|img|ul|ol|li|h[1-6]|blockquote"
+    r"|small|sup|sub|cite|code|figure|figcaption)\b[^<>]*>",
+    re.IGNORECASE,
+)
+
+# Query parameters that only track the referrer, not which article is linked
+TRACKING_PARAM_RE = re.compile(r"(?:utm_[^=&]*|fbclid|gclid)(?:=|$)")
+
+
+def _canonical_url(url):
+    """Reduce an article URL to host, path and non-tracking query for duplicate checks"""
+    parsed = urlparse(url)
+    host = parsed.netloc.lower().removeprefix("www.")
+    path = parsed.path.rstrip("/")
+    query = "&".join(
+        param for param in parsed.query.split("&") if param and not TRACKING_PARAM_RE.match(param)
+    )
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
 
 
 def get_daily_mountaineering_news_for_homepage():
     """Get daily news for homepage - uses database cache only"""
     from models.content import DailyNews, db
 
+    today = datetime.date.today()
+    cached = _homepage_news_cache.get("news")
+    if cached and cached[0] == today and cached[2] > time.monotonic():
+        return cached[1]
+
     try:
         # Ensure clean transaction state before querying
         db.session.rollback()
@@ -20,6 +184,11 @@ def get_daily_mountaineering_news_for_homepage():
         # Try to get cached news first
         cached_news = DailyNews.get_todays_news()
         if cached_news:
+            _homepage_news_cache["news"] = (
+                today,
+                cached_news,
+                time.monotonic() + HOMEPAGE_NEWS_CACHE_TTL,
+            )
             return cached_news
 
         # If no cached news, return empty list (don't block startup)
@@ -32,41 +201,91 @@ def get_daily_mountaineering_news_for_homepage():
         return []
 
 
-def fetch_and_cache_news():
-    """Fetch news using RSS feeds with NewsAPI fallback"""
-    from models.content import DailyNews, db
+def _acquire_news_fetch_lock():
+    """Try to take the news refresh lock, returning its token or None if another fetch holds it"""
+    token = secrets.token_hex(8)
+    try:
+        fd = os.open(NEWS_FETCH_LOCK_PATH, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if time.time() - os.path.getmtime(NEWS_FETCH_LOCK_PATH) < NEWS_FETCH_LOCK_TTL:
+                return None
+            # Stale lock left by a crashed fetch - take it over
+            os.remove(NEWS_FETCH_LOCK_PATH)
+            fd = os.open(NEWS_FETCH_LOCK_PATH, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except (FileExistsError, FileNotFoundError):
+            return None
+
+    with os.fdopen(fd, "w") as lock_file:
+        lock_file.write(token)
+    return token
 
+
+def _release_news_fetch_lock(token):
+    """Release the news refresh lock if it is still ours"""
     try:
-        # Ensure clean transaction state before operations
-        db.session.rollback()
-        # Use new RSS-based news aggregator
-        aggregator = ClimbingNewsAggregator()
-        all_articles = aggregator.fetch_all_news()
+        with open(NEWS_FETCH_LOCK_PATH) as lock_file:
+            if lock_file.read() != token:
+                return  # Expired and taken over by another fetch
+        os.remove(NEWS_FETCH_LOCK_PATH)
+    except OSError:
+        pass
+
+
+def fetch_and_cache_news(force=False):
+    """
+    Fetch news using RSS feeds with NewsAPI fallback
+
+    Only one worker refreshes at a time; concurrent callers get the news
+    already cached for today instead of hitting the sources again. News
+    refreshed less than NEWS_REFRESH_MIN_AGE ago is returned without
+    refetching unless force is set (admin refresh).
+    """
+    from models.content import DailyNews
 
-        current_app.logger.info(f"RSS aggregator returned {len(all_articles)} articles")
+    token = _acquire_news_fetch_lock()
+    if token is None:
+        current_app.logger.info("News fetch already in progress, returning cached news")
+        return DailyNews.get_todays_news() or []
 
-        # Select top 3 articles with Slovenian content priority
-        final_articles = []
-        slovenian_count = 0
-        max_articles = 3
-        max_slovenian = 2
+    try:
+        if not force:
+            fresh_articles = _get_fresh_todays_news()
+            if fresh_articles:
+                current_app.logger.info("News refreshed recently, returning cached news")
+                return fresh_articles
+        return _fetch_and_cache_news()
+    finally:
+        clear_homepage_news_cache()
+        _release_news_fetch_lock(token)
+
+
+def _get_fresh_todays_news():
+    """Today's cached articles if refreshed within NEWS_REFRESH_MIN_AGE, else None"""
+    from models.content import DailyNews
 
-        for article in all_articles:
-            if len(final_articles) >= max_articles:
-                break
+    daily_news = DailyNews.query.filter_by(news_date=datetime.date.today()).first()
+    if not daily_news or not daily_news.articles or not daily_news.updated_at:
+        return None
 
-            # Check if this is Slovenian content
-            content_lower = f"{article.get('title', '')} {article.get('summary', '')}".lower()
-            is_slovenian = any(
-                term in content_lower
-                for term in ["slovenia", "slovenian", "janja garnbret", "luka lindič"]
-            )
+    age = datetime.datetime.utcnow() - daily_news.updated_at
+    if age > datetime.timedelta(seconds=NEWS_REFRESH_MIN_AGE):
+        return None
+    return daily_news.articles
 
-            if is_slovenian and slovenian_count < max_slovenian:
-                final_articles.append(article)
-                slovenian_count += 1
-            elif not is_slovenian:
-                final_articles.append(article)
+
+def _fetch_and_cache_news():
+    """Fetch and cache today's news (caller holds the refresh lock)"""
+    from models.content import DailyNews, db
+
+    try:
+        # Ensure clean transaction state before operations
+        db.session.rollback()
+        # Use new RSS-based news aggregator - top 3 articles with Slovenian content priority
+        aggregator = ClimbingNewsAggregator()
+        final_articles = aggregator.fetch_top_news()
+
+        current_app.logger.info(f"RSS aggregator selected {len(final_articles)} articles")
 
         # Format for database caching (maintain existing format)
         summaries = []
@@ -96,6 +315,53 @@ def fetch_and_cache_news():
         return fetch_and_cache_news_fallback()
 
 
+@functools.lru_cache(maxsize=1)
+def _get_newsapi_client(api_key):
+    """Get the process-wide NewsAPI client, bound to the shared HTTP session"""
+    return NewsApiClient(api_key=api_key, session=_http_session)
+
+
+def search_newsapi(api_key):
+    """
+    Search NewsAPI for recent climbing news
+
+    All search terms go into one OR-joined query, so the search costs a single
+    request (and a single unit of the daily quota) instead of one per term.
+    Results are cached for NEWSAPI_CACHE_TTL.
+    """
+    cached = _newsapi_cache.get(api_key)
+    if cached and cached[0] > time.time():
+        return [dict(article) for article in cached[1]]
+
+    newsapi = _get_newsapi_client(api_key)
+
+    end_time = datetime.datetime.utcnow()
+    start_time = end_time - datetime.timedelta(days=7)
+    from_date = start_time.strftime("%Y-%m-%d")
+
+    response = newsapi.get_everything(
+        q=" OR ".join(f'"{term}"' for term in NEWSAPI_SEARCH_TERMS),
+        from_param=from_date,
+        language="en",
+        sort_by="relevancy",
+        page_size=3 * len(NEWSAPI_SEARCH_TERMS),  # Limited fallback, 3 per term as before
+    )
+
+    articles = [
+        {
+            "title": article.get("title", ""),
+            "url": article.get("url", ""),
+            "summary": article.get("description", ""),
+            "published_at": article.get("publishedAt", ""),
+            "source": "newsapi",
+            "language": "en",
+        }
+        for article in response.get("articles", [])
+    ]
+    _newsapi_cache[api_key] = (time.time() + NEWSAPI_CACHE_TTL, articles)
+    return [dict(article) for article in articles]
+
+
 def fetch_and_cache_news_fallback():
     """Original NewsAPI-only implementation as fallback"""
     from models.content import DailyNews
@@ -109,37 +375,11 @@ def fetch_and_cache_news_fallback():
             current_app.logger.warning("No NEWS_API_KEY configured")
             return []
 
-        newsapi = NewsApiClient(api_key=api_key)
-
-        # Simplified search for fallback
-        search_terms = ["rock climbing", "mountaineering", "alpine climbing"]
-        all_articles = []
-
-        end_time = datetime.datetime.utcnow()
-        start_time = end_time - datetime.timedelta(days=7)
-        from_date = start_time.strftime("%Y-%m-%d")
-
-        for term in search_terms:
-            try:
-                response = newsapi.get_everything(
-                    q=term, from_param=from_date, language="en", sort_by="relevancy", page_size=3
-                )
-
-                articles = response.get("articles", [])
-                for article in articles:
-                    formatted = {
-                        "title": article.get("title", ""),
-                        "url": article.get("url", ""),
-                        "summary": article.get("description", ""),
-                        "published_at": article.get("publishedAt", ""),
-                        "source": "newsapi",
-                        "language": "en",
-                    }
-                    all_articles.append(formatted)
-
-            except Exception as e:
-                current_app.logger.warning(f"NewsAPI fallback error for '{term}': {e}")
-                continue
+        try:
+            all_articles = search_newsapi(api_key)
+        except Exception as e:
+            current_app.logger.warning(f"NewsAPI fallback error: {e}")
+            all_articles = []
 
         # Simple deduplication and selection
         unique_articles = {}
@@ -165,6 +405,70 @@ def fetch_and_cache_news_fallback():
 # by triggering a specific prompt at a set interval.
 
 
+def _strip_simple_markup(html_text):
+    """Strip simple tags and decode entities, or return None if the HTML needs a full parse"""
+    text = SIMPLE_TAG_RE.sub("", html_text)
+    if "<" in text or ">" in text or "\x00" in text:
+        return None  # Other markup (scripts, tables, comments) or stray brackets
+    return html.unescape(text)
+
+
+def clean_html_content(html_text):
+    """Clean HTML content to plain text and remove unwanted patterns"""
+    if not html_text:
+        return ""
+
+    try:
+        if "<" not in html_text and "&" not in html_text:
+            # Plain-text summary - no tags or entities, nothing to parse
+            text = html_text
+        else:
+            text = _strip_simple_markup(html_text)
+
+        if text is None:
+            # Parse HTML with the C-backed lexbor parser (summaries are cleaned
+            # per entry, so pure-Python parsing dominated feed ingest)
+            tree = LexborHTMLParser(html_text)
+            tree.strip_tags(["script", "style"])
+
+            # Get plain text without HTML tags
+            text = tree.text()
+
+        # Remove common RSS footer patterns
+        text = FOOTER_RE.sub("", text)
+
+        # Clean up whitespace and normalize text
+        text = WHITESPACE_RE.sub(" ", text)  # Replace multiple whitespace with single space
+        text = text.strip()
+
+        # Remove trailing periods and common sentence enders if they seem incomplete
+        if text.endswith("...") or text.endswith("…."):
+            text = text.rstrip(".… ")
+
+        # Ensure reasonable length (truncate at sentence boundary if too long)
+        if len(text) > 300:
+            # Try to cut at the last sentence boundary that fits
+            cut = text.rfind(". ", 0, 300)
+
+            if cut != -1:
+                text = text[: cut + 1]
+            else:
+                # Fallback: cut at word boundary
+                words = text.split()[:50]  # Approximately 300 chars
+                text = " ".join(words)
+                if not text.endswith("."):
+                    text += "..."
+
+        return text
+
+    except Exception as e:
+        current_app.logger.warning(f"HTML cleaning error: {e}")
+        # Fallback: basic HTML tag removal with regex
+        text = HTML_TAG_RE.sub("", html_text)
+        text = WHITESPACE_RE.sub(" ", text).strip()
+        return text[:300] + ("..." if len(text) > 300 else "")
+
+
 class RSSFeedParser:
     """Parse RSS feeds from specialized climbing websites"""
 
@@ -210,19 +514,41 @@ class RSSFeedParser:
         },
     }
 
+    # Summaries are reduced to plain text by _clean_html_content, so feedparser's
+    # pure-Python HTML sanitizing and relative-URI rewriting is wasted work
+    FEEDPARSER_OPTIONS = {"sanitize_html": False, "resolve_relative_uris": False}
+
     def __init__(self):
         self.timeout = 10  # seconds
 
     def parse_feed(self, url, source_name=None):
-        """Parse a single RSS feed and return formatted articles"""
+        """Parse a single RSS feed and return formatted articles (cached for FEED_CACHE_TTL)"""
+        cached = _feed_cache.get(url) or self._load_cached_feed(url)
+        if cached and cached["expires_at"] > time.time():
+            return [dict(article) for article in cached["articles"]]
+
+        if not _source_available(url):
+            current_app.logger.info(f"Skipping failing RSS feed {url}")
+            return [dict(article) for article in cached["articles"]] if cached else []
+
         try:
-            # Parse RSS feed with timeout
-            feed = feedparser.parse(url)
+            if cached:
+                # Conditional request - unchanged feeds answer 304 with no body
+                feed = feedparser.parse(
+                    url, etag=cached["etag"], modified=cached["modified"], **self.FEEDPARSER_OPTIONS
+                )
+                if getattr(feed, "status", None) == 304:
+                    _record_source_result(url, True)
+                    self._store_cached_feed(url, cached["articles"], cached["etag"], cached["modified"])
+                    return [dict(article) for article in cached["articles"]]
+            else:
+                feed = feedparser.parse(url, **self.FEEDPARSER_OPTIONS)
 
             # Check for parse errors
             if hasattr(feed, "bozo") and feed.bozo:
                 current_app.logger.warning(f"RSS parse warning for {url}: {feed.bozo_exception}")
                 if not feed.entries:  # If completely broken, return empty
+                    _record_source_result(url, False)
                     return []
 
             # Extract source name from URL if not provided
@@ -232,45 +558,113 @@ class RSSFeedParser:
             articles = []
             for entry in feed.entries:
                 try:
+                    # Skip articles without essential data before the costlier
+                    # HTML cleaning and date parsing
+                    title = entry.get("title", "").strip()
+                    link = entry.get("link", "")
+                    if not title or not link:
+                        continue
+
                     # Get raw summary/description
                     raw_summary = entry.get("summary", entry.get("description", ""))
+                    summary = self._clean_html_content(raw_summary)
 
-                    article = {
-                        "title": entry.get("title", "").strip(),
-                        "url": entry.get("link", ""),
-                        "summary": self._clean_html_content(raw_summary),
-                        "published_at": self._parse_date(entry),
-                        "source": source_name,
-                        "language": "en",  # Default to English for now
-                    }
-
-                    # Skip articles without essential data or meaningful content
-                    if (
-                        article["title"]
-                        and article["url"]
-                        and article["summary"]
-                        and len(article["summary"]) > 20
-                    ):
-                        articles.append(article)
+                    # Skip articles without meaningful content
+                    if len(summary) <= 20:
+                        continue
+
+                    articles.append(
+                        {
+                            "title": title,
+                            "url": link,
+                            "summary": summary,
+                            "published_at": self._parse_date(entry),
+                            "source": source_name,
+                            "language": "en",  # Default to English for now
+                        }
+                    )
 
                 except Exception as e:
                     current_app.logger.warning(f"Error parsing RSS entry from {url}: {e}")
                     continue
 
             current_app.logger.info(f"Parsed {len(articles)} articles from {source_name}")
+            _record_source_result(url, True)
+            self._store_cached_feed(
+                url,
+                [dict(article) for article in articles],
+                getattr(feed, "etag", None),
+                getattr(feed, "modified", None),
+            )
             return articles
 
         except Exception as e:
+            _record_source_result(url, False)
             current_app.logger.error(f"Failed to parse RSS feed {url}: {e}")
             return []
 
+    def _load_cached_feed(self, url):
+        """Load a feed persisted by another worker or before a restart into the process cache"""
+        from models.content import FeedCache, db
+
+        try:
+            feed_cache = FeedCache.get_for_url(url)
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.warning(f"Failed to load cached feed {url}: {e}")
+            return None
+
+        if not feed_cache:
+            return None
+
+        age = (datetime.datetime.utcnow() - feed_cache.fetched_at).total_seconds()
+        cached = {
+            "articles": feed_cache.articles,
+            "expires_at": time.time() + FEED_CACHE_TTL - age,
+            "etag": feed_cache.etag,
+            "modified": feed_cache.modified,
+        }
+        _feed_cache[url] = cached
+        return cached
+
+    def _store_cached_feed(self, url, articles, etag, modified):
+        """Cache a fetched or revalidated feed in the process and the database"""
+        from models.content import FeedCache, db
+
+        _feed_cache[url] = {
+            "articles": articles,
+            "expires_at": time.time() + FEED_CACHE_TTL,
+            "etag": etag,
+            "modified": modified,
+        }
+
+        try:
+            FeedCache.store(url, articles, etag, modified)
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.warning(f"Failed to persist cached feed {url}: {e}")
+
     def fetch_all_feeds(self):
-        """Fetch articles from all configured RSS sources"""
+        """Fetch articles from all configured RSS sources concurrently"""
+        app = current_app._get_current_object()
+
+        def fetch(source_key, source_config):
+            with app.app_context():
+                return self.parse_feed(source_config["url"], source_key)
+
+        # Feeds are network-bound, so overlap the requests; total latency is the
+        # slowest feed rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=len(self.RSS_SOURCES)) as executor:
+            futures = {
+                source_key: executor.submit(fetch, source_key, source_config)
+                for source_key, source_config in self.RSS_SOURCES.items()
+            }
+
         all_articles = []
 
         for source_key, source_config in self.RSS_SOURCES.items():
             try:
-                articles = self.parse_feed(source_config["url"], source_key)
+                articles = futures[source_key].result()
 
                 # Add source metadata to articles
                 for article in articles:
@@ -325,11 +719,12 @@ class RSSFeedParser:
             # Fallback to string parsing
             date_str = entry.get("published", entry.get("updated", ""))
             if date_str:
-                # Try to parse common RSS date formats
+                # RSS dates are RFC 822 - the email date parser also accepts
+                # named zones such as GMT that strptime's %z rejects
                 try:
-                    dt = datetime.datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
-                    return dt.isoformat()
-                except ValueError:
+                    dt = parsedate_to_datetime(date_str)
+                    return dt.isoformat() if dt.tzinfo else dt.isoformat() + "Z"
+                except (TypeError, ValueError):
                     # If parsing fails, return current time
                     pass
 
@@ -342,66 +737,7 @@ class RSSFeedParser:
 
     def _clean_html_content(self, html_text):
         """Clean HTML content and remove unwanted patterns"""
-        if not html_text:
-            return ""
-
-        try:
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html_text, "html.parser")
-
-            # Get plain text without HTML tags
-            text = soup.get_text()
-
-            # Remove common RSS footer patterns
-            footer_patterns = [
-                r"The post .+ appeared first on .+",
-                r"Continue reading .+",
-                r"Read more about .+",
-                r"View this post on .+",
-                r"Originally published on .+",
-                r"Source: .+",
-                r"\[.+\]$",  # Remove content in square brackets at end
-            ]
-
-            for pattern in footer_patterns:
-                text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.DOTALL)
-
-            # Clean up whitespace and normalize text
-            text = re.sub(r"\s+", " ", text)  # Replace multiple whitespace with single space
-            text = text.strip()
-
-            # Remove trailing periods and common sentence enders if they seem incomplete
-            if text.endswith("...") or text.endswith("…."):
-                text = text.rstrip(".… ")
-
-            # Ensure reasonable length (truncate at sentence boundary if too long)
-            if len(text) > 300:
-                # Try to cut at sentence boundary
-                sentences = text.split(". ")
-                truncated = ""
-                for sentence in sentences:
-                    if len(truncated + sentence + ". ") <= 300:
-                        truncated += sentence + ". "
-                    else:
-                        break
-
-                if truncated:
-                    text = truncated.strip()
-                else:
-                    # Fallback: cut at word boundary
-                    words = text.split()[:50]  # Approximately 300 chars
-                    text = " ".join(words)
-                    if not text.endswith("."):
-                        text += "..."
-
-            return text
-
-        except Exception as e:
-            current_app.logger.warning(f"HTML cleaning error: {e}")
-            # Fallback: basic HTML tag removal with regex
-            text = re.sub(r"<[^>]+>", "", html_text)
-            text = re.sub(r"\s+", " ", text).strip()
-            return text[:300] + ("..." if len(text) > 300 else "")
+        return clean_html_content(html_text)
 
 
 class WebScrapingParser:
@@ -454,29 +790,45 @@ class WebScrapingParser:
     }
 
     def __init__(self):
-        self.session = requests.Session()
-        # Set a respectful user agent
-        self.session.headers.update(
-            {"User-Agent": "PD Triglav News Aggregator (contact: admin@pd-triglav.si)"}
-        )
+        self.session = _http_session
         self.timeout = 15  # seconds
         self.last_request_time = {}
 
     def scrape_site(self, source_key, source_config):
         """Scrape articles from a single site"""
+        url = source_config["url"]
+        if not _source_available(url):
+            current_app.logger.info(f"Skipping failing source {source_config['name']}")
+            return []
+
         try:
             # Implement rate limiting
             self._apply_rate_limit(source_key, source_config["rate_limit"])
 
-            # Fetch the page
-            response = self.session.get(source_config["url"], timeout=self.timeout)
+            # Fetch the page, conditionally if we hold validators from the last scrape
+            cached = self._load_cached_page(url)
+            headers = {}
+            if cached and cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached and cached.modified:
+                headers["If-Modified-Since"] = cached.modified
+
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and cached:
+                # Unchanged page - reuse the articles parsed last time
+                _record_source_result(url, True)
+                return [dict(article) for article in cached.articles]
             response.raise_for_status()
+            _record_source_result(url, True)
 
-            # Parse HTML
-            soup = BeautifulSoup(response.content, "html.parser")
+            # Parse HTML with the C-backed lexbor parser
+            tree = LexborHTMLParser(response.content)
 
             # Extract articles using site-specific selectors
-            articles = self._extract_articles(soup, source_config, source_key)
+            articles = self._extract_articles(tree, source_config, source_key)
+            self._store_cached_page(
+                url, articles, response.headers.get("ETag"), response.headers.get("Last-Modified")
+            )
 
             current_app.logger.info(
                 f"Scraped {len(articles)} articles from {source_config['name']}"
@@ -484,12 +836,37 @@ class WebScrapingParser:
             return articles
 
         except requests.exceptions.RequestException as e:
+            _record_source_result(url, False)
             current_app.logger.error(f"Failed to scrape {source_config['name']}: {e}")
             return []
         except Exception as e:
             current_app.logger.error(f"Error scraping {source_config['name']}: {e}")
             return []
 
+    def _load_cached_page(self, url):
+        """Get the articles and validators saved from the last scrape of a page"""
+        from models.content import FeedCache, db
+
+        try:
+            return FeedCache.get_for_url(url)
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.warning(f"Failed to load cached page {url}: {e}")
+            return None
+
+    def _store_cached_page(self, url, articles, etag, modified):
+        """Save a scraped page's articles with its validators for conditional requests"""
+        from models.content import FeedCache, db
+
+        if not etag and not modified:
+            return  # Nothing to revalidate against next time
+
+        try:
+            FeedCache.store(url, articles, etag, modified)
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.warning(f"Failed to persist cached page {url}: {e}")
+
     def _apply_rate_limit(self, source_key, rate_limit_seconds):
         """Apply rate limiting between requests to the same source"""
         current_time = time.time()
@@ -505,13 +882,17 @@ class WebScrapingParser:
 
         self.last_request_time[source_key] = time.time()
 
-    def _extract_articles(self, soup, source_config, source_key):
+    def _extract_articles(self, tree, source_config, source_key):
         """Extract articles from parsed HTML using configured selectors"""
         articles = []
         selectors = source_config["selectors"]
 
-        # Find all article containers
-        article_elements = soup.select(selectors["articles"])
+        # Find all article containers - lexbor returns an element once per
+        # matching selector in the list (e.g. <article class="post">), so keep
+        # the first occurrence of each in document order
+        article_elements = list(
+            {node.mem_id: node for node in tree.css(selectors["articles"])}.values()
+        )
 
         for element in article_elements[:10]:  # Limit to first 10 articles
             try:
@@ -531,16 +912,18 @@ class WebScrapingParser:
     def _extract_single_article(self, element, selectors, source_config, source_key):
         """Extract data from a single article element"""
         # Extract title
-        title_elem = element.select_one(selectors["title"])
-        if not title_elem:
+        title_elem = element.css_first(selectors["title"])
+        if title_elem is None:
+            return None
+        title = title_elem.text().strip()
+        if not title:
             return None
-        title = title_elem.get_text().strip()
 
         # Extract URL
-        url_elem = element.select_one(selectors["url"])
-        if not url_elem:
+        url_elem = element.css_first(selectors["url"])
+        if url_elem is None:
             return None
-        url = url_elem.get("href", "")
+        url = url_elem.attributes.get("href") or ""
 
         # Make URL absolute if it's relative
         if url.startswith("/"):
@@ -548,27 +931,28 @@ class WebScrapingParser:
             url = f"{base_url.scheme}://{base_url.netloc}{url}"
         elif not url.startswith("http"):
             url = urljoin(source_config["url"], url)
+        if not url:
+            return None
 
         # Extract summary
-        summary_elem = element.select_one(selectors["summary"])
-        raw_summary = summary_elem.get_text().strip() if summary_elem else ""
+        summary_elem = element.css_first(selectors["summary"])
+        raw_summary = summary_elem.text().strip() if summary_elem is not None else ""
 
-        # Clean HTML content using existing method
-        # We'll need to access this from RSSFeedParser - let's create a shared method
+        # Clean HTML content with the same cleaner as RSS summaries
         summary = self._clean_html_content(raw_summary)
 
+        # Skip articles without meaningful content before looking up the date
+        if len(summary) < 20:
+            return None
+
         # Extract date
-        date_elem = element.select_one(selectors["date"])
+        date_elem = element.css_first(selectors["date"])
         published_at = (
             self._parse_date(date_elem)
-            if date_elem
+            if date_elem is not None
             else datetime.datetime.utcnow().isoformat() + "Z"
         )
 
-        # Basic validation
-        if not title or not url or len(summary) < 20:
-            return None
-
         return {
             "title": title,
             "url": url,
@@ -582,23 +966,20 @@ class WebScrapingParser:
         }
 
     def _clean_html_content(self, html_text):
-        """Clean HTML content - reuse RSSFeedParser method"""
-        # For now, create a temporary RSSFeedParser to reuse the method
-        # This is not ideal but ensures consistency
-        temp_parser = RSSFeedParser()
-        return temp_parser._clean_html_content(html_text)
+        """Clean HTML content the same way as RSS summaries"""
+        return clean_html_content(html_text)
 
     def _parse_date(self, date_elem):
         """Parse date from various formats"""
         try:
-            if not date_elem:
+            if date_elem is None:
                 return datetime.datetime.utcnow().isoformat() + "Z"
 
             # Try to get datetime attribute first
-            if date_elem.get("datetime"):
-                date_str = date_elem.get("datetime")
+            if date_elem.attributes.get("datetime"):
+                date_str = date_elem.attributes["datetime"]
             else:
-                date_str = date_elem.get_text().strip()
+                date_str = date_elem.text().strip()
 
             # Try various date parsing approaches
             try:
@@ -606,9 +987,15 @@ class WebScrapingParser:
                 if "T" in date_str and ("Z" in date_str or "+" in date_str):
                     return date_str
 
+                # Other ISO 8601 dates and datetimes via the C parser
+                try:
+                    dt = ciso8601.parse_datetime(date_str)
+                    return dt.isoformat() if dt.tzinfo else dt.isoformat() + "Z"
+                except ValueError:
+                    pass
+
                 # Common formats
                 for fmt in [
-                    "%Y-%m-%d",
                     "%B %d, %Y",
                     "%b %d, %Y",
                     "%d %B %Y",
@@ -633,12 +1020,25 @@ class WebScrapingParser:
             return datetime.datetime.utcnow().isoformat() + "Z"
 
     def fetch_all_sites(self):
-        """Fetch articles from all configured scraping sources"""
+        """Fetch articles from all configured scraping sources concurrently"""
+        app = current_app._get_current_object()
+
+        def scrape(source_key, source_config):
+            with app.app_context():
+                return self.scrape_site(source_key, source_config)
+
+        # Rate limits are per source, so the sites can be scraped side by side
+        with ThreadPoolExecutor(max_workers=len(self.SCRAPING_SOURCES)) as executor:
+            futures = {
+                source_key: executor.submit(scrape, source_key, source_config)
+                for source_key, source_config in self.SCRAPING_SOURCES.items()
+            }
+
         all_articles = []
 
         for source_key, source_config in self.SCRAPING_SOURCES.items():
             try:
-                articles = self.scrape_site(source_key, source_config)
+                articles = futures[source_key].result()
 
                 # Add source metadata to articles
                 for article in articles:
@@ -658,26 +1058,123 @@ class WebScrapingParser:
 class ClimbingNewsAggregator:
     """Aggregate and score news from multiple sources"""
 
+    # Minimum word-level Jaccard similarity for two titles to count as duplicates
+    TITLE_SIMILARITY_THRESHOLD = 0.8
+
+    # Climbing-specific keywords (higher scores for specialized terms)
+    CLIMBING_KEYWORDS = {
+        # High-value terms
+        "alpine climbing": 3.0,
+        "alpinism": 3.0,
+        "mountaineering": 2.5,
+        "sport climbing": 2.5,
+        "trad climbing": 2.5,
+        "bouldering": 2.0,
+        "free climbing": 2.0,
+        "aid climbing": 2.0,
+        # Competition and achievements
+        "ifsc": 2.5,
+        "world cup": 2.0,
+        "competition": 1.5,
+        "first ascent": 3.0,
+        "new route": 2.5,
+        "expedition": 2.0,
+        # Gear and technical
+        "climbing gear": 1.5,
+        "equipment": 1.0,
+        "safety": 1.5,
+        "rope": 1.0,
+        "harness": 1.0,
+        "helmet": 1.0,
+        # General climbing terms
+        "climbing": 1.0,
+        "climber": 1.0,
+        "rock climbing": 1.5,
+        "ice climbing": 2.0,
+        "mixed climbing": 2.0,
+    }
+
+    # Slovenian content terms (any language) - sets, since scoring only tests membership
+    SLOVENIAN_TERMS = frozenset({
+        "slovenia", "slovenian", "slovenija", "slovenski",
+        "janja garnbret", "luka lindič", "domen škofic",
+        "ljubljana", "bled", "triglav", "julian alps",
+        "julijske alpe", "kamniške alpe", "karavanke",
+        "planinska zveza", "gore-ljudje",
+    })
+
+    # Famous climbers (any one gives a boost)
+    FAMOUS_CLIMBERS = frozenset({
+        "adam ondra",
+        "alex honnold",
+        "lynn hill",
+        "tommy caldwell",
+        "janja garnbret",
+        "shauna coxsey",
+        "ashima shiraishi",
+    })
+
     def __init__(self):
         self.rss_parser = RSSFeedParser()
         self.web_scraper = WebScrapingParser()
 
+        # Single automaton over every scoring term
+        self._keyword_automaton = ahocorasick.Automaton()
+        terms = {
+            *self.CLIMBING_KEYWORDS,
+            *self.SLOVENIAN_TERMS,
+            *self.FAMOUS_CLIMBERS,
+            *SLOVENIAN_CONTENT_TERMS,
+        }
+        for term in terms:
+            self._keyword_automaton.add_word(term, term)
+        self._keyword_automaton.make_automaton()
+
     def fetch_all_news(self):
         """Fetch news from all sources (RSS + Web Scraping + NewsAPI fallback)"""
-        # Start with RSS feeds
-        rss_articles = self.rss_parser.fetch_all_feeds()
+        # Combine all three sources
+        return self.combine_sources(*self._fetch_sources())
+
+    def fetch_top_news(self, max_articles=3, max_slovenian=2):
+        """Fetch news from all sources and select the top articles for the homepage"""
+        return self.select_top_articles(
+            self._score_sources(*self._fetch_sources()), max_articles, max_slovenian
+        )
 
-        # Add web scraping articles
-        scraping_articles = self.web_scraper.fetch_all_sites()
+    def _fetch_sources(self):
+        """Fetch RSS and web scraping articles concurrently, then NewsAPI if they come up short"""
+        app = current_app._get_current_object()
 
-        # Get NewsAPI articles as fallback
-        newsapi_articles = self._fetch_newsapi_fallback()
+        def fetch(fetch_source):
+            with app.app_context():
+                return fetch_source()
 
-        # Combine all three sources
-        return self.combine_sources(rss_articles, scraping_articles, newsapi_articles)
+        # The two source groups are independent network waits, so a refresh
+        # takes as long as the slower group rather than both in turn
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(fetch, self.rss_parser.fetch_all_feeds),
+                executor.submit(fetch, self.web_scraper.fetch_all_sites),
+            ]
+
+        rss_articles, scraping_articles = (future.result() for future in futures)
+
+        # NewsAPI has a small daily quota, so it is only a fallback
+        newsapi_articles = []
+        if len(rss_articles) + len(scraping_articles) < NEWSAPI_MIN_ARTICLES:
+            newsapi_articles = self._fetch_newsapi_fallback()
+
+        return rss_articles, scraping_articles, newsapi_articles
 
     def combine_sources(self, rss_articles, scraping_articles, newsapi_articles):
         """Combine RSS, web scraping, and NewsAPI articles with proper prioritization"""
+        scored_articles = self._score_sources(rss_articles, scraping_articles, newsapi_articles)
+
+        # Deduplicate (result is already ordered by relevancy score and recency)
+        return self.deduplicate_articles(scored_articles)
+
+    def _score_sources(self, rss_articles, scraping_articles, newsapi_articles):
+        """Mark each article's source type and calculate relevancy scores"""
         # Add source type markers
         for article in rss_articles:
             article["source_type"] = "rss"
@@ -694,18 +1191,40 @@ class ClimbingNewsAggregator:
         all_articles = rss_articles + scraping_articles + newsapi_articles
 
         # Calculate relevancy scores
-        scored_articles = self.calculate_relevancy_scores(all_articles)
+        return self.calculate_relevancy_scores(all_articles)
+
+    def select_top_articles(self, articles, max_articles=3, max_slovenian=2):
+        """
+        Select the best unique articles, with at most max_slovenian Slovenian ones
 
-        # Deduplicate
-        deduplicated = self.deduplicate_articles(scored_articles)
+        Deduplication and selection run as one pass over the ranked articles,
+        stopping as soon as enough articles are selected.
+        """
+        selected = []
+        slovenian_count = 0
 
-        # Sort by relevancy score and recency
-        deduplicated.sort(key=lambda x: (x["relevance_score"], x["published_at"]), reverse=True)
+        for article in self.iter_unique_articles(articles):
+            if len(selected) >= max_articles:
+                break
 
-        return deduplicated
+            # Check if this is Slovenian content (flagged while scoring)
+            is_slovenian = article.get("is_slovenian_content")
+            if is_slovenian is None:
+                content_lower = f"{article.get('title', '')} {article.get('summary', '')}".lower()
+                is_slovenian = SLOVENIAN_CONTENT_RE.search(content_lower) is not None
+
+            if is_slovenian and slovenian_count < max_slovenian:
+                selected.append(article)
+                slovenian_count += 1
+            elif not is_slovenian:
+                selected.append(article)
+
+        return selected
 
     def calculate_relevancy_scores(self, articles):
         """Calculate climbing-specific relevancy scores"""
+        now = datetime.datetime.utcnow()
+
         for article in articles:
             score = 0.0
 
@@ -724,89 +1243,35 @@ class ClimbingNewsAggregator:
             elif article.get("source_type") == "webscraping":
                 score += 3.5
 
-            # Climbing-specific keywords (higher scores for specialized terms)
-            climbing_keywords = {
-                # High-value terms
-                "alpine climbing": 3.0,
-                "alpinism": 3.0,
-                "mountaineering": 2.5,
-                "sport climbing": 2.5,
-                "trad climbing": 2.5,
-                "bouldering": 2.0,
-                "free climbing": 2.0,
-                "aid climbing": 2.0,
-                # Competition and achievements
-                "ifsc": 2.5,
-                "world cup": 2.0,
-                "competition": 1.5,
-                "first ascent": 3.0,
-                "new route": 2.5,
-                "expedition": 2.0,
-                # Gear and technical
-                "climbing gear": 1.5,
-                "equipment": 1.0,
-                "safety": 1.5,
-                "rope": 1.0,
-                "harness": 1.0,
-                "helmet": 1.0,
-                # General climbing terms
-                "climbing": 1.0,
-                "climber": 1.0,
-                "rock climbing": 1.5,
-                "ice climbing": 2.0,
-                "mixed climbing": 2.0,
-            }
-
-            for keyword, weight in climbing_keywords.items():
-                if keyword in content:
-                    score += weight
+            # Keyword boosts - one Aho-Corasick pass finds every term in the content.
+            # Each climbing keyword counts once; the Slovenian and famous climber
+            # boosts apply once if any of their terms appears.
+            matched = {term for _, term in self._keyword_automaton.iter(content)}
+            score += sum(self.CLIMBING_KEYWORDS.get(term, 0.0) for term in matched)
 
             # Slovenian language source boost
             if article.get("language") == "sl":
                 score += 4.0  # Strong boost for Slovenian language content
 
             # Slovenian content boost (keywords in any language)
-            slovenian_terms = [
-                "slovenia", "slovenian", "slovenija", "slovenski",
-                "janja garnbret", "luka lindič", "domen škofic",
-                "ljubljana", "bled", "triglav", "julian alps",
-                "julijske alpe", "kamniške alpe", "karavanke",
-                "planinska zveza", "gore-ljudje",
-            ]
-
-            for term in slovenian_terms:
-                if term in content:
-                    score += 2.0  # Boost for Slovenian-related content
-                    break
+            if not matched.isdisjoint(self.SLOVENIAN_TERMS):
+                score += 2.0  # Boost for Slovenian-related content
 
             # Famous climbers boost
-            famous_climbers = [
-                "adam ondra",
-                "alex honnold",
-                "lynn hill",
-                "tommy caldwell",
-                "janja garnbret",
-                "shauna coxsey",
-                "ashima shiraishi",
-            ]
+            if not matched.isdisjoint(self.FAMOUS_CLIMBERS):
+                score += 1.5
 
-            for climber in famous_climbers:
-                if climber in content:
-                    score += 1.5
-                    break
+            # Homepage selection caps Slovenian articles; flag them from the same scan
+            article["is_slovenian_content"] = not matched.isdisjoint(SLOVENIAN_CONTENT_TERMS)
 
             # Recency bonus
             try:
                 pub_date_str = article.get("published_at", "")
                 if pub_date_str:
-                    if "T" in pub_date_str:
-                        pub_date = datetime.datetime.fromisoformat(
-                            pub_date_str.replace("Z", "+00:00")
-                        )
-                    else:
-                        pub_date = datetime.datetime.fromisoformat(pub_date_str)
-
-                    time_diff = datetime.datetime.utcnow() - pub_date.replace(tzinfo=None)
+                    # C-based ISO 8601 parser (handles the trailing Z and date-only values)
+                    pub_date = ciso8601.parse_datetime(pub_date_str)
+
+                    time_diff = now - pub_date.replace(tzinfo=None)
                     if time_diff.total_seconds() < 24 * 3600:  # Within 24 hours
                         score += 2.0
                     elif time_diff.total_seconds() < 48 * 3600:  # Within 48 hours
@@ -819,45 +1284,67 @@ class ClimbingNewsAggregator:
         return articles
 
     def deduplicate_articles(self, articles):
-        """Remove duplicate articles, preferring higher-scored sources"""
-        seen_titles = {}
-        deduplicated = []
-
-        # Sort by relevance score first for deduplication priority
-        articles_sorted = sorted(articles, key=lambda x: x.get("relevance_score", 0), reverse=True)
-
-        for article in articles_sorted:
-            title = article.get("title", "").lower().strip()
-
-            # Skip if we've seen a similar title
-            is_duplicate = False
-            for seen_title in seen_titles:
-                if self._titles_similar(title, seen_title):
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
-                seen_titles[title] = article
-                deduplicated.append(article)
-
-        return deduplicated
-
-    def _titles_similar(self, title1, title2, threshold=0.8):
-        """Check if two titles are similar (simple word-based comparison)"""
-        if not title1 or not title2:
-            return False
-
-        words1 = set(title1.lower().split())
-        words2 = set(title2.lower().split())
-
-        if not words1 or not words2:
-            return False
+        """Remove duplicate articles, preferring higher-scored sources
+
+        Returns the kept articles ordered by relevancy score, then recency.
+        """
+        return list(self.iter_unique_articles(articles))
+
+    def iter_unique_articles(self, articles):
+        """Yield unique articles lazily, highest relevancy score (then recency) first"""
+        threshold = self.TITLE_SIMILARITY_THRESHOLD
+        seen_words = []  # word sets of kept titles, built once per title
+
+        # Sort by relevance score (then recency) first for deduplication priority;
+        # this is also the final display order, so callers need no second sort
+        articles_sorted = sorted(
+            articles,
+            key=lambda x: (x.get("relevance_score", 0), x.get("published_at", "")),
+            reverse=True,
+        )
+        word_sets = [frozenset(article.get("title", "").lower().split()) for article in articles_sorted]
+
+        # Prefix filtering: with words ordered rarest first, two titles whose
+        # Jaccard similarity reaches the threshold always share a word within
+        # their first len - floor(threshold * len) + 1 words. Indexing only those
+        # prefixes means each title is compared to a handful of candidates
+        # instead of every title seen so far, with identical results.
+        word_counts = Counter(word for words in word_sets for word in words)
+        prefix_index = defaultdict(list)  # word -> indexes into seen_words
+        seen_urls = set()  # canonical URLs of kept articles
+
+        for article, words in zip(articles_sorted, word_sets):
+            # The same story syndicated or shared with tracking parameters is a
+            # duplicate whatever its title says - a set lookup settles it
+            url = article.get("url")
+            url_key = _canonical_url(url) if url else None
+            if url_key in seen_urls:
+                continue
 
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
+            ordered = sorted(words, key=lambda word: (word_counts[word], word))
+            prefix = ordered[: len(ordered) - int(threshold * len(ordered)) + 1]
+
+            # Skip if we've seen a similar title (word-level Jaccard similarity).
+            # Empty titles have an empty prefix, so they are never compared.
+            # Jaccard can't exceed min(|A|, |B|) / max(|A|, |B|), so titles of
+            # very different lengths are rejected before any set operation;
+            # |A ∪ B| = |A| + |B| - |A ∩ B|, so only the intersection set is built
+            size = len(words)
+            candidates = {i for word in prefix for i in prefix_index[word]}
+            if any(
+                min(size, len(seen_words[i])) / max(size, len(seen_words[i])) >= threshold
+                and (shared := len(words & seen_words[i])) / (size + len(seen_words[i]) - shared)
+                >= threshold
+                for i in candidates
+            ):
+                continue
 
-        similarity = len(intersection) / len(union)
-        return similarity >= threshold
+            for word in prefix:
+                prefix_index[word].append(len(seen_words))
+            seen_words.append(words)
+            if url_key:
+                seen_urls.add(url_key)
+            yield article
 
     def _fetch_newsapi_fallback(self):
         """Fetch from NewsAPI as fallback (existing logic)"""
@@ -866,43 +1353,7 @@ class ClimbingNewsAggregator:
             if not api_key:
                 return []
 
-            newsapi = NewsApiClient(api_key=api_key)
-
-            # Simplified NewsAPI search for fallback
-            search_terms = ["rock climbing", "mountaineering", "alpine climbing"]
-            all_articles = []
-
-            end_time = datetime.datetime.utcnow()
-            start_time = end_time - datetime.timedelta(days=7)
-            from_date = start_time.strftime("%Y-%m-%d")
-
-            for term in search_terms:
-                try:
-                    response = newsapi.get_everything(
-                        q=term,
-                        from_param=from_date,
-                        language="en",
-                        sort_by="relevancy",
-                        page_size=3,  # Limited fallback
-                    )
-
-                    articles = response.get("articles", [])
-                    for article in articles:
-                        formatted = {
-                            "title": article.get("title", ""),
-                            "url": article.get("url", ""),
-                            "summary": article.get("description", ""),
-                            "published_at": article.get("publishedAt", ""),
-                            "source": "newsapi",
-                            "language": "en",
-                        }
-                        all_articles.append(formatted)
-
-                except Exception as e:
-                    current_app.logger.warning(f"NewsAPI fallback error for '{term}': {e}")
-                    continue
-
-            return all_articles
+            return search_newsapi(api_key)
 
         except Exception as e:
             current_app.logger.error(f"NewsAPI fallback failed: {e}")
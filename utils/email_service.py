@@ -1,13 +1,20 @@
 """Email service for sending notifications"""
 
+import atexit
 import logging
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from flask import current_app, render_template
 from flask_mail import Message
 from app import mail
 
 logger = logging.getLogger(__name__)
 
+# Shared worker pool for blocking SMTP sends; bounds concurrent connections
+# when a broadcast fans out to many recipients
+MAIL_SEND_WORKERS = 4
+_mail_pool = ThreadPoolExecutor(max_workers=MAIL_SEND_WORKERS, thread_name_prefix="mail")
+atexit.register(_mail_pool.shutdown, wait=True)
+
 
 def is_mail_configured():
     """Check if email service is properly configured.
@@ -16,15 +23,20 @@ def is_mail_configured():
         bool: True if mail server and credentials are configured
     """
     app = current_app._get_current_object()
-    mail_server = app.config.get('MAIL_SERVER')
-    mail_username = app.config.get('MAIL_USERNAME')
-    
-    # Check if essential mail settings are present
-    return bool(mail_server and mail_username)
+    # Mail config doesn't change after startup, so check it once per app
+    configured = getattr(app, '_mail_is_configured', None)
+    if configured is None:
+        mail_server = app.config.get('MAIL_SERVER')
+        mail_username = app.config.get('MAIL_USERNAME')
+
+        # Check if essential mail settings are present
+        configured = bool(mail_server and mail_username)
+        app._mail_is_configured = configured
+    return configured
 
 
 def send_async_email(app, msg):
-    """Send email asynchronously in a separate thread"""
+    """Send email asynchronously on the shared mail pool"""
     with app.app_context():
         try:
             mail.send(msg)
@@ -38,12 +50,12 @@ def send_email(subject, recipient, template_html, template_txt, **kwargs):
     Args:
         subject: Email subject line
         recipient: Recipient email address
-        template_html: Path to HTML template
-        template_txt: Path to plain text template
+        template_html: Path to HTML template or a preloaded Template
+        template_txt: Path to plain text template or a preloaded Template
         **kwargs: Template variables
         
     Returns:
-        Thread object if email was sent, None if mail not configured
+        Future for the queued send, None if mail not configured
     """
     # Skip if mail service is not configured
     if not is_mail_configured():
@@ -64,10 +76,7 @@ def send_email(subject, recipient, template_html, template_txt, **kwargs):
     msg.body = render_template(template_txt, **kwargs)
 
     # Send asynchronously
-    thread = threading.Thread(target=send_async_email, args=(app, msg))
-    thread.start()
-
-    return thread
+    return _mail_pool.submit(send_async_email, app, msg)
 
 
 def send_discussion_notification(trip, message, author, recipients):
@@ -85,26 +94,36 @@ def send_discussion_notification(trip, message, author, recipients):
     if not recipients:
         return
 
+    # Skip template lookups and per-recipient work if mail is not configured
+    if not is_mail_configured():
+        logger.info(f"Mail not configured - skipping discussion notification for trip {trip.id}")
+        return
+
     subject = f"Novo sporočilo za izlet: {trip.title}"
 
-    # Send individual emails to each recipient
-    threads = []
+    # Templates greet each recipient by name, so they render per email;
+    # look them up once instead of once per recipient
+    template_html = app.jinja_env.get_template('emails/discussion_notification.html')
+    template_txt = app.jinja_env.get_template('emails/discussion_notification.txt')
+
+    # Queue individual emails to each recipient
+    futures = []
     for recipient_user in recipients:
         if recipient_user.email:
-            thread = send_email(
+            future = send_email(
                 subject=subject,
                 recipient=recipient_user.email,
-                template_html='emails/discussion_notification.html',
-                template_txt='emails/discussion_notification.txt',
+                template_html=template_html,
+                template_txt=template_txt,
                 trip=trip,
                 message=message,
                 author=author,
                 recipient_user=recipient_user
             )
-            if thread:  # Only append if email was actually sent
-                threads.append(thread)
+            if future:  # Only append if email was actually queued
+                futures.append(future)
 
-    return threads
+    return futures
 
 
 def get_discussion_notification_recipients(trip, exclude_user_id):
@@ -117,19 +136,31 @@ def get_discussion_notification_recipients(trip, exclude_user_id):
     Returns:
         List of User objects who have notification enabled and are confirmed participants
     """
-    from models.trip import ParticipantStatus
-
-    recipients = []
-
-    from models.user import NotificationType
-
-    for participant in trip.participants:
-        # Only notify confirmed participants who have notifications enabled
-        # Check both per-trip setting and global user preference
-        if (participant.status == ParticipantStatus.CONFIRMED and
-            participant.notify_discussion and
-            participant.user_id != exclude_user_id and
-            participant.user.get_notification_preference(NotificationType.DISCUSSIONS)):
-            recipients.append(participant.user)
-
-    return recipients
+    from sqlalchemy import and_, or_
+    from models.trip import ParticipantStatus, TripParticipant
+    from models.user import NotificationType, User, UserNotificationPreference
+
+    # Single query: confirmed participants with per-trip notifications on,
+    # whose global discussion preference is enabled or unset (default on)
+    return (
+        User.query.join(TripParticipant, TripParticipant.user_id == User.id)
+        .outerjoin(
+            UserNotificationPreference,
+            and_(
+                UserNotificationPreference.user_id == User.id,
+                UserNotificationPreference.notification_type == NotificationType.DISCUSSIONS,
+            ),
+        )
+        .filter(
+            TripParticipant.trip_id == trip.id,
+            TripParticipant.status == ParticipantStatus.CONFIRMED,
+            TripParticipant.notify_discussion.is_(True),
+            TripParticipant.user_id != exclude_user_id,
+            or_(
+                UserNotificationPreference.enabled.is_(None),
+                UserNotificationPreference.enabled.is_(True),
+            ),
+        )
+        .order_by(TripParticipant.signup_date)
+        .all()
+    )
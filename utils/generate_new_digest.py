@@ -1,9 +1,12 @@
 import os
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 import feedparser
+import requests
 import google.generativeai as genai
 from dotenv import load_dotenv
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 # --- Configuration ---
 
@@ -24,8 +27,40 @@ NUM_DIGEST_ARTICLES = 5
 # The output file for your website to use
 OUTPUT_FILE = "todays_news.json"
 
+# Articles and ETag/Last-Modified headers from the last run, so unchanged feeds answer 304
+RSS_CACHE_FILE = "rss_cache.json"
+
+# Seconds to wait on a feed server before giving up on that feed
+FEED_TIMEOUT = 15
+
+# Maximum summarization requests in flight at once (keeps us under the API rate limit)
+MAX_CONCURRENT_LLM_REQUESTS = 5
+
+# Articles summarized per LLM request (larger prompts get slower and less reliable)
+SUMMARY_BATCH_SIZE = 8
+
 # --- LLM Service (Modular Design) ---
 
+# Markdown code fences the LLM sometimes wraps around its JSON answer
+JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
+
+def parse_llm_json(text: str):
+    """
+    Parses a JSON answer from the LLM, ignoring code fences and any chatter around it.
+    """
+    cleaned = JSON_FENCE_RE.sub("", text)
+    try:
+        return json.loads(cleaned)
+    except json.JSONDecodeError:
+        # Retry on the outermost array or object, e.g. "Here you go: [1, 2]"
+        start = min((pos for pos in (cleaned.find("["), cleaned.find("{")) if pos != -1), default=-1)
+        end = max(cleaned.rfind("]"), cleaned.rfind("}")) + 1
+        if start == -1 or end <= start:
+            raise
+        return json.loads(cleaned[start:end])
+
+
 class LLMService:
     """
     A modular class to handle interactions with an LLM API.
@@ -41,6 +76,11 @@ class LLMService:
         """
         Uses the LLM to select the most relevant articles from a list.
         """
+        if len(articles) <= NUM_DIGEST_ARTICLES:
+            # Nothing to choose between, so skip the LLM round-trip
+            print(f"🧠 Only {len(articles)} articles available, using all of them without LLM selection.")
+            return articles
+
         print(f"🧠 Asking LLM to select the best {NUM_DIGEST_ARTICLES} articles from {len(articles)} options...")
         
         # Create a simplified list of articles for the prompt
@@ -54,14 +94,12 @@ class LLMService:
         Your response MUST be a JSON array containing only the IDs of your selected articles, in order of importance. For example: [3, 0, 8, 5, 2]
 
         Here is the list of articles:
-        {json.dumps(prompt_articles, indent=2)}
+        {json.dumps(prompt_articles, ensure_ascii=False)}
         """
 
         try:
             response = self.model.generate_content(prompt)
-            # The response text might have markdown backticks, so we clean it.
-            selected_ids_str = response.text.strip().replace("```json", "").replace("```", "").strip()
-            selected_ids = json.loads(selected_ids_str)
+            selected_ids = parse_llm_json(response.text)
             
             # Return the full article objects based on the selected IDs
             return [articles[i] for i in selected_ids if i < len(articles)]
@@ -90,7 +128,7 @@ class LLMService:
         
         try:
             response = self.model.generate_content(prompt)
-            summary_data = json.loads(response.text.strip().replace("```json", "").replace("```", ""))
+            summary_data = parse_llm_json(response.text)
             article.update(summary_data) # Add summaries to the article dict
             return article
         except Exception as e:
@@ -100,27 +138,150 @@ class LLMService:
             article['summary_sl'] = "(Prevajanje ni uspelo)" # Translation failed
             return article
 
+    def summarize_and_translate_batch(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Uses the LLM to summarize and translate several articles in a single request.
+        Articles missing from the response are summarized one by one instead.
+        """
+        print(f"✍️ Asking LLM to summarize {len(articles)} articles in one request...")
+
+        prompt_articles = [
+            {"id": i, "title": a['title'], "summary": a['summary']} for i, a in enumerate(articles)
+        ]
+
+        prompt = f"""
+        You are a helpful assistant for a mountaineering website.
+        Analyze the following articles in JSON format, each with an id, title and summary.
+
+        For each article, your task is to:
+        1. Write a concise, engaging 2-sentence summary in English.
+        2. Provide a professional Slovenian translation of that summary.
+
+        Your response MUST be a JSON array with one object per article, each with three keys:
+        "id", "summary_en" and "summary_sl". For example:
+        [{{"id": 0, "summary_en": "...", "summary_sl": "..."}}]
+
+        Here is the list of articles:
+        {json.dumps(prompt_articles, ensure_ascii=False)}
+        """
+
+        summaries = {}
+        try:
+            response = self.model.generate_content(prompt)
+            results = parse_llm_json(response.text)
+            summaries = {
+                item["id"]: item for item in results if "summary_en" in item and "summary_sl" in item
+            }
+        except Exception as e:
+            print(f"❗️ LLM batch summarization failed: {e}")
+
+        missing = []
+        for i, article in enumerate(articles):
+            if i in summaries:
+                article['summary_en'] = summaries[i]['summary_en']
+                article['summary_sl'] = summaries[i]['summary_sl']
+            else:
+                missing.append(article)
+
+        if missing:
+            print(f"↩️ Summarizing {len(missing)} articles one by one...")
+            # The LLM calls are independent round trips, so run them side by side
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LLM_REQUESTS) as executor:
+                list(executor.map(self.summarize_and_translate, missing))
+
+        return articles
+
 
 # --- Core Functions ---
 
+def load_rss_cache() -> Dict[str, Dict]:
+    """
+    Loads the articles and HTTP validators saved by the previous run, keyed by feed URL.
+    """
+    try:
+        with open(RSS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_rss_cache(cache: Dict[str, Dict]):
+    """
+    Saves each feed's articles and HTTP validators for conditional requests on the next run.
+    """
+    try:
+        with open(RSS_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
+    except OSError as e:
+        print(f"❗️ Could not save RSS cache to {RSS_CACHE_FILE}: {e}")
+
+# Shared HTTP session: keep-alive connection pool, gzip/deflate (and brotli when
+# installed) response bodies, one User-Agent for every feed request
+http_session = requests.Session()
+http_session.headers.update({"User-Agent": "PD Triglav News Digest (contact: admin@pd-triglav.si)"})
+
+def fetch_articles_from_feed(
+    source: str, url: str, cached: Optional[Dict] = None
+) -> Tuple[List[Dict], Optional[Dict]]:
+    """
+    Fetches and parses articles from a single RSS feed.
+    If the feed is unchanged since the cached fetch (HTTP 304), the cached articles are reused.
+    Returns the articles and the feed's new cache entry (None if the fetch failed).
+    """
+    cached = cached if cached and "articles" in cached else {}
+    articles = []
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
+    try:
+        response = http_session.get(url, headers=headers, timeout=FEED_TIMEOUT)
+        if cached and response.status_code == 304:
+            print(f"♻️ {source} unchanged since the last run")
+            return cached["articles"], cached
+        response.raise_for_status()
+
+        feed = feedparser.parse(response.content, response_headers=response.headers)
+
+        for entry in feed.entries:
+            articles.append({
+                "title": entry.title,
+                "link": entry.link,
+                "summary": entry.summary,
+                "source": source,
+            })
+    except Exception as e:
+        print(f"❗️ Could not fetch or parse feed from {source} ({url}): {e}")
+        return articles, None
+
+    cache_entry = {
+        "etag": response.headers.get("ETag"),
+        "modified": response.headers.get("Last-Modified"),
+        "articles": articles,
+    }
+    return articles, cache_entry
+
 def fetch_articles_from_rss(feeds: Dict[str, str]) -> List[Dict]:
     """
     Fetches and parses articles from a list of RSS feeds.
+    The feeds are downloaded concurrently, so this takes about as long as the slowest feed.
     """
     all_articles = []
     print("📰 Fetching articles from RSS feeds...")
-    for source, url in feeds.items():
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries:
-                all_articles.append({
-                    "title": entry.title,
-                    "link": entry.link,
-                    "summary": entry.summary,
-                    "source": source,
-                })
-        except Exception as e:
-            print(f"❗️ Could not fetch or parse feed from {source} ({url}): {e}")
+    cache = load_rss_cache()
+    with ThreadPoolExecutor(max_workers=max(len(feeds), 1)) as executor:
+        results = executor.map(
+            fetch_articles_from_feed,
+            feeds.keys(),
+            feeds.values(),
+            [cache.get(url) for url in feeds.values()],
+        )
+        # map() keeps the results in feed order
+        for url, (articles, cache_entry) in zip(feeds.values(), results):
+            all_articles.extend(articles)
+            if cache_entry is not None:
+                cache[url] = cache_entry
+    save_rss_cache(cache)
     return all_articles
 
 def save_digest_to_json(articles: List[Dict]):
@@ -128,8 +289,9 @@ def save_digest_to_json(articles: List[Dict]):
     Saves the final list of curated articles to a JSON file.
     """
     print(f"\n✅ Success! Saving {len(articles)} articles to {OUTPUT_FILE}")
+    # Machine-read by the website, so written compactly rather than indented
     with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump({"articles": articles}, f, ensure_ascii=False, indent=2)
+        json.dump({"articles": articles}, f, ensure_ascii=False, separators=(',', ':'))
 
 # --- Main Execution ---
 
@@ -152,11 +314,11 @@ def main():
     # 3. Select: Use the LLM to curate the best articles
     selected_articles = llm_service.select_best_articles(raw_articles)
     
-    # 4. Process: Summarize and translate each selected article
+    # 4. Process: Summarize and translate the selected articles, a batch per request
     final_digest = []
-    for article in selected_articles:
-        processed_article = llm_service.summarize_and_translate(article)
-        final_digest.append(processed_article)
+    for start in range(0, len(selected_articles), SUMMARY_BATCH_SIZE):
+        batch = selected_articles[start:start + SUMMARY_BATCH_SIZE]
+        final_digest.extend(llm_service.summarize_and_translate_batch(batch))
 
     # 5. Save: Store the final result in a JSON file
     save_digest_to_json(final_digest)
@@ -3,15 +3,56 @@ Hero landing page utilities for PD Triglav
 Handles hero image selection, user messaging, and optimization
 """
 
+import functools
+import math
 import os
+import random
+import time
 from datetime import datetime
+from types import MappingProxyType
 from flask import current_app
 
 
+HERO_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+# Process-level cache of hero dir -> (dir mtime, image filenames, expiry). The
+# directory is only re-listed when its mtime changes (an image was added or
+# removed), and its mtime is only checked once per TTL.
+HERO_LISTING_TTL = 300  # seconds
+_hero_listing_cache = {}
+
+
+def _get_hero_images(hero_dir):
+    """List hero image filenames, raising FileNotFoundError if the directory is missing"""
+    now = time.monotonic()
+    cached = _hero_listing_cache.get(hero_dir)
+    if cached and cached[2] > now:
+        return cached[1]
+
+    mtime = os.stat(hero_dir).st_mtime
+    if cached and cached[0] == mtime:
+        hero_images = cached[1]
+    else:
+        hero_images = tuple(
+            f for f in os.listdir(hero_dir) if f.lower().endswith(HERO_IMAGE_EXTENSIONS)
+        )
+
+    _hero_listing_cache[hero_dir] = (mtime, hero_images, now + HERO_LISTING_TTL)
+    return hero_images
+
+
+@functools.lru_cache(maxsize=32)
+def _select_hero_image(hour, hero_images):
+    """Hero image URL for an hour, computed once per hour and image listing"""
+    # Use hour as seed for consistent hourly rotation
+    # This ensures same image is shown for the entire hour
+    selected_image = random.Random(hour).choice(hero_images)
+    current_app.logger.info(f"Selected hero image for hour {hour}: {selected_image}")
+    return f"/static/images/hero/{selected_image}"
+
+
 def get_hero_image_for_season():
     """Returns randomly selected hero image that changes every hour."""
-    import random
-
     now = datetime.now()
     current_hour = now.hour
 
@@ -20,23 +61,14 @@ def get_hero_image_for_season():
 
     try:
         # Get all image files in hero directory
-        if os.path.exists(hero_dir):
-            all_files = os.listdir(hero_dir)
-            hero_images = [
-                f for f in all_files if f.lower().endswith((".jpg", ".jpeg", ".png", ".webp"))
-            ]
+        try:
+            hero_images = _get_hero_images(hero_dir)
+        except FileNotFoundError:
+            hero_images = None
 
+        if hero_images is not None:
             if hero_images:
-                # Use hour as seed for consistent hourly rotation
-                # This ensures same image is shown for the entire hour
-                random.seed(current_hour)
-                selected_image = random.choice(hero_images)
-                image_path = f"hero/{selected_image}"
-
-                current_app.logger.info(
-                    f"Selected hero image for hour {current_hour}: {selected_image}"
-                )
-                return f"/static/images/{image_path}"
+                return _select_hero_image(current_hour, hero_images)
             else:
                 current_app.logger.warning("No hero images found in hero directory")
         else:
@@ -56,59 +88,97 @@ def get_hero_image_for_season():
         return "/static/images/hero/hero-primary.jpg"  # Return path anyway as last resort
 
 
-def get_user_specific_messaging(user):
-    """Generates personalized hero headline and CTA text based on user authentication state."""
-
-    if not user.is_authenticated:
-        # Non-authenticated users - focus on adventure and joining
-        return {
-            "headline": "Odkrijte Veličino Slovenskih Gora",
-            "subheadline": "Pridružite se skupnosti 200+ planincev pri raziskovanju naših najlepših vrhov",
-            "primary_cta": {
+# Hero messaging is identical for every anonymous or pending visitor, so it is
+# built once as read-only mappings instead of per landing-page request
+_ANONYMOUS_MESSAGING = MappingProxyType(
+    {
+        "headline": "Odkrijte Veličino Slovenskih Gora",
+        "subheadline": "Pridružite se skupnosti 200+ planincev pri raziskovanju naših najlepših vrhov",
+        "primary_cta": MappingProxyType(
+            {
                 "text": "Začni svojo pustolovščino",
                 "url": "/auth/register",
                 "class": "btn-primary",
-            },
-            "secondary_cta": {
+            }
+        ),
+        "secondary_cta": MappingProxyType(
+            {
                 "text": "Oglej si naše izlete",
                 "url": "/about",
                 "class": "btn-outline-light",
-            },
-        }
+            }
+        ),
+    }
+)
 
-    elif user.is_pending():
-        # Pending users - encourage patience, show value
-        return {
-            "headline": "Dobrodošli v PD Triglav!",
-            "subheadline": "Vaša registracija čaka na odobritev. Medtem si oglejte našo skupnost in aktivnosti.",
-            "primary_cta": {
+_PENDING_MESSAGING = MappingProxyType(
+    {
+        "headline": "Dobrodošli v PD Triglav!",
+        "subheadline": "Vaša registracija čaka na odobritev. Medtem si oglejte našo skupnost in aktivnosti.",
+        "primary_cta": MappingProxyType(
+            {
                 "text": "Spoznaj Našo Skupnost",
                 "url": "/about",
                 "class": "btn-primary",
-            },
-            "secondary_cta": {
+            }
+        ),
+        "secondary_cta": MappingProxyType(
+            {
                 "text": "Oglej Zgodovinske Dogodke",
                 "url": "#history-section",
                 "class": "btn-outline-light",
-            },
+            }
+        ),
+    }
+)
+
+_MEMBER_PRIMARY_CTA = MappingProxyType(
+    {
+        "text": "Pojdi na Nadzorno Ploščo",
+        "url": "/dashboard",
+        "class": "btn-primary",
+    }
+)
+
+_MEMBER_SECONDARY_CTA = MappingProxyType(
+    {
+        "text": "Prihajajoči dogodki",
+        "url": "/trips",
+        "class": "btn-outline-light",
+    }
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _member_messaging(first_name):
+    """Read-only member messaging for a first name"""
+    return MappingProxyType(
+        {
+            "headline": f"Dobrodošel/la nazaj, {first_name}!",
+            "subheadline": "Pripravljeni na naslednjo planinsko pustolovščino?",
+            "primary_cta": _MEMBER_PRIMARY_CTA,
+            "secondary_cta": _MEMBER_SECONDARY_CTA,
         }
+    )
+
+
+def get_user_specific_messaging(user):
+    """Generates personalized hero headline and CTA text based on user authentication state.
+
+    The returned mapping is shared between requests and read-only.
+    """
+
+    if not user.is_authenticated:
+        # Non-authenticated users - focus on adventure and joining
+        return _ANONYMOUS_MESSAGING
+
+    elif user.is_pending():
+        # Pending users - encourage patience, show value
+        return _PENDING_MESSAGING
 
     else:
         # Active members - personalized welcome
-        return {
-            "headline": f"Dobrodošel/la nazaj, {user.name.split()[0]}!",
-            "subheadline": "Pripravljeni na naslednjo planinsko pustolovščino?",
-            "primary_cta": {
-                "text": "Pojdi na Nadzorno Ploščo",
-                "url": "/dashboard",
-                "class": "btn-primary",
-            },
-            "secondary_cta": {
-                "text": "Prihajajoči dogodki",
-                "url": "/trips",
-                "class": "btn-outline-light",
-            },
-        }
+        return _member_messaging(user.name.split()[0])
 
 
 def get_club_stats():
@@ -122,49 +192,98 @@ def get_club_stats():
     }
 
 
+# Responsive hero sizes generated by optimize_hero_images
+HERO_IMAGE_SIZES = {
+    "mobile": (768, 1024),  # Portrait mobile
+    "tablet": (1024, 768),  # Landscape tablet
+    "desktop": (1920, 1080),  # Desktop
+    "xl": (2560, 1440),  # Large desktop
+}
+HERO_OPTIMIZE_WORKERS = 2
+
+
+def _fit_within(size, box):
+    """Size that fits size inside box keeping aspect ratio, never upscaling.
+
+    Rounds like Pillow's Image.thumbnail, picking the floor or ceil that
+    best preserves the aspect ratio.
+    """
+    width, height = size
+    x, y = box
+    if x >= width and y >= height:
+        return size
+
+    aspect = width / height
+    if x / y >= aspect:
+        exact = y * aspect
+        x = max(min(math.floor(exact), math.ceil(exact), key=lambda n: abs(aspect - n / y)), 1)
+    else:
+        exact = x / aspect
+        y = max(min(math.floor(exact), math.ceil(exact), key=lambda n: abs(aspect - x / n) if n else 0), 1)
+    return x, y
+
+
+def _optimize_hero_image(hero_dir, filename):
+    """Write every responsive size of one hero image as JPEG and WebP."""
+    from PIL import Image
+
+    base_name = filename.rsplit(".", 1)[0]
+    img_path = os.path.join(hero_dir, filename)
+
+    with Image.open(img_path) as img:
+        # Let the JPEG decoder downscale by 1/2, 1/4 or 1/8 while still
+        # covering the largest target, instead of decoding full resolution
+        img.draft("RGB", max(HERO_IMAGE_SIZES.values()))
+
+        # All targets share the source aspect ratio, so largest-first each
+        # size can be resampled from the previous one instead of the source
+        targets = sorted(
+            ((size_name, _fit_within(img.size, box)) for size_name, box in HERO_IMAGE_SIZES.items()),
+            key=lambda target: target[1],
+            reverse=True,
+        )
+
+        current = img
+        for size_name, target_size in targets:
+            if current.size != target_size:
+                current = current.resize(target_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+            # Save as JPEG
+            jpg_path = os.path.join(hero_dir, f"{base_name}-{size_name}.jpg")
+            current.save(jpg_path, "JPEG", quality=85, optimize=True)
+
+            # Save as WebP for modern browsers
+            webp_path = os.path.join(hero_dir, f"{base_name}-{size_name}.webp")
+            current.save(webp_path, "WebP", quality=80, optimize=True)
+
+
 def optimize_hero_images():
     """Processes uploaded images into multiple sizes and WebP formats for performance."""
-    # This is a placeholder for future image optimization
-    # Would integrate with PIL/Pillow to create multiple sizes and WebP versions
-
     try:
-        from PIL import Image
-        import os
+        import PIL  # noqa: F401
+        from concurrent.futures import ThreadPoolExecutor
 
         hero_dir = os.path.join(current_app.static_folder, "images", "hero")
+        logger = current_app.logger
 
-        # Image sizes for responsive design
-        sizes = {
-            "mobile": (768, 1024),  # Portrait mobile
-            "tablet": (1024, 768),  # Landscape tablet
-            "desktop": (1920, 1080),  # Desktop
-            "xl": (2560, 1440),  # Large desktop
-        }
+        # Only originals; skip variants written by a previous run
+        size_suffixes = tuple(f"-{size_name}.jpg" for size_name in HERO_IMAGE_SIZES)
+        filenames = [
+            filename
+            for filename in os.listdir(hero_dir)
+            if filename.endswith(".jpg") and not filename.endswith(size_suffixes)
+        ]
+
+        def process(filename):
+            try:
+                _optimize_hero_image(hero_dir, filename)
+            except Exception as e:
+                logger.error(f"Error optimizing image {filename}: {e}")
 
-        # Process each hero image
-        for filename in os.listdir(hero_dir):
-            if filename.endswith(".jpg"):
-                base_name = filename.rsplit(".", 1)[0]
-                img_path = os.path.join(hero_dir, filename)
-
-                try:
-                    with Image.open(img_path) as img:
-                        # Create different sizes
-                        for size_name, (width, height) in sizes.items():
-                            # Resize maintaining aspect ratio
-                            img_resized = img.copy()
-                            img_resized.thumbnail((width, height), Image.Resampling.LANCZOS)
-
-                            # Save as JPEG
-                            jpg_path = os.path.join(hero_dir, f"{base_name}-{size_name}.jpg")
-                            img_resized.save(jpg_path, "JPEG", quality=85, optimize=True)
-
-                            # Save as WebP for modern browsers
-                            webp_path = os.path.join(hero_dir, f"{base_name}-{size_name}.webp")
-                            img_resized.save(webp_path, "WebP", quality=80, optimize=True)
-
-                except Exception as e:
-                    current_app.logger.error(f"Error optimizing image {filename}: {e}")
+        # Pillow releases the GIL while decoding, resizing and encoding, so a
+        # small thread pool overlaps files without extra processes
+        with ThreadPoolExecutor(max_workers=HERO_OPTIMIZE_WORKERS) as executor:
+            list(executor.map(process, filenames))
 
         return True
 
@@ -1,12 +1,143 @@
 import requests
 import time
 import json
+import hashlib
+import os
 import re
-import random
-from bs4 import BeautifulSoup
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional, Tuple
 
 
+# Slovenian month mappings
+MONTH_MAPPING = {
+    'januar': '01', 'januarja': '01', 'januarju': '01', 'jan': '01',
+    'februar': '02', 'februarja': '02', 'februarju': '02', 'feb': '02',
+    'marec': '03', 'marca': '03', 'marcu': '03', 'mar': '03',
+    'april': '04', 'aprila': '04', 'aprilu': '04', 'apr': '04',
+    'maj': '05', 'maja': '05', 'maju': '05',
+    'junij': '06', 'junija': '06', 'juniju': '06', 'jun': '06',
+    'julij': '07', 'julija': '07', 'juliju': '07', 'jul': '07',
+    'avgust': '08', 'avgusta': '08', 'avgustu': '08', 'avg': '08',
+    'september': '09', 'septembra': '09', 'septembru': '09', 'sep': '09',
+    'oktober': '10', 'oktobra': '10', 'oktobru': '10', 'okt': '10',
+    'november': '11', 'novembra': '11', 'novembru': '11', 'nov': '11',
+    'december': '12', 'decembra': '12', 'decembru': '12', 'dec': '12'
+}
+
+def _build_month_prefixes() -> Dict[str, str]:
+    """Maps every 3+ letter prefix of a month name to its month number.
+
+    The date patterns capture 3-9 letters, so abbreviations resolve with one
+    lookup; the first name in MONTH_MAPPING order wins, as a scan would.
+    """
+    prefixes = {}
+    for month_name, month_mm in MONTH_MAPPING.items():
+        for length in range(3, len(month_name) + 1):
+            prefixes.setdefault(month_name[:length], month_mm)
+    return prefixes
+
+
+MONTH_PREFIXES = _build_month_prefixes()
+
+# English month names for normalized storage
+OUTPUT_MONTH_NAMES = {
+    '01': 'January', '02': 'February', '03': 'March', '04': 'April',
+    '05': 'May', '06': 'June', '07': 'July', '08': 'August',
+    '09': 'September', '10': 'October', '11': 'November', '12': 'December'
+}
+
+# Date patterns, in priority order: "12. novembra", "12 novembra" (Slovenian,
+# day first), then "november 12, 1965" (English, month first). They sit in one
+# zero-width lookahead, so a single scan reports every candidate of every
+# pattern, including ones that overlap a match of another pattern.
+DATE_RE = re.compile(
+    r'(?=\b(\d{1,2})\.\s*([a-zčšžđć]{3,9})\b'
+    r'|\b(\d{1,2})\s+([a-zčšžđć]{3,9})\b'
+    r'|\b([a-zčšžđć]{3,9})\s+(\d{1,2}),?\s*(?:\d{4})?\b)'
+)
+
+YEAR_RE = re.compile(r'\b(1[89]\d{2}|20\d{2})\b')
+
+# Slovenian name pattern: Capitalized First Name + Capitalized Last Name
+NAME_RE = re.compile(r'\b[A-ZČŠŽĐĆ][a-zčšžđć]+\s+[A-ZČŠŽĐĆ][a-zčšžđć]+\b')
+
+# Capitalized word pairs that are not people
+PEOPLE_FALSE_POSITIVES = frozenset({
+    # Mountains and peaks
+    'Broad Peak', 'El Capitan', 'Muztagh Tower', 'Muztagh Towerja', 'Half Dome',
+    'Pik Komunizma', 'Mount Everest', 'Grandes Jorasses', 'Kriški Pod',
+    'Bavškega Grintovca', 'Velika Planina', 'Stara Fužina', 'Za Akom',
+    # Organizations
+    'Gimnaziji Kranj', 'National Geographic', 'Poljski Plezalci', 'The Alpine',
+    'Revija Alpinist', 'Indijski Himalaji', 'Nova Gorica', 'Raziskovalni postaji',
+    # Places
+    'Kamniška Bistrica', 'Dolgi Nemški', 'Zajedi Šit', 'Maria Anna',
+    # Other
+    'Akademskega alpinističnega'
+})
+MAX_PEOPLE = 5
+
+# Prepositions followed by a capitalized location name of one or two words
+LOCATION_RE = re.compile(r'(?:v|na|pri|ob)\s+([A-ZČŠŽĐĆ][A-Za-zčšžđć]+(?:\s+[A-ZČŠŽĐĆ][A-Za-zčšžđć]+)?)')
+
+# Location matches that are not places
+LOCATION_FALSE_POSITIVES = frozenset({'AK Ravne', 'Indijski Himalaji', 'Raziskovalni postaji'})
+
+# Joins paragraphs for the entity regexes. Paragraphs never contain a
+# newline, and a bar between them means no name or location can match across
+PARAGRAPH_SEPARATOR = '\n|\n'
+
+# Metadata or navigation lines left out of the description
+SKIP_PARAGRAPH_RE = re.compile(r'kategorije|objavljeno|avtor|preberi', re.IGNORECASE)
+
+# Title cleanup: dates, years, and metadata indicators
+TITLE_SL_DATE_RE = re.compile(r'\b\d{1,2}\.\s*[a-zčšžđć]+\b', re.IGNORECASE)
+TITLE_EN_DATE_RE = re.compile(r'\b[a-z]{3}\s+\d{1,2},?\s*\d{4}?\b', re.IGNORECASE)
+TITLE_YEAR_PREFIX_RE = re.compile(r'^\d{4}[:\-\s]+')
+TITLE_SUFFIX_RE = re.compile(r'\s*[-–—]\s*(rojen|umrl|na današnji dan).*$', re.IGNORECASE)
+
+# Category pages: the first link in each h2.entry-title, and the pagination
+# link whose text contains "Older Entries", each found in one lxml walk
+POST_LINKS_XPATH = etree.XPath(
+    "//h2[contains(concat(' ', normalize-space(@class), ' '), ' entry-title ')]/descendant::a[1]/@href"
+)
+NEXT_PAGE_XPATH = etree.XPath("//a[contains(., 'Older Entries')]/@href")
+
+# Event pages: parse only the post <article> (title, metadata, content)
+EVENT_PAGE_STRAINER = SoupStrainer('article')
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: up to `burst` calls pass at once, then one per
+    `interval` seconds. Waiting callers reserve their token under the lock,
+    so concurrent callers are spaced out instead of all waking together.
+    """
+
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = interval
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available and takes it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens * self.interval if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
 class EventParser:
     """
     Parses HTML content of a historical event page to extract structured data.
@@ -15,6 +146,7 @@ class EventParser:
     def __init__(self, soup: BeautifulSoup, url: str):
         self.soup = soup
         self.url = url
+        self.content = soup.find('div', class_='entry-content')
         self.full_text = self._get_full_text()
 
     def parse(self) -> Optional[Dict]:
@@ -22,14 +154,15 @@ class EventParser:
         Orchestrates the parsing of the event page.
         """
         title_element = self.soup.find('h1', class_='entry-title')
-        if not self.soup.find('div', class_='entry-content') or not title_element:
+        if not self.content or not title_element:
             return None
 
         raw_title = title_element.get_text().strip()
         
-        # Core data extraction
-        extracted_date = self._extract_date()
+        # Core data extraction; the year is one regex search, so pages without
+        # one are rejected before the metadata lookups and paragraph work
         primary_year = self._extract_year()
+        extracted_date = self._extract_date() if primary_year else None
         
         if not primary_year or not extracted_date:
             print(f"  ! Skipping event without year or date: {raw_title}")
@@ -37,9 +170,10 @@ class EventParser:
 
         description, paragraphs = self._extract_description_and_paragraphs()
         
-        # Entity extraction
-        people = self._extract_people(paragraphs)
-        location = self._extract_location(paragraphs)
+        # Entity extraction, one regex scan over all paragraphs
+        paragraph_text = PARAGRAPH_SEPARATOR.join(paragraphs)
+        people = self._extract_people(paragraph_text)
+        location = self._extract_location(paragraph_text)
         
         # Title refinement
         final_title = self._get_final_title(raw_title, paragraphs)
@@ -66,64 +200,35 @@ class EventParser:
 
     def _get_full_text(self) -> str:
         """Extracts all text from the main content area."""
-        content_div = self.soup.find('div', class_='entry-content')
-        return content_div.get_text().strip() if content_div else ""
+        return self.content.get_text().strip() if self.content else ""
 
     def _extract_date(self) -> Optional[str]:
         """Extracts the event date (MM-DD) from various parts of the page."""
         # Look in metadata area first
-        date_text = self._get_metadata_text()
-        
-        # Slovenian month mappings
-        month_mapping = {
-            'januar': '01', 'januarja': '01', 'januarju': '01', 'jan': '01',
-            'februar': '02', 'februarja': '02', 'februarju': '02', 'feb': '02',
-            'marec': '03', 'marca': '03', 'marcu': '03', 'mar': '03',
-            'april': '04', 'aprila': '04', 'aprilu': '04', 'apr': '04',
-            'maj': '05', 'maja': '05', 'maju': '05',
-            'junij': '06', 'junija': '06', 'juniju': '06', 'jun': '06',
-            'julij': '07', 'julija': '07', 'juliju': '07', 'jul': '07',
-            'avgust': '08', 'avgusta': '08', 'avgustu': '08', 'avg': '08',
-            'september': '09', 'septembra': '09', 'septembru': '09', 'sep': '09',
-            'oktober': '10', 'oktobra': '10', 'oktobru': '10', 'okt': '10',
-            'november': '11', 'novembra': '11', 'novembru': '11', 'nov': '11',
-            'december': '12', 'decembra': '12', 'decembru': '12', 'dec': '12'
-        }
-        
-        # New reverse mapping for output
-        output_month_names = { # English month names for normalized storage
-            '01': 'January', '02': 'February', '03': 'March', '04': 'April',
-            '05': 'May', '06': 'June', '07': 'July', '08': 'August',
-            '09': 'September', '10': 'October', '11': 'November', '12': 'December'
-        }
-        
-        # Date patterns: day first (Slovenian), then month first (English)
-        patterns = [
-            (r'\b(\d{1,2})\.\s*([a-zčšžđć]{3,9})\b', True),
-            (r'\b(\d{1,2})\s+([a-zčšžđć]{3,9})\b', True),
-            (r'\b([a-zčšžđć]{3,9})\s+(\d{1,2}),?\s*(?:\d{4})?\b', False) # Added 'čšžđć' to month name pattern
-        ]
-
-        for pattern, day_first in patterns:
-            matches = re.findall(pattern, date_text.lower())
-            for match in matches:
-                # Ensure month_name_sl is always the full name for lookup
-                day_str, month_name_sl_raw = match if day_first else (match[1], match[0])
-                month_name_sl = None
-
-                # Find the normalized month name if present in month_mapping keys
-                for k, v in month_mapping.items():
-                    if k.startswith(month_name_sl_raw):
-                        month_name_sl = k
-                        break
-                
-                if month_name_sl is None: continue # Skip if no matching month found
-
-                month_mm = month_mapping.get(month_name_sl)
-                if month_mm:
-                    return f"{output_month_names[month_mm]} {day_str.lstrip('0')}" # Remove leading zero from day
-        
-        return None
+        date_text = self._get_metadata_text().lower()
+
+        # A valid day-dot-month date wins outright; otherwise the first valid
+        # day-month date, then the first valid month-day date
+        day_month = month_day = None
+        for match in DATE_RE.finditer(date_text):
+            day_dot, month_dot, day_sl, month_sl, month_en, day_en = match.groups()
+            if day_dot:
+                date = self._format_date(day_dot, month_dot)
+                if date:
+                    return date
+            elif day_sl:
+                day_month = day_month or self._format_date(day_sl, month_sl)
+            else:
+                month_day = month_day or self._format_date(day_en, month_en)
+
+        return day_month or month_day
+
+    def _format_date(self, day_str: str, month_name_raw: str) -> Optional[str]:
+        """Normalizes a day and a (possibly abbreviated) month name, e.g. 'November 12'."""
+        month_mm = MONTH_PREFIXES.get(month_name_raw)
+        if month_mm is None:
+            return None  # No matching month found
+        return f"{OUTPUT_MONTH_NAMES[month_mm]} {day_str.lstrip('0')}" # Remove leading zero from day
 
     def _get_metadata_text(self) -> str:
         """Gathers text from typical metadata sections near the title."""
@@ -138,21 +243,24 @@ class EventParser:
                 metadata_text += " " + meta_element.get_text()
 
         if not metadata_text.strip():
-            next_element = title_element.next_sibling
+            # About 300 characters of whatever follows the title, text nodes included
+            texts = []
             chars_collected = 0
-            while next_element and chars_collected < 300:
-                if hasattr(next_element, 'get_text'):
-                    text = next_element.get_text().strip()
-                    metadata_text += " " + text
-                    chars_collected += len(text)
-                next_element = next_element.next_sibling
+            for sibling in title_element.next_siblings:
+                if chars_collected >= 300:
+                    break
+                text = sibling.get_text().strip()
+                texts.append(text)
+                chars_collected += len(text)
+            metadata_text += " " + " ".join(texts)
         
         return metadata_text if metadata_text.strip() else self.full_text
 
     def _extract_year(self) -> Optional[str]:
         """Finds the most likely primary year of the event."""
-        all_years = re.findall(r'\b(1[89]\d{2}|20\d{2})\b', self.full_text)
-        return all_years[0] if all_years else None
+        # Only the first year counts, so stop scanning at it
+        match = YEAR_RE.search(self.full_text)
+        return match.group(1) if match else None
 
     def _determine_category(self, title: str, description: str) -> str:
         """Determines event category from title and description keywords."""
@@ -172,13 +280,15 @@ class EventParser:
 
     def _extract_description_and_paragraphs(self) -> Tuple[str, List[str]]:
         """Extracts and cleans the main description text."""
-        paragraphs = [p.strip() for p in self.full_text.split('\n') if p.strip() and len(p) > 20]
-        
+        # WordPress wraps post paragraphs in <p>; whitespace inside one
+        # (including <br> line breaks) collapses to single spaces
+        paragraphs = [text for text in (' '.join(p.get_text().split()) for p in self.content.find_all('p')) if len(text) > 20]
+        if not paragraphs:
+            # Content without <p> markup, fall back to its text lines
+            paragraphs = [line for line in (raw.strip() for raw in self.full_text.split('\n')) if len(line) > 20]
+
         # Filter out common metadata or navigation lines
-        clean_paragraphs = [
-            p for p in paragraphs 
-            if not any(skip in p.lower() for skip in ['kategorije', 'objavljeno', 'avtor', 'preberi'])
-        ]
+        clean_paragraphs = [p for p in paragraphs if not SKIP_PARAGRAPH_RE.search(p)]
         
         description = ' '.join(clean_paragraphs[:3])
         if len(description) > 800:
@@ -186,55 +296,40 @@ class EventParser:
             
         return description, clean_paragraphs
 
-    def _extract_people(self, paragraphs: List[str]) -> List[str]:
-        """Extracts names of people from the text."""
-        people = []
-        # Slovenian name pattern: Capitalized First Name + Capitalized Last Name
-        name_pattern = r'\b[A-ZČŠŽ][a-zčšžđć]+\s+[A-ZČŠŽ][a-zčšžđć]+\b'
-
-        # Comprehensive false positives filter
-        false_positives = {
-            # Mountains and peaks
-            'Broad Peak', 'El Capitan', 'Muztagh Tower', 'Muztagh Towerja', 'Half Dome',
-            'Pik Komunizma', 'Mount Everest', 'Grandes Jorasses', 'Kriški Pod',
-            'Bavškega Grintovca', 'Velika Planina', 'Stara Fužina', 'Za Akom',
-            # Organizations
-            'Gimnaziji Kranj', 'National Geographic', 'Poljski Plezalci', 'The Alpine',
-            'Revija Alpinist', 'Indijski Himalaji', 'Nova Gorica', 'Raziskovalni postaji',
-            # Places
-            'Kamniška Bistrica', 'Dolgi Nemški', 'Zajedi Šit', 'Maria Anna',
-            # Other
-            'Akademskega alpinističnega'
-        }
+    def _extract_people(self, paragraph_text: str) -> List[str]:
+        """Extracts names of people from the text (the first 5 distinct, in reading order)."""
+        people = {}  # dict as an insertion-ordered set
 
-        for paragraph in paragraphs:
-            names = re.findall(name_pattern, paragraph)
-            for name in names:
-                # Filter out false positives and names with genitive endings
-                if (name not in false_positives and
-                    not name.endswith('ja') and  # Genitive endings often not actual names
-                    not name.endswith('ju') and
-                    len(name.split()[0]) > 2):  # Filter very short first names
-                    people.append(name)
+        for match in NAME_RE.finditer(paragraph_text):
+            name = match.group()
+            # Filter out false positives and names with genitive endings
+            if (name not in PEOPLE_FALSE_POSITIVES and
+                not name.endswith('ja') and  # Genitive endings often not actual names
+                not name.endswith('ju') and
+                len(name.split()[0]) > 2):  # Filter very short first names
+                people[name] = None
+                if len(people) == MAX_PEOPLE:
+                    return list(people)
 
-        return list(set(people))[:5]
+        return list(people)
 
-    def _extract_location(self, paragraphs: List[str]) -> Optional[str]:
+    def _extract_location(self, paragraph_text: str) -> Optional[str]:
         """Extracts the primary location from the text."""
-        for paragraph in paragraphs:
-            # Look for prepositions followed by a capitalized location name
-            # More restrictive pattern to avoid capturing full sentences
-            match = re.search(r'(?:v|na|pri|ob)\s+([A-ZČŠŽ][A-Za-zčšžđć]+(?:\s+[A-ZČŠŽ][A-Za-zčšžđć]+)?)', paragraph)
-            if match:
-                location = match.group(1).strip()
-                # Filter out common false positives
-                location_blacklist = {'AK Ravne', 'Indijski Himalaji', 'Raziskovalni postaji'}
-                # Only accept locations with 1-2 words
-                words = location.split()
-                if (len(words) <= 2 and
-                    location not in location_blacklist and
-                    not any(word in location for word in ['med', 'prvi', 'sicer', 'leto'])):
-                    return location
+        # Look for prepositions followed by a capitalized location name; only
+        # the first candidate of each paragraph is considered
+        match = LOCATION_RE.search(paragraph_text)
+        while match:
+            location = match.group(1).strip()
+            # Only accept locations with 1-2 words
+            words = location.split()
+            if (len(words) <= 2 and
+                location not in LOCATION_FALSE_POSITIVES and
+                not any(word in location for word in ['med', 'prvi', 'sicer', 'leto'])):
+                return location
+            next_paragraph = paragraph_text.find(PARAGRAPH_SEPARATOR, match.end())
+            if next_paragraph == -1:
+                break
+            match = LOCATION_RE.search(paragraph_text, next_paragraph)
         return None
 
     def _get_final_title(self, raw_title: str, paragraphs: List[str]) -> str:
@@ -242,10 +337,10 @@ class EventParser:
         
         def clean_title(title: str) -> str:
             # Remove dates, years, and metadata indicators
-            title = re.sub(r'\b\d{1,2}\.\s*[a-zčšžđć]+\b', '', title, flags=re.IGNORECASE)
-            title = re.sub(r'\b[a-z]{3}\s+\d{1,2},?\s*\d{4}?\b', '', title, flags=re.IGNORECASE)
-            title = re.sub(r'^\d{4}[:\-\s]+', '', title)
-            title = re.sub(r'\s*[-–—]\s*(rojen|umrl|na današnji dan).*$', '', title, flags=re.IGNORECASE)
+            title = TITLE_SL_DATE_RE.sub('', title)
+            title = TITLE_EN_DATE_RE.sub('', title)
+            title = TITLE_YEAR_PREFIX_RE.sub('', title)
+            title = TITLE_SUFFIX_RE.sub('', title)
             return title.strip(' -–—').strip()
 
         cleaned_h1 = clean_title(raw_title)
@@ -269,10 +364,74 @@ class HistoryScraper:
     HEADERS = {
         'User-Agent': 'PDTriglav-HistoryScraper/1.1 (https://github.com/Stoick643/pd-triglav)'
     }
-
-    def __init__(self, output_file: str = 'scraped_history.json'):
+    # One request per 5s on average whatever the concurrency, with a burst of
+    # 3; the workers overlap fetching and parsing with the politeness delay
+    REQUEST_INTERVAL = 5.0
+    REQUEST_BURST = 3
+    SCRAPE_WORKERS = 3
+    # Event posts are tens of KB; anything past 1 MiB is not worth parsing
+    MAX_PAGE_BYTES = 1024 * 1024
+
+    def __init__(self, output_file: str = 'scraped_history.json', cache_dir: str = '.scrape_cache'):
         self.output_file = output_file
+        self.cache_dir = cache_dir
         self.existing_urls = self._load_existing_urls()
+        self.session = self._create_session()
+        self.rate_limiter = RateLimiter(self.REQUEST_INTERVAL, self.REQUEST_BURST)
+
+    def _create_session(self) -> requests.Session:
+        """Creates a keep-alive session that retries transient failures with backoff."""
+        # 3 attempts in total with exponential backoff; 429s honor Retry-After
+        retry = Retry(
+            total=2,
+            backoff_factor=2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        adapter = HTTPAdapter(max_retries=retry)
+        session = requests.Session()
+        session.headers.update(self.HEADERS)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _read_capped(self, response: requests.Response) -> bytes:
+        """Reads a streamed response body, stopping after MAX_PAGE_BYTES."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.MAX_PAGE_BYTES:
+                print(f"  ! Page larger than {self.MAX_PAGE_BYTES} bytes, truncating: {response.url}")
+                break
+        return b''.join(chunks)[:self.MAX_PAGE_BYTES]
+
+    def _cache_path(self, url: str) -> str:
+        """Returns the cache file of an event URL."""
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def _load_cached(self, url: str) -> Optional[Dict]:
+        """Loads the cached validators and parse result of an event URL, if any."""
+        try:
+            with open(self._cache_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _store_cached(self, url: str, etag: Optional[str], last_modified: Optional[str], event_data: Optional[Dict]):
+        """
+        Caches the parse result of an event URL with its ETag/Last-Modified.
+        Rejected pages are cached too (as null), so unchanged ones are not
+        parsed again. Pages without validators cannot be revalidated and are
+        not cached. Delete the cache directory after changing EventParser.
+        """
+        if not etag and not last_modified:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._cache_path(url)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'etag': etag, 'last_modified': last_modified, 'event': event_data}, f, ensure_ascii=False)
+        os.replace(path + '.tmp', path)
 
     def _load_existing_urls(self) -> set:
         """Loads URLs from the existing JSON file to avoid re-scraping."""
@@ -311,61 +470,73 @@ class HistoryScraper:
         while page_url:
             print(f"Fetching URL list from: {page_url}")
             try:
-                response = requests.get(page_url, headers=self.HEADERS, timeout=15)
+                self.rate_limiter.acquire()
+                response = self.session.get(page_url, timeout=15)
                 response.raise_for_status()
             except requests.RequestException as e:
                 print(f"  ! Failed to fetch page list: {e}")
                 break
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            try:
+                tree = html.fromstring(response.content)
+            except etree.ParserError as e:  # Empty or unparsable body
+                print(f"  ! Failed to parse page list: {e}")
+                break
 
-            urls_this_page = 0
-            for header in soup.find_all('h2', class_='entry-title'):
-                link = header.find('a')
-                if link and link.has_attr('href'):
-                    all_urls.append(link['href'])
-                    urls_this_page += 1
+            urls_this_page = [str(href) for href in POST_LINKS_XPATH(tree)]
+            all_urls.extend(urls_this_page)
 
-            print(f"  Found {urls_this_page} URLs on page {page_num} (total: {len(all_urls)})")
+            print(f"  Found {len(urls_this_page)} URLs on page {page_num} (total: {len(all_urls)})")
 
             # Find pagination link - look for link containing "Older Entries"
-            next_page_link = soup.find('a', string=lambda text: text and 'Older Entries' in text)
-            page_url = next_page_link['href'] if next_page_link else None
+            next_page_links = NEXT_PAGE_XPATH(tree)
+            page_url = str(next_page_links[0]) if next_page_links else None
             page_num += 1
-            time.sleep(random.uniform(4, 6))  # Random 4-6s delay
 
         return all_urls
 
-    def scrape_event_details(self, event_url: str, max_retries: int = 3) -> Optional[Dict]:
-        """Scrapes details from a single event page with retry logic."""
+    def scrape_event_details(self, event_url: str) -> Optional[Dict]:
+        """Scrapes details from a single event page (the session retries transient errors)."""
         print(f"  > Scraping: {event_url}")
-        
-        for attempt in range(max_retries):
-            try:
-                if attempt > 0:
-                    delay = 2 ** attempt
-                    print(f"  ! Retry {attempt + 1}/{max_retries}, waiting {delay}s...")
-                    time.sleep(delay)
-                
-                response = requests.get(event_url, headers=self.HEADERS, timeout=20)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                parser = EventParser(soup, event_url)
-                event_data = parser.parse()
 
-                if event_data:
-                    print(f"  [OK] Extracted: {event_data['date']} / {event_data['year']} - {event_data['title'][:50]}...")
+        # Revalidate a page seen on an earlier run instead of re-downloading it
+        cached = self._load_cached(event_url)
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
 
-                time.sleep(random.uniform(4, 6))  # Random 4-6s delay
-                return event_data
+        try:
+            self.rate_limiter.acquire()
+            with self.session.get(event_url, headers=headers, timeout=20, stream=True) as response:
+                not_modified = response.status_code == 304 and cached is not None
+                if not not_modified:
+                    response.raise_for_status()
+                    content = self._read_capped(response)
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+        except requests.RequestException as e:
+            print(f"  ! Failed to scrape {event_url}: {e}")
+            return None
 
-            except requests.RequestException as e:
-                print(f"  ! Error on attempt {attempt + 1}: {e}")
-                if attempt == max_retries - 1:
-                    print(f"  ! Failed to scrape {event_url} after {max_retries} attempts.")
-                    return None
-        return None
+        if not_modified:
+            print("  = Not modified since the last run, using the cached result")
+            event_data = cached['event']
+        else:
+            soup = BeautifulSoup(content, 'lxml', parse_only=EVENT_PAGE_STRAINER)
+            if not soup.find('h1', class_='entry-title'):
+                # Title outside an <article> (unusual theme markup), parse it all
+                soup = BeautifulSoup(content, 'lxml')
+            parser = EventParser(soup, event_url)
+            event_data = parser.parse()
+            self._store_cached(event_url, etag, last_modified, event_data)
+
+        if event_data:
+            print(f"  [OK] Extracted: {event_data['date']} / {event_data['year']} - {event_data['title'][:50]}...")
+
+        return event_data
 
     def run(self, limit: Optional[int] = None, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict]:
         """
@@ -389,18 +560,22 @@ class HistoryScraper:
 
         new_events = []
         failed_scrapes = 0
-        
-        for i, url in enumerate(new_urls, 1):
-            print(f"\n[{i}/{len(new_urls)}] Processing URL...")
+
+        def scrape(url: str) -> Optional[Dict]:
             try:
-                details = self.scrape_event_details(url)
+                return self.scrape_event_details(url)
+            except Exception as e:
+                print(f"  ! Unexpected error processing {url}: {e}")
+                return None
+
+        # Results come back in URL order, so the saved file is ordered as before
+        with ThreadPoolExecutor(max_workers=self.SCRAPE_WORKERS) as executor:
+            for i, details in enumerate(executor.map(scrape, new_urls), 1):
+                print(f"[{i}/{len(new_urls)}] Processed")
                 if details:
                     new_events.append(details)
                 else:
                     failed_scrapes += 1
-            except Exception as e:
-                failed_scrapes += 1
-                print(f"  ! Unexpected error processing {url}: {e}")
 
         print("\n=== Scraping Summary ===")
         print(f"Successfully scraped: {len(new_events)}")
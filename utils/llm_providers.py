@@ -5,7 +5,7 @@ Supports multiple LLM providers with a unified interface
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from flask import current_app
 
@@ -25,6 +25,13 @@ class BaseLLMProvider(ABC):
     def __init__(self):
         self.timeout = 30
         self.max_retries = 3
+        self.fast_model = None  # Cheaper/faster model for routine generation, if any
+
+    def _select_model(self, **kwargs) -> str:
+        """Pick the fast model when requested and available, else the default"""
+        if kwargs.get("fast") and self.fast_model:
+            return self.fast_model
+        return self.model
 
     @abstractmethod
     def chat_completion(self, messages: List[Dict], **kwargs) -> Dict:
@@ -43,6 +50,32 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    def chat_completion_stream(self, messages: List[Dict], **kwargs) -> Iterator[str]:
+        """
+        Create a chat completion and yield the response text as it arrives
+
+        Providers without native streaming yield the whole response as a
+        single chunk, so callers can treat every provider the same way.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            **kwargs: Provider-specific options
+
+        Yields:
+            str: Response text chunks
+
+        Raises:
+            LLMError: If API request fails
+        """
+        import json
+
+        result = self.chat_completion(messages, **kwargs)
+        response_format = kwargs.get("response_format")
+        if response_format and response_format.get("type") == "json_object":
+            yield json.dumps(result, ensure_ascii=False)
+        else:
+            yield result.get("content", "")
+
     @abstractmethod
     def test_connection(self) -> bool:
         """
@@ -88,6 +121,42 @@ class BaseLLMProvider(ABC):
         """Check if provider is properly configured"""
         pass
 
+    @property
+    def supports_batch(self) -> bool:
+        """Whether the provider offers an asynchronous batch API"""
+        return False
+
+    def submit_batch(self, requests: List[Tuple[str, List[Dict]]], **kwargs) -> str:
+        """
+        Submit many chat requests as one asynchronous batch
+
+        Args:
+            requests: (custom_id, messages) pairs
+            **kwargs: Provider-specific options applied to every request
+
+        Returns:
+            Provider batch ID
+
+        Raises:
+            LLMError: If the provider has no batch API or submission fails
+        """
+        raise LLMError(f"{self.provider_name} does not support batch requests")
+
+    def get_batch_results(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """
+        Get results of a submitted batch
+
+        Args:
+            batch_id: Provider batch ID
+
+        Returns:
+            Dict of custom_id -> response text, or None while still processing
+
+        Raises:
+            LLMError: If the provider has no batch API or retrieval fails
+        """
+        raise LLMError(f"{self.provider_name} does not support batch requests")
+
 
 class MoonshotProvider(BaseLLMProvider):
     """Moonshot AI (Kimi K2.5) provider using OpenAI client"""
@@ -97,10 +166,22 @@ class MoonshotProvider(BaseLLMProvider):
         self.api_key = current_app.config.get("MOONSHOT_API_KEY")
         self.base_url = current_app.config.get("MOONSHOT_API_URL", "https://api.moonshot.ai/v1")
         self.model = "kimi-k2.5"
+        self._client = None
 
         if not self.api_key:
             logger.warning("MOONSHOT_API_KEY not configured")
 
+    def _get_client(self):
+        """Get the OpenAI client, created once so its connection pool is reused"""
+        if self._client is None:
+            from openai import OpenAI
+
+            self._client = OpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+            )
+        return self._client
+
     @property
     def provider_name(self) -> str:
         return "Moonshot (Kimi K2)"
@@ -115,16 +196,13 @@ class MoonshotProvider(BaseLLMProvider):
             raise LLMError("Moonshot provider not configured")
 
         try:
-            from openai import OpenAI
+            client = self._get_client()
 
-            client = OpenAI(
-                api_key=self.api_key,
-                base_url=self.base_url,
-            )
+            model = self._select_model(**kwargs)
 
             # Set defaults with option to override
             params = {
-                "model": self.model,
+                "model": model,
                 "messages": messages,
                 "temperature": 1,  # Kimi K2.5 only allows temperature=1
                 "max_tokens": kwargs.get("max_tokens", 2000),
@@ -135,7 +213,7 @@ class MoonshotProvider(BaseLLMProvider):
             if response_format:
                 params["response_format"] = response_format
 
-            logger.info(f"Making Moonshot API request with model {self.model}")
+            logger.info(f"Making Moonshot API request with model {model}")
             completion = client.chat.completions.create(**params)
 
             # Extract content
@@ -155,6 +233,38 @@ class MoonshotProvider(BaseLLMProvider):
             logger.error(error_msg)
             raise LLMError(error_msg)
 
+    def chat_completion_stream(self, messages: List[Dict], **kwargs) -> Iterator[str]:
+        """Stream chat completion tokens from Moonshot"""
+        if not self.is_configured:
+            raise LLMError("Moonshot provider not configured")
+
+        try:
+            client = self._get_client()
+
+            model = self._select_model(**kwargs)
+            params = {
+                "model": model,
+                "messages": messages,
+                "temperature": 1,  # Kimi K2.5 only allows temperature=1
+                "max_tokens": kwargs.get("max_tokens", 2000),
+                "stream": True,
+            }
+
+            response_format = kwargs.get("response_format")
+            if response_format:
+                params["response_format"] = response_format
+
+            logger.info(f"Making streaming Moonshot API request with model {model}")
+            for chunk in client.chat.completions.create(**params):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            logger.info("Moonshot streaming request successful")
+
+        except Exception as e:
+            error_msg = f"Moonshot API error: {e}"
+            logger.error(error_msg)
+            raise LLMError(error_msg)
+
     def test_connection(self) -> bool:
         """Test Moonshot API connection"""
         try:
@@ -209,10 +319,19 @@ class DeepSeekProvider(BaseLLMProvider):
             "DEEPSEEK_API_URL", "https://api.deepseek.com/v1/chat/completions"
         )
         self.model = "deepseek-chat"
+        self._session = None
 
         if not self.api_key:
             logger.warning("DEEPSEEK_API_KEY not configured")
 
+    def _get_session(self):
+        """Get the HTTP session, created once so its keep-alive connections are reused"""
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+        return self._session
+
     @property
     def provider_name(self) -> str:
         return "DeepSeek"
@@ -227,7 +346,6 @@ class DeepSeekProvider(BaseLLMProvider):
             raise LLMError("DeepSeek provider not configured")
 
         try:
-            import requests
             import json
 
             headers = {
@@ -235,8 +353,9 @@ class DeepSeekProvider(BaseLLMProvider):
                 "Content-Type": "application/json",
             }
 
+            model = self._select_model(**kwargs)
             payload = {
-                "model": self.model,
+                "model": model,
                 "messages": messages,
                 "temperature": kwargs.get("temperature", 0.5),
                 "max_tokens": kwargs.get("max_tokens", 2000),
@@ -247,8 +366,8 @@ class DeepSeekProvider(BaseLLMProvider):
             if response_format:
                 payload["response_format"] = response_format
 
-            logger.info(f"Making DeepSeek API request with model {self.model}")
-            response = requests.post(
+            logger.info(f"Making DeepSeek API request with model {model}")
+            response = self._get_session().post(
                 self.api_url, headers=headers, json=payload, timeout=self.timeout
             )
 
@@ -312,10 +431,20 @@ class AnthropicProvider(BaseLLMProvider):
         super().__init__()
         self.api_key = current_app.config.get("ANTHROPIC_API_KEY")
         self.model = "claude-sonnet-4-6"
+        self.fast_model = "claude-haiku-4-5"
+        self._client = None
 
         if not self.api_key:
             logger.warning("ANTHROPIC_API_KEY not configured")
 
+    def _get_client(self):
+        """Get the Anthropic client, created once so its connection pool is reused"""
+        if self._client is None:
+            import anthropic
+
+            self._client = anthropic.Anthropic(api_key=self.api_key)
+        return self._client
+
     @property
     def provider_name(self) -> str:
         return "Anthropic (Claude Sonnet 4.6)"
@@ -324,41 +453,50 @@ class AnthropicProvider(BaseLLMProvider):
     def is_configured(self) -> bool:
         return bool(self.api_key)
 
+    @property
+    def supports_batch(self) -> bool:
+        return True
+
+    def _build_params(self, messages: List[Dict], **kwargs) -> Dict:
+        """Build Messages API parameters from OpenAI-style chat messages"""
+        # Separate system message from user messages (Anthropic API requirement)
+        system_msg = ""
+        user_messages = []
+        for msg in messages:
+            if msg["role"] == "system":
+                system_msg = msg["content"]
+            else:
+                user_messages.append(msg)
+
+        params = {
+            "model": self._select_model(**kwargs),
+            "max_tokens": kwargs.get("max_tokens", 2000),
+            "messages": user_messages,
+        }
+
+        if system_msg:
+            params["system"] = system_msg
+
+        # Temperature
+        temperature = kwargs.get("temperature", 0.3)
+        if temperature is not None:
+            params["temperature"] = temperature
+
+        return params
+
     def chat_completion(self, messages: List[Dict], **kwargs) -> Dict:
         """Create chat completion using Anthropic API"""
         if not self.is_configured:
             raise LLMError("Anthropic provider not configured")
 
         try:
-            import anthropic
             import json
 
-            client = anthropic.Anthropic(api_key=self.api_key)
+            client = self._get_client()
 
-            # Separate system message from user messages (Anthropic API requirement)
-            system_msg = ""
-            user_messages = []
-            for msg in messages:
-                if msg["role"] == "system":
-                    system_msg = msg["content"]
-                else:
-                    user_messages.append(msg)
+            params = self._build_params(messages, **kwargs)
 
-            params = {
-                "model": self.model,
-                "max_tokens": kwargs.get("max_tokens", 2000),
-                "messages": user_messages,
-            }
-
-            if system_msg:
-                params["system"] = system_msg
-
-            # Temperature
-            temperature = kwargs.get("temperature", 0.3)
-            if temperature is not None:
-                params["temperature"] = temperature
-
-            logger.info(f"Making Anthropic API request with model {self.model}")
+            logger.info(f"Making Anthropic API request with model {params['model']}")
             response = client.messages.create(**params)
 
             # Extract content
@@ -385,6 +523,72 @@ class AnthropicProvider(BaseLLMProvider):
             logger.error(error_msg)
             raise LLMError(error_msg)
 
+    def chat_completion_stream(self, messages: List[Dict], **kwargs) -> Iterator[str]:
+        """Stream chat completion tokens from Anthropic"""
+        if not self.is_configured:
+            raise LLMError("Anthropic provider not configured")
+
+        try:
+            client = self._get_client()
+
+            params = self._build_params(messages, **kwargs)
+
+            logger.info(f"Making streaming Anthropic API request with model {params['model']}")
+            with client.messages.stream(**params) as stream:
+                for text in stream.text_stream:
+                    yield text
+            logger.info("Anthropic streaming request successful")
+
+        except Exception as e:
+            error_msg = f"Anthropic API error: {e}"
+            logger.error(error_msg)
+            raise LLMError(error_msg)
+
+    def submit_batch(self, requests: List[Tuple[str, List[Dict]]], **kwargs) -> str:
+        """Submit chat requests to the Message Batches API (async, half price)"""
+        if not self.is_configured:
+            raise LLMError("Anthropic provider not configured")
+
+        try:
+            client = self._get_client()
+            batch = client.messages.batches.create(
+                requests=[
+                    {"custom_id": custom_id, "params": self._build_params(messages, **kwargs)}
+                    for custom_id, messages in requests
+                ]
+            )
+            logger.info(f"Submitted Anthropic batch {batch.id} with {len(requests)} requests")
+            return batch.id
+
+        except Exception as e:
+            error_msg = f"Anthropic batch submit error: {e}"
+            logger.error(error_msg)
+            raise LLMError(error_msg)
+
+    def get_batch_results(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """Get response text per custom_id, or None while the batch is still processing"""
+        if not self.is_configured:
+            raise LLMError("Anthropic provider not configured")
+
+        try:
+            client = self._get_client()
+            batch = client.messages.batches.retrieve(batch_id)
+            if batch.processing_status != "ended":
+                return None
+
+            results = {}
+            for entry in client.messages.batches.results(batch_id):
+                if entry.result.type == "succeeded":
+                    results[entry.custom_id] = entry.result.message.content[0].text
+                else:
+                    logger.warning(f"Batch request {entry.custom_id} {entry.result.type}")
+            return results
+
+        except Exception as e:
+            error_msg = f"Anthropic batch results error: {e}"
+            logger.error(error_msg)
+            raise LLMError(error_msg)
+
     def test_connection(self) -> bool:
         """Test Anthropic API connection"""
         try:
@@ -475,6 +679,42 @@ class ProviderManager:
         """Get list of available provider names"""
         return list(self.providers.keys())
 
+    def get_batch_provider(self, use_case: str = "historical") -> Optional[str]:
+        """Get name of the highest-priority configured provider with a batch API"""
+        for provider_name in self._get_provider_order(use_case):
+            provider = self.providers.get(provider_name)
+            if provider and provider.supports_batch:
+                return provider_name
+        return None
+
+    def primary_has_fast_model(self, use_case: str = "historical") -> bool:
+        """Whether the highest-priority configured provider has a separate fast model"""
+        for provider_name in self._get_provider_order(use_case):
+            provider = self.providers.get(provider_name)
+            if provider:
+                return bool(provider.fast_model)
+        return False
+
+    def _get_provider_order(self, use_case: str, skip_providers: int = 0) -> List[str]:
+        """Get provider names in priority order for a use case"""
+        # Define provider priority by use case
+        # Historical: Claude (accuracy) > Kimi > DeepSeek
+        # Everything else: Kimi (cost) > DeepSeek > Claude
+        if use_case == "historical":
+            provider_order = ["anthropic", "moonshot", "deepseek"]
+        elif use_case == "news":
+            provider_order = ["moonshot", "deepseek", "anthropic"]
+        else:
+            provider_order = ["moonshot", "deepseek", "anthropic"]
+
+        # Skip first N configured providers (used for retry after low-confidence),
+        # so the retry reaches a different provider even when one is not configured
+        if skip_providers > 0:
+            provider_order = [name for name in provider_order if name in self.providers][skip_providers:]
+            logger.info(f"Skipping first {skip_providers} providers, trying: {provider_order}")
+
+        return provider_order
+
     def chat_completion_with_fallback(
         self, messages: List[Dict], use_case: str = "historical", skip_providers: int = 0, **kwargs
     ) -> Dict:
@@ -490,20 +730,7 @@ class ProviderManager:
         Returns:
             Dict with response or fallback content
         """
-        # Define provider priority by use case
-        # Historical: Claude (accuracy) > Kimi > DeepSeek
-        # Everything else: Kimi (cost) > DeepSeek > Claude
-        if use_case == "historical":
-            provider_order = ["anthropic", "moonshot", "deepseek"]
-        elif use_case == "news":
-            provider_order = ["moonshot", "deepseek", "anthropic"]
-        else:
-            provider_order = ["moonshot", "deepseek", "anthropic"]
-
-        # Skip first N providers (used for retry after low-confidence)
-        if skip_providers > 0:
-            provider_order = provider_order[skip_providers:]
-            logger.info(f"Skipping first {skip_providers} providers, trying: {provider_order}")
+        provider_order = self._get_provider_order(use_case, skip_providers)
 
         last_error = None
 
@@ -527,15 +754,62 @@ class ProviderManager:
         # All providers failed, use fallback
         logger.error(f"All providers failed, using fallback content. Last error: {last_error}")
 
-        # Get fallback from first available provider
+        # Get fallback from first available provider, marked so callers can tell
+        # it apart from generated content
         for provider_name in provider_order:
             provider = self.providers.get(provider_name)
             if provider:
-                return provider.get_fallback_content(use_case)
+                return {**provider.get_fallback_content(use_case), "fallback": True}
 
         # Absolute fallback if no providers available
         return {"error": "No LLM providers available", "fallback": True}
 
+    def chat_completion_stream_with_fallback(
+        self, messages: List[Dict], use_case: str = "historical", skip_providers: int = 0, **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream chat completion with fallback logic
+
+        Falls back to the next provider only while nothing has been yielded yet;
+        once tokens have reached the caller a failure is raised instead.
+
+        Args:
+            messages: Chat messages
+            use_case: 'historical' or 'news'
+            skip_providers: Number of providers to skip from the start (for retries)
+            **kwargs: Additional parameters
+
+        Yields:
+            str: Response text chunks
+
+        Raises:
+            LLMError: If all providers fail or a stream breaks mid-response
+        """
+        last_error = None
+
+        for provider_name in self._get_provider_order(use_case, skip_providers):
+            provider = self.providers.get(provider_name)
+            if not provider:
+                continue
+
+            started = False
+            try:
+                logger.info(f"Trying streaming provider: {provider.provider_name}")
+                for chunk in provider.chat_completion_stream(messages, **kwargs):
+                    started = True
+                    yield chunk
+                logger.info(f"Stream complete with provider: {provider.provider_name}")
+                return
+
+            except LLMError as e:
+                if started:
+                    raise
+                logger.warning(f"Provider {provider.provider_name} failed: {e}")
+                last_error = e
+                continue
+
+        raise LLMError(f"All providers failed to stream. Last error: {last_error}")
+
     def test_all_providers(self) -> Dict[str, bool]:
         """Test all configured providers"""
         results = {}
@@ -3,13 +3,13 @@ LLM Service Coordinator for AI Content Generation
 Manages multiple LLM providers with fallback logic
 """
 
+import functools
+import json
 import logging
 import os
-from datetime import datetime
-from typing import Dict, List
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Tuple
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -160,25 +160,16 @@ Respond in JSON format:
             logger.error(error_msg)
             raise LLMError(error_msg)
 
-    def generate_historical_event(self, skip_first: bool = False) -> Dict:
-        """
-        Generate historical mountaineering event for today's date using improved prompt template
-
-        Returns:
-            Dict with event data matching HistoricalEvent model
-
-        Raises:
-            LLMError: If API request fails or returns invalid data
-        """
-        # Get today's date in the required format
-        today = datetime.now()
-        current_date = format_date_standard(today)
+    def _build_historical_messages(self, target_date: Optional[date] = None) -> List[Dict]:
+        """Build chat messages for the historical event prompt (today by default)"""
+        # Get the date in the required format
+        current_date = format_date_standard(target_date or datetime.now())
 
         # Load and format the prompt template
         prompt_template = self._load_prompt_template()
         prompt = prompt_template.replace("[current_date]", current_date)
 
-        messages = [
+        return [
             {
                 "role": "system",
                 "content": "You are a knowledgeable mountaineering historian. Always respond with valid JSON containing historical mountaineering events.",
@@ -186,42 +177,74 @@ Respond in JSON format:
             {"role": "user", "content": prompt},
         ]
 
+    def _validate_historical_event(self, result: Dict, strict: bool = False) -> Dict:
+        """Validate and normalize generated historical event data
+
+        Missing fields are replaced by fallback content, or raise LLMError when strict.
+        """
+        # Validate required fields
+        required_fields = ["year", "title", "description", "location", "people", "category"]
+        for field in required_fields:
+            if field not in result:
+                if strict:
+                    raise LLMError(f"Missing required field: {field}")
+                logger.warning(f"Missing required field: {field}, using fallback")
+                return {**self.get_fallback_content("historical"), "fallback": True}
+
+        # Handle optional fields
+        result.setdefault("confidence", "medium")
+        result.setdefault("methodology", None)
+
+        # Validate category
+        valid_categories = ["first_ascent", "tragedy", "discovery", "achievement", "expedition"]
+        if result["category"] not in valid_categories:
+            logger.warning(
+                f"Invalid category '{result['category']}', defaulting to 'achievement'"
+            )
+            result["category"] = "achievement"
+
+        # Ensure people is a list
+        if not isinstance(result["people"], list):
+            if isinstance(result["people"], str):
+                result["people"] = [name.strip() for name in result["people"].split(",")]
+            else:
+                result["people"] = []
+
+        return result
+
+    def generate_historical_event(
+        self, skip_first: bool = False, fast: bool = False, target_date: Optional[date] = None
+    ) -> Dict:
+        """
+        Generate historical mountaineering event for a date using improved prompt template
+
+        Args:
+            skip_first: Skip the first provider in priority order (retry path)
+            fast: Use each provider's cheaper/faster model where one exists
+            target_date: Date to find an event for. If None, uses today.
+
+        Returns:
+            Dict with event data matching HistoricalEvent model
+
+        Raises:
+            LLMError: If API request fails or returns invalid data
+        """
+        messages = self._build_historical_messages(target_date)
+
         try:
-            logger.info(f"Generating historical event for date: {current_date}")
+            logger.info(
+                f"Generating historical event for date: {format_date_standard(target_date or datetime.now())}"
+            )
             result = self._make_api_request(
                 messages, use_case="historical", temperature=0.3,
-                skip_providers=1 if skip_first else 0
+                skip_providers=1 if skip_first else 0, fast=fast
             )
 
-            # Handle fallback content
+            # Handle fallback content (kept marked, so callers can skip it)
             if "fallback" in result:
-                return self.get_fallback_content("historical")
-
-            # Validate required fields
-            required_fields = ["year", "title", "description", "location", "people", "category"]
-            for field in required_fields:
-                if field not in result:
-                    logger.warning(f"Missing required field: {field}, using fallback")
-                    return self.get_fallback_content("historical")
-
-            # Handle optional fields
-            result.setdefault("confidence", "medium")
-            result.setdefault("methodology", None)
-
-            # Validate category
-            valid_categories = ["first_ascent", "tragedy", "discovery", "achievement", "expedition"]
-            if result["category"] not in valid_categories:
-                logger.warning(
-                    f"Invalid category '{result['category']}', defaulting to 'achievement'"
-                )
-                result["category"] = "achievement"
-
-            # Ensure people is a list
-            if not isinstance(result["people"], list):
-                if isinstance(result["people"], str):
-                    result["people"] = [name.strip() for name in result["people"].split(",")]
-                else:
-                    result["people"] = []
+                return {**self.get_fallback_content("historical"), "fallback": True}
+
+            result = self._validate_historical_event(result)
 
             logger.info(f"Successfully generated historical event: {result['title']}")
             return result
@@ -233,6 +256,145 @@ Respond in JSON format:
             logger.error(error_msg)
             raise LLMError(error_msg)
 
+    def generate_historical_event_stream(self, skip_first: bool = False) -> Iterator[str]:
+        """
+        Stream historical event generation token by token
+
+        The concatenated chunks form the JSON document that
+        parse_historical_event() turns into event data.
+
+        Yields:
+            str: Response text chunks as they arrive from the provider
+
+        Raises:
+            LLMError: If no provider can stream a response
+        """
+        if not self.provider_manager:
+            raise LLMError("Provider manager not initialized")
+
+        messages = self._build_historical_messages()
+
+        try:
+            logger.info(f"Streaming historical event for date: {format_date_standard(datetime.now())}")
+            yield from self.provider_manager.chat_completion_stream_with_fallback(
+                messages=messages,
+                use_case="historical",
+                skip_providers=1 if skip_first else 0,
+                temperature=0.3,
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            error_msg = f"Provider stream failed: {e}"
+            logger.error(error_msg)
+            raise LLMError(error_msg)
+
+    def parse_historical_event(self, content: str, strict: bool = False) -> Dict:
+        """
+        Parse streamed or batched historical event JSON into validated event data
+
+        Args:
+            content: Full response text collected from the provider
+            strict: Raise LLMError on missing fields instead of using fallback content
+
+        Returns:
+            Dict with event data matching HistoricalEvent model
+
+        Raises:
+            LLMError: If the response is not valid JSON (or misses fields when strict)
+        """
+        # Claude may wrap JSON in markdown code blocks
+        cleaned = content.strip()
+        if cleaned.startswith("```"):
+            lines = [line for line in cleaned.split("\n") if not line.strip().startswith("```")]
+            cleaned = "\n".join(lines)
+
+        try:
+            result = json.loads(cleaned)
+        except ValueError as e:
+            raise LLMError(f"Invalid JSON in response: {e}")
+
+        if not isinstance(result, dict):
+            raise LLMError(f"Expected JSON object, got {type(result).__name__}")
+
+        return self._validate_historical_event(result, strict=strict)
+
+    def submit_historical_batch(self, dates: List[date], fast: bool = False) -> Tuple[str, str]:
+        """
+        Submit historical event generation for many dates as one provider batch
+
+        Args:
+            dates: Dates to generate events for; results are keyed 'MM-DD'
+            fast: Use the provider's cheaper/faster model where one exists
+
+        Returns:
+            Tuple of (provider name, provider batch ID)
+
+        Raises:
+            LLMError: If no configured provider supports batches or submission fails
+        """
+        if not self.provider_manager:
+            raise LLMError("Provider manager not initialized")
+
+        provider_name = self.provider_manager.get_batch_provider("historical")
+        if not provider_name:
+            raise LLMError("No configured provider supports batch requests")
+
+        requests = [
+            (f"{d.month:02d}-{d.day:02d}", self._build_historical_messages(d)) for d in dates
+        ]
+
+        try:
+            provider = self.provider_manager.get_provider(provider_name)
+            batch_id = provider.submit_batch(requests, temperature=0.3, fast=fast)
+            logger.info(f"Submitted historical batch {batch_id} for {len(dates)} dates")
+            return provider_name, batch_id
+        except Exception as e:
+            error_msg = f"Batch submission failed: {e}"
+            logger.error(error_msg)
+            raise LLMError(error_msg)
+
+    def has_fast_model(self, use_case: str = "historical") -> bool:
+        """Whether fast=True selects a different model on the first provider for a use case"""
+        return bool(self.provider_manager and self.provider_manager.primary_has_fast_model(use_case))
+
+    def get_historical_batch_results(
+        self, provider_name: str, batch_id: str
+    ) -> Optional[Dict[str, Dict]]:
+        """
+        Collect validated event data from a finished historical batch
+
+        Args:
+            provider_name: Provider the batch was submitted to
+            batch_id: Provider batch ID
+
+        Returns:
+            Dict of 'MM-DD' -> event data, or None while the batch is still processing
+
+        Raises:
+            LLMError: If the provider is unavailable or retrieval fails
+        """
+        provider = self.provider_manager.get_provider(provider_name) if self.provider_manager else None
+        if not provider:
+            raise LLMError(f"Provider {provider_name} not available")
+
+        try:
+            raw_results = provider.get_batch_results(batch_id)
+        except Exception as e:
+            error_msg = f"Batch retrieval failed: {e}"
+            logger.error(error_msg)
+            raise LLMError(error_msg)
+
+        if raw_results is None:
+            return None
+
+        results = {}
+        for custom_id, content in raw_results.items():
+            try:
+                results[custom_id] = self.parse_historical_event(content, strict=True)
+            except LLMError as e:
+                logger.warning(f"Skipping batch result {custom_id}: {e}")
+        return results
+
     def generate_news_summary(self, articles: List[Dict]) -> List[Dict]:
         """
         Generate news summary from provided articles (Future Phase 3B)
@@ -402,10 +564,16 @@ Assign relevance_score from 0.0 to 1.0 based on importance to mountaineering com
             return False
 
 
+@functools.lru_cache(maxsize=1)
+def get_llm_service() -> LLMService:
+    """Get the process-wide LLMService, so provider HTTP clients and their connection pools are shared"""
+    return LLMService()
+
+
 # Convenience functions for easy usage
 def generate_todays_historical_event() -> Dict:
     """Generate historical event for today's date"""
-    service = LLMService()
+    service = get_llm_service()
     try:
         return service.generate_historical_event()
     except LLMError as e:
@@ -415,7 +583,7 @@ def generate_todays_historical_event() -> Dict:
 
 def generate_news_from_articles(articles: List[Dict]) -> List[Dict]:
     """Generate news summary from articles (Future Phase 3B)"""
-    service = LLMService()
+    service = get_llm_service()
     try:
         return service.generate_news_summary(articles)
     except LLMError as e:
@@ -425,5 +593,5 @@ def generate_news_from_articles(articles: List[Dict]) -> List[Dict]:
 
 def test_llm_service() -> bool:
     """Test if LLM service is working"""
-    service = LLMService()
+    service = get_llm_service()
     return service.test_connection()
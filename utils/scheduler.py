@@ -1,12 +1,15 @@
 """
 Daily task scheduler for PD Triglav web app
-Handles automated content generation at 6 AM daily
+Handles automated content generation at 6 AM daily and keeps the news cache warm
 """
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from flask import current_app
+from datetime import datetime
 import atexit
+import functools
 
 
 def fetch_daily_news_task():
@@ -42,6 +45,23 @@ def generate_historical_event_task():
         current_app.logger.error(f"Error in scheduled historical event generation: {e}")
 
 
+def poll_generation_jobs_task():
+    """Scheduled task to store results of finished LLM batch generation jobs"""
+    try:
+        from models.content import GenerationJob
+
+        if not GenerationJob.get_pending_jobs():
+            return
+
+        current_app.logger.info("Polling pending generation jobs...")
+        from utils.content_generation import HistoricalEventService
+
+        created = HistoricalEventService().process_pending_generation_jobs()
+        current_app.logger.info(f"Generation jobs created {created} historical events")
+    except Exception as e:
+        current_app.logger.error(f"Error polling generation jobs: {e}")
+
+
 def cleanup_old_data_task():
     """Weekly cleanup task to remove old cached data"""
     try:
@@ -54,6 +74,17 @@ def cleanup_old_data_task():
         current_app.logger.error(f"Error in scheduled cleanup: {e}")
 
 
+def _with_app_context(app, task):
+    """Wrap a task so it runs inside the app context (scheduler threads have none)"""
+
+    @functools.wraps(task)
+    def run():
+        with app.app_context():
+            task()
+
+    return run
+
+
 def init_scheduler(app):
     """Initialize and start the background scheduler"""
     if app.config.get("TESTING"):
@@ -62,28 +93,41 @@ def init_scheduler(app):
 
     scheduler = BackgroundScheduler()
 
-    # Daily tasks at 6:00 AM
+    # Refresh news every 30 minutes (matching the RSS feed cache TTL), starting
+    # right away so a freshly started machine has news before the first visitor.
+    # Each worker runs this job; a run within 25 minutes of the last refresh by
+    # any worker returns the cached news (see fetch_and_cache_news)
     scheduler.add_job(
-        func=fetch_daily_news_task,
-        trigger=CronTrigger(hour=6, minute=0),
+        func=_with_app_context(app, fetch_daily_news_task),
+        trigger=IntervalTrigger(minutes=30),
+        next_run_time=datetime.now(),
         id="fetch_daily_news",
         name="Fetch daily mountaineering news",
         replace_existing=True,
-        misfire_grace_time=43200,  # 12 hours - allows job to run when machine wakes up
     )
 
+    # Daily task at 6:05 AM
     scheduler.add_job(
-        func=generate_historical_event_task,
-        trigger=CronTrigger(hour=6, minute=5),  # 5 minutes after news
+        func=_with_app_context(app, generate_historical_event_task),
+        trigger=CronTrigger(hour=6, minute=5),
         id="generate_historical_event",
         name="Generate today's historical event",
         replace_existing=True,
         misfire_grace_time=43200,  # 12 hours - allows job to run when machine wakes up
     )
 
+    # Poll batch generation jobs every 30 minutes (batches finish within 24h)
+    scheduler.add_job(
+        func=_with_app_context(app, poll_generation_jobs_task),
+        trigger=IntervalTrigger(minutes=30),
+        id="poll_generation_jobs",
+        name="Poll batch generation jobs",
+        replace_existing=True,
+    )
+
     # Weekly cleanup on Sundays at 2:00 AM
     scheduler.add_job(
-        func=cleanup_old_data_task,
+        func=_with_app_context(app, cleanup_old_data_task),
         trigger=CronTrigger(day_of_week=6, hour=2, minute=0),  # Sunday at 2 AM
         id="cleanup_old_data",
         name="Cleanup old cached data",
@@ -110,6 +154,7 @@ def run_task_now(task_name):
     tasks = {
         "news": fetch_daily_news_task,
         "historical": generate_historical_event_task,
+        "generation_jobs": poll_generation_jobs_task,
         "cleanup": cleanup_old_data_task,
     }
 